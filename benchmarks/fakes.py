@@ -0,0 +1,330 @@
+"""Local stand-ins for the external services used by the pipeline benchmark.
+
+This module provides offline replacements for YouTube, Gemini and the remote
+transcription API, plus the synthetic audio fixture they serve, so benchmark
+runs measure this project's code rather than network conditions.
+
+Classes:
+    FakeVideoService: Serves a local audio fixture as a video.
+    FakeGeminiModel: Answers generate_content() with a canned summary.
+    FakeCachedContentApi: Keeps cached content in memory, like Gemini's cache.
+    FakeTranscriptionServer: A local HTTP server speaking the API protocol.
+
+Functions:
+    make_fixture_audio: Synthesizes an audio fixture with FFmpeg.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import shutil
+import subprocess
+import threading
+import time
+from datetime import timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Self
+
+from content_summarizer.data.data_models import Transcript
+from content_summarizer.services.context_cache import (
+    BaseCachedContentApi,
+    ContextCacheError,
+)
+from content_summarizer.services.video_service_interface import BaseVideoService
+
+FIXTURE_TEXT: str = (
+    "This is a synthetic recording used to benchmark the content summarizer. "
+    "It talks about caching, transcription speed and summary quality, "
+    "and it repeats a few sentences so every run decodes the same speech. "
+)
+
+
+def _ffmpeg_has_filter(name: str) -> bool:
+    completed = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-filters"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return any(line.split()[1:2] == [name] for line in completed.stdout.splitlines())
+
+
+def make_fixture_audio(output_path: Path, duration: float) -> str:
+    """Synthesize an audio fixture with FFmpeg.
+
+    Speech is synthesized with FFmpeg's 'flite' source when FFmpeg was built
+    with it. Otherwise the fixture is an amplitude-modulated tone, which keeps
+    decode cost realistic but may transcribe to empty text.
+
+    Args:
+        output_path: The destination MP3 path.
+        duration: The fixture length in seconds.
+
+    Returns:
+        The kind of fixture generated ('speech' or 'tone').
+
+    Raises:
+        subprocess.CalledProcessError: If FFmpeg fails.
+
+    """
+    if _ffmpeg_has_filter("flite"):
+        text: str = FIXTURE_TEXT * max(1, int(duration // 10))
+        source: str = f"flite=text='{text}'"
+        kind: str = "speech"
+    else:
+        source = "sine=frequency=220:sample_rate=16000,tremolo=f=3:d=0.9"
+        kind = "tone"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            source,
+            "-t",
+            str(duration),
+            "-ac",
+            "1",
+            "-b:a",
+            "64k",
+            str(output_path),
+        ],
+        check=True,
+    )
+    return kind
+
+
+class FakeVideoService(BaseVideoService):
+    """Serves a local audio fixture as if it were a YouTube video.
+
+    The video ID is taken from the URL, so distinct URLs get distinct cache
+    directories while sharing the same fixture.
+
+    Attributes:
+        _fixture_path: The audio file copied on download.
+        _video_id: The ID of the loaded video.
+
+    """
+
+    def __init__(self, fixture_path: Path) -> None:
+        """Initialize the FakeVideoService.
+
+        Args:
+            fixture_path: The audio file copied on download.
+
+        """
+        self._fixture_path = fixture_path
+        self._video_id: str | None = None
+
+    def load_from_url(self, source_url: str) -> Self:
+        """Load a fake video whose ID is the last path segment of the URL."""
+        self._video_id = source_url.rstrip("/").rsplit("/", 1)[-1]
+        return self
+
+    @property
+    def video_id(self) -> str:
+        """Get the ID of the video."""
+        assert self._video_id is not None, "load_from_url() was not called"
+        return self._video_id
+
+    @property
+    def title(self) -> str:
+        """Get the title of the video."""
+        return f"Benchmark {self.video_id}"
+
+    @property
+    def author(self) -> str:
+        """Get the author of the video."""
+        return "benchmark"
+
+    def audio_download(self, audio_file_path: Path) -> None:
+        """Copy the fixture to the cache, standing in for the download."""
+        audio_file_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self._fixture_path, audio_file_path)
+
+    def find_best_captions(
+        self, user_language: str, auto_captions: str = "off"
+    ) -> Transcript | None:
+        """Report no captions, so every run goes through transcription."""
+        return None
+
+
+class FakeGeminiModel:
+    """Answers count_tokens() and generate_content() like a Gemini model offline.
+
+    Attributes:
+        model_name: The full name of the model, as Gemini reports it.
+        _latency: Seconds to sleep per call, simulating the API round trip.
+        _cached_tokens: The tokens of the cached content every request is
+            prefixed with.
+
+    """
+
+    def __init__(self, latency: float = 0.0, cached_tokens: int = 0) -> None:
+        """Initialize the FakeGeminiModel.
+
+        Args:
+            latency: Seconds to sleep per call.
+            cached_tokens: The tokens of the cached content the model uses.
+
+        """
+        self.model_name: str = "models/fake-gemini"
+        self._latency = latency
+        self._cached_tokens = cached_tokens
+
+    @staticmethod
+    def _estimate_tokens(prompt: str | list[str]) -> int:
+        """Estimate the tokens of a prompt as one per four characters."""
+        if isinstance(prompt, str):
+            return len(prompt) // 4
+        return sum(len(part) for part in prompt) // 4
+
+    def count_tokens(self, prompt: str | list[str]) -> SimpleNamespace:
+        """Return the estimated token count of the prompt, without latency."""
+        return SimpleNamespace(total_tokens=self._estimate_tokens(prompt))
+
+    def generate_content(self, prompt: str | list[str]) -> SimpleNamespace:
+        """Return a canned summary with token counts estimated from the prompt."""
+        time.sleep(self._latency)
+        text: str = "# Summary\n\n- The benchmark fixture was summarized.\n"
+        return SimpleNamespace(
+            text=text,
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=self._estimate_tokens(prompt) + self._cached_tokens,
+                cached_content_token_count=self._cached_tokens,
+                candidates_token_count=len(text) // 4,
+            ),
+        )
+
+
+class FakeCachedContentApi(BaseCachedContentApi):
+    """Keeps cached content in memory, answering like Gemini's cache.
+
+    Attributes:
+        created: The contents of every cache created, by cache name.
+        _latency: Seconds to sleep per model call.
+
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize the FakeCachedContentApi.
+
+        Args:
+            latency: Seconds to sleep per call of the models it creates.
+
+        """
+        self.created: dict[str, list[str]] = {}
+        self._latency = latency
+
+    def create(
+        self, model_name: str, contents: list[str], ttl: timedelta
+    ) -> tuple[str, float]:
+        """Keep the contents under a new cache name."""
+        name: str = f"cachedContents/{len(self.created)}"
+        self.created[name] = contents
+        return name, time.time() + ttl.total_seconds()
+
+    def model_from_cache(self, cache_name: str) -> FakeGeminiModel:
+        """Create a fake model that counts the cached tokens in its usage."""
+        if cache_name not in self.created:
+            raise ContextCacheError(f"No cached content named {cache_name}")
+        cached_tokens: int = sum(len(part) for part in self.created[cache_name]) // 4
+        return FakeGeminiModel(self._latency, cached_tokens)
+
+
+class _TranscriptionHandler(BaseHTTPRequestHandler):
+    server: "FakeTranscriptionServer"
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def _send_json(self, status: HTTPStatus, payload: dict[str, object]) -> None:
+        body: bytes = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    def do_POST(self) -> None:
+        remaining: int = int(self.headers.get("Content-Length", "0"))
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 65536)))
+        time.sleep(self.server.latency)
+        sentences: list[str] = [s + "." for s in FIXTURE_TEXT.split(". ") if s]
+        self._send_json(
+            HTTPStatus.OK,
+            {
+                "transcription": " ".join(sentences),
+                "segments": {
+                    "version": 1,
+                    "start": [float(i * 4) for i in range(len(sentences))],
+                    "end": [float(i * 4 + 4) for i in range(len(sentences))],
+                    "text": [f" {s}" for s in sentences],
+                    "avg_logprob": [-0.2] * len(sentences),
+                    "no_speech_prob": [0.01] * len(sentences),
+                    "language": "en",
+                },
+            },
+        )
+
+
+class FakeTranscriptionServer(ThreadingHTTPServer):
+    """A local HTTP server speaking the transcription API protocol.
+
+    Lookups always miss, so every run uploads its audio, and uploads are
+    answered with a fixed transcript after a configurable delay.
+
+    Attributes:
+        latency: Seconds to sleep before answering an upload.
+
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Bind the server to a free port on the loopback interface.
+
+        Args:
+            latency: Seconds to sleep before answering an upload.
+
+        """
+        self.latency = latency
+        super().__init__(("127.0.0.1", 0), _TranscriptionHandler)
+
+    @property
+    def url(self) -> str:
+        """Get the URL of the '/transcribe' endpoint."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/transcribe"
+
+    def __enter__(self) -> Self:
+        """Start serving in a background thread."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop serving and release the socket."""
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,164 @@
+"""Benchmarks the import time of the CLI entry points against a budget.
+
+This script runs `python -X importtime` in fresh interpreters for each
+entry-point module, keeps the best of several runs, and fails if a module
+exceeds its time budget or pulls in one of the heavy SDKs that must only be
+loaded on the code path that needs them.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--scale FACTOR] [--json PATH]
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# Budgets in milliseconds of cumulative import time, measured on a laptop
+# class machine with roughly 5x headroom. Use --scale on slower CI runners.
+IMPORT_BUDGETS_MS: dict[str, float] = {
+    "content_summarizer.main": 100,
+    "content_summarizer.core": 200,
+}
+
+HEAVY_MODULES: list[str] = [
+    "google.generativeai",
+    "faster_whisper",
+    "pytubefix",
+    "rich",
+    "requests",
+    "dotenv",
+]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+@dataclass
+class ImportResult:
+    """The import measurement of a single module.
+
+    Attributes:
+        module: The measured module name.
+        cumulative_ms: The best cumulative import time across runs.
+        budget_ms: The allowed cumulative import time.
+        heavy_imports: Heavy modules that were imported as a side effect.
+
+    """
+
+    module: str
+    cumulative_ms: float
+    budget_ms: float
+    heavy_imports: list[str]
+
+    @property
+    def passed(self) -> bool:
+        """Whether the module is within budget and imports no heavy module."""
+        return self.cumulative_ms <= self.budget_ms and not self.heavy_imports
+
+
+def _measure_once(module: str) -> tuple[float, set[str]]:
+    """Import a module in a fresh interpreter and parse the importtime report.
+
+    Returns:
+        The cumulative import time in milliseconds and the imported modules.
+
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    cumulative_us: int = 0
+    imported: set[str] = set()
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        imported.add(match.group(4))
+        if match.group(4) == module:
+            cumulative_us = int(match.group(2))
+    return cumulative_us / 1000, imported
+
+
+def measure(module: str, budget_ms: float, runs: int) -> ImportResult:
+    """Measure the best-of-N cumulative import time of a module.
+
+    Args:
+        module: The module to import.
+        budget_ms: The allowed cumulative import time in milliseconds.
+        runs: How many fresh interpreters to measure.
+
+    Returns:
+        The measurement, including any heavy module imported as a side effect.
+
+    """
+    best_ms: float = float("inf")
+    imported: set[str] = set()
+    for _ in range(runs):
+        cumulative_ms, imported = _measure_once(module)
+        best_ms = min(best_ms, cumulative_ms)
+    heavy: list[str] = [
+        name
+        for name in HEAVY_MODULES
+        if any(m == name or m.startswith(f"{name}.") for m in imported)
+    ]
+    return ImportResult(module, round(best_ms, 2), budget_ms, heavy)
+
+
+def main() -> int:
+    """Run the import-time benchmark and report the results.
+
+    Returns:
+        The process exit code, non-zero if any module failed its budget.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per module.")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply every budget by this."
+    )
+    parser.add_argument("--json", type=Path, help="Write the results to a file.")
+    args = parser.parse_args()
+
+    results: list[ImportResult] = [
+        measure(module, budget_ms * args.scale, args.runs)
+        for module, budget_ms in IMPORT_BUDGETS_MS.items()
+    ]
+
+    for result in results:
+        status = "ok" if result.passed else "FAIL"
+        print(
+            f"{status:4} {result.module:30} "
+            f"{result.cumulative_ms:8.1f} ms (budget {result.budget_ms:.0f} ms)"
+        )
+        if result.heavy_imports:
+            print(f"     heavy imports: {', '.join(result.heavy_imports)}")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(r) for r in results], indent=4), encoding="utf-8"
+        )
+
+    return 0 if all(r.passed for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
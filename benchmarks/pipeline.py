@@ -0,0 +1,367 @@
+"""Benchmarks the end-to-end summarization pipeline against local fixtures.
+
+This script runs the pipeline in core.py over a synthetic audio fixture, with
+YouTube, Gemini and the transcription API replaced by the local fakes in
+fakes.py, for every combination of Whisper model, beam size and speed factor
+on the CPU. Each combination runs in a fresh interpreter, so model loading
+and peak memory are measured independently, and the results are written as
+JSON named after the current commit so runs can be compared across commits.
+
+Usage:
+    python benchmarks/pipeline.py [--whisper-models tiny base] [--beam-sizes 1 5]
+        [--speed-factors 1.25 2.0] [--videos N] [--modes local api]
+        [--output PATH]
+    python benchmarks/pipeline.py --compare BASELINE.json CANDIDATE.json
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+
+from fakes import (
+    FakeGeminiModel,
+    FakeTranscriptionServer,
+    FakeVideoService,
+    make_fixture_audio,
+)
+
+from content_summarizer.core import AppConfig, run_pipeline
+from content_summarizer.managers.cache_manager import CacheManager
+from content_summarizer.managers.config_manager import ConfigManager
+from content_summarizer.managers.path_manager import PathManager
+from content_summarizer.managers.search_index import SearchIndex
+from content_summarizer.managers.transcript_store import TranscriptStore
+from content_summarizer.managers.usage_ledger import UsageLedger
+from content_summarizer.services.transcription_service import TranscriptionApiClient
+from content_summarizer.utils.metrics import MetricsRecorder
+
+RESULTS_DIR: Path = Path(__file__).parent / "results"
+
+
+def _build_config(spec: dict[str, Any], video_index: int) -> AppConfig:
+    """Assemble an AppConfig wired to the local fakes for one video."""
+    cache_dir = Path(spec["cache_dir"])
+    path_manager = PathManager().set_cache_dir(cache_dir)
+    api_url: str | None = spec["api_url"]
+    return AppConfig(
+        logger=logging.getLogger("benchmark"),
+        path_manager=path_manager,
+        video_service=FakeVideoService(Path(spec["fixture"])),
+        cache_manager=CacheManager(
+            TranscriptStore(path_manager.transcript_store_path),
+            SearchIndex(cache_dir / "search.db"),
+        ),
+        config_manager=ConfigManager(cache_dir / "config.json"),
+        gemini_model=FakeGeminiModel(spec["gemini_latency"]),  # type: ignore[arg-type]
+        transcription_client=(
+            TranscriptionApiClient(api_url, "benchmark") if api_url else None
+        ),
+        url=f"https://benchmark.invalid/video-{video_index}",
+        output_path=None,
+        keep_cache=False,
+        quiet=0,
+        speed_factor=spec["speed_factor"],
+        api=api_url is not None,
+        api_url=api_url,
+        api_key="benchmark",
+        gemini_key=None,
+        gemini_model_name="2.5-flash",
+        whisper_model=spec["whisper_model"],
+        beam_size=spec["beam_size"],
+        device="cpu",
+        compute_type=None,
+        auto_captions="off",
+        no_terminal=True,
+        user_language="en-US",
+        languages=["en-US"],
+        metrics=MetricsRecorder(),
+        metrics_out=None,
+        cache_ttl=0.0,
+        cache_max_size=0.0,
+        context_cache=None,
+        usage_ledger=UsageLedger(cache_dir / "usage.db"),
+    )
+
+
+def _summarize_runs(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate the per-video reports of one combination."""
+    walls: list[float] = [run["wall_seconds"] for run in runs]
+    # The first video pays for loading the Whisper model.
+    warm_walls: list[float] = walls[1:] or walls
+    stage_walls: dict[str, list[float]] = {}
+    for run in runs[1:] or runs:
+        for stage in run["stages"]:
+            stage_walls.setdefault(stage["name"], []).append(stage["wall_seconds"])
+    return {
+        "cold_wall_seconds": walls[0],
+        "warm_wall_seconds": round(statistics.median(warm_walls), 6),
+        "videos_per_hour": round(3600 / statistics.mean(warm_walls), 2),
+        "stage_wall_seconds": {
+            name: round(statistics.median(values), 6)
+            for name, values in stage_walls.items()
+        },
+        "peak_rss_bytes": max(run["peak_rss_bytes"] or 0 for run in runs),
+        "ok": all(run.get("ok", False) for run in runs),
+    }
+
+
+def _run_worker(spec: dict[str, Any]) -> dict[str, Any]:
+    """Run one combination in this process and report its measurements."""
+    runs: list[dict[str, Any]] = []
+    for video_index in range(spec["videos"]):
+        config: AppConfig = _build_config(spec, video_index)
+        try:
+            run_pipeline(config)
+        except Exception:
+            logging.getLogger("benchmark").exception("Benchmark run failed")
+        runs.append(config.metrics.to_dict())
+    return {**_summarize_runs(runs), "runs": runs}
+
+
+def _git_revision() -> tuple[str, bool]:
+    """Get the short commit hash and whether the working tree is dirty."""
+    try:
+        commit: str = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        status: str = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return commit, bool(status.strip())
+
+
+def _build_specs(
+    args: argparse.Namespace, fixture: Path, work_dir: Path, api_url: str | None
+) -> list[dict[str, Any]]:
+    """List the worker specs of every combination to benchmark."""
+    common: dict[str, Any] = {
+        "fixture": str(fixture),
+        "videos": args.videos,
+        "gemini_latency": args.gemini_latency,
+    }
+    specs: list[dict[str, Any]] = []
+    if "local" in args.modes:
+        specs += [
+            {
+                **common,
+                "mode": "local",
+                "whisper_model": model,
+                "beam_size": beam_size,
+                "speed_factor": speed_factor,
+                "api_url": None,
+            }
+            for model, beam_size, speed_factor in itertools.product(
+                args.whisper_models, args.beam_sizes, args.speed_factors
+            )
+        ]
+    if "api" in args.modes:
+        specs += [
+            {
+                **common,
+                "mode": "api",
+                "whisper_model": "api",
+                "beam_size": 0,
+                "speed_factor": speed_factor,
+                "api_url": api_url,
+            }
+            for speed_factor in args.speed_factors
+        ]
+    for index, spec in enumerate(specs):
+        spec["cache_dir"] = str(work_dir / f"cache-{index}")
+    return specs
+
+
+def _spawn_worker(spec: dict[str, Any]) -> dict[str, Any]:
+    """Run one combination in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, __file__, "--worker", json.dumps(spec)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONWARNINGS": "ignore"},
+    )
+    return json.loads(completed.stdout)
+
+
+def run_matrix(args: argparse.Namespace) -> dict[str, Any]:
+    """Benchmark every combination and collect the results.
+
+    Args:
+        args: The parsed command-line arguments.
+
+    Returns:
+        The JSON-compatible report of the whole matrix.
+
+    """
+    with ExitStack() as stack:
+        work_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        fixture: Path = args.fixture or work_dir / "fixture.mp3"
+        fixture_kind: str = "file"
+        if args.fixture is None:
+            fixture_kind = make_fixture_audio(fixture, args.fixture_seconds)
+
+        api_url: str | None = None
+        if "api" in args.modes:
+            server = stack.enter_context(FakeTranscriptionServer(args.api_latency))
+            api_url = server.url
+
+        results: list[dict[str, Any]] = []
+        for spec in _build_specs(args, fixture, work_dir, api_url):
+            print(
+                f"{spec['mode']:5} model={spec['whisper_model']} "
+                f"beam={spec['beam_size']} speed={spec['speed_factor']}",
+                file=sys.stderr,
+            )
+            result: dict[str, Any] = _spawn_worker(spec)
+            parameters = {
+                k: spec[k] for k in ("mode", "whisper_model", "beam_size")
+            } | {"speed_factor": spec["speed_factor"]}
+            results.append({**parameters, **result})
+
+    commit, dirty = _git_revision()
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "fixture": {"kind": fixture_kind, "seconds": args.fixture_seconds},
+        "videos_per_combination": args.videos,
+        "results": results,
+    }
+
+
+def _combination_key(result: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        result["mode"],
+        result["whisper_model"],
+        result["beam_size"],
+        result["speed_factor"],
+    )
+
+
+def compare(baseline_path: Path, candidate_path: Path) -> None:
+    """Print the throughput change of every combination between two reports.
+
+    Args:
+        baseline_path: The report to compare against.
+        candidate_path: The report being evaluated.
+
+    """
+    reports: list[dict[str, Any]] = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in (baseline_path, candidate_path)
+    ]
+    baseline = {_combination_key(r): r for r in reports[0]["results"]}
+    print(f"{reports[0]['commit']} -> {reports[1]['commit']}")
+    for result in reports[1]["results"]:
+        key = _combination_key(result)
+        before: dict[str, Any] | None = baseline.get(key)
+        if before is None:
+            continue
+        change: float = (
+            result["videos_per_hour"] / before["videos_per_hour"] - 1
+        ) * 100
+        print(
+            f"{key[0]:5} model={key[1]:8} beam={key[2]} speed={key[3]:<5} "
+            f"{before['videos_per_hour']:9.1f} -> "
+            f"{result['videos_per_hour']:9.1f} videos/h ({change:+.1f}%)"
+        )
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--whisper-models", nargs="+", default=["tiny", "base"])
+    parser.add_argument("--beam-sizes", nargs="+", type=int, default=[1, 5])
+    parser.add_argument("--speed-factors", nargs="+", type=float, default=[1.25, 2.0])
+    parser.add_argument("--videos", type=int, default=3, help="Videos per combination.")
+    parser.add_argument(
+        "--fixture", type=Path, help="Use this audio file instead of a synthetic one."
+    )
+    parser.add_argument("--fixture-seconds", type=float, default=60.0)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["local", "api"],
+        default=["local"],
+        help="Transcribe locally, through the fake remote API, or both.",
+    )
+    parser.add_argument("--api-latency", type=float, default=0.0)
+    parser.add_argument("--gemini-latency", type=float, default=0.0)
+    parser.add_argument("--output", type=Path, help="Where to write the results.")
+    parser.add_argument(
+        "--compare", nargs=2, type=Path, metavar=("BASELINE", "CANDIDATE")
+    )
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the pipeline benchmark and write or compare the results.
+
+    Returns:
+        The process exit code, non-zero if any combination failed.
+
+    """
+    args = _parse_arguments()
+    if args.worker:
+        logging.basicConfig(level=logging.WARNING)
+        print(json.dumps(_run_worker(json.loads(args.worker))))
+        return 0
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    report: dict[str, Any] = run_matrix(args)
+    output: Path = args.output or RESULTS_DIR / f"{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=4), encoding="utf-8")
+
+    for result in report["results"]:
+        status = "ok" if result["ok"] else "FAIL"
+        print(
+            f"{status:4} {result['mode']:5} model={result['whisper_model']:8} "
+            f"beam={result['beam_size']} speed={result['speed_factor']:<5} "
+            f"{result['videos_per_hour']:9.1f} videos/h "
+            f"peak {result['peak_rss_bytes'] / 2**20:7.1f} MiB"
+        )
+    print(f"Results written to {output}")
+    return 0 if all(r["ok"] for r in report["results"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Prometheus metrics for the transcription API.
+
+This module defines the counters, gauges and histograms exported on the
+API's '/metrics' endpoint: request latency, audio seconds transcribed, the
+transcription real-time factor, Whisper model load time, in-flight jobs and
+rejected requests.
+
+When the PROMETHEUS_MULTIPROC_DIR environment variable points to a writable
+directory, every gunicorn worker writes its samples there and the endpoint
+aggregates them, so a scrape sees the whole server rather than the one worker
+that happened to answer it (see gunicorn.conf.py).
+
+Functions:
+    render_metrics: Serializes the current metrics in the text format.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUEST_LATENCY = Histogram(
+    "transcription_api_request_duration_seconds",
+    "Time spent handling a request.",
+    ["endpoint", "method", "status"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+AUDIO_SECONDS = Counter(
+    "transcription_api_audio_seconds",
+    "Seconds of audio transcribed.",
+)
+REAL_TIME_FACTOR = Histogram(
+    "transcription_api_real_time_factor",
+    "Transcription time divided by audio duration.",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 5),
+)
+MODEL_LOAD_SECONDS = Gauge(
+    "transcription_api_model_load_seconds",
+    "Time it took to load the Whisper model in a worker.",
+    multiprocess_mode="max",
+)
+IN_FLIGHT_JOBS = Gauge(
+    "transcription_api_in_flight_jobs",
+    "Transcriptions currently running.",
+    multiprocess_mode="livesum",
+)
+REJECTED_REQUESTS = Counter(
+    "transcription_api_rejected_requests",
+    "Requests rejected by the rate limit or the audio quota.",
+    ["reason"],
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Serialize the current metrics in the Prometheus text format.
+
+    Returns:
+        A tuple of (response body, content type).
+
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,8 +1,17 @@
 """Flask API for transcribing audio files using a local Whisper model.
 
-This module provides a single '/transcribe' endpoint that accepts POST
-requests with an audio file. It handles API key authentication, rate limiting,
-and orchestrates the transcription process, returning the result as JSON.
+This module provides a '/transcribe' endpoint that accepts POST requests with
+an audio file, and a '/transcribe/<content_hash>' endpoint that returns a
+previously computed transcription for the same audio content. It handles API
+key authentication, rate limiting, and orchestrates the transcription process,
+returning the result as JSON.
+
+Usage is limited per API key in audio seconds per day, backed by a pluggable
+quota store (see quota_store.py), plus a request-count limit that only guards
+against bursts.
+
+A '/metrics' endpoint exposes request latency, audio throughput and queue
+signals in the Prometheus text format (see api_metrics.py).
 
 """
 # Copyright 2025 Gabriel Carvalho
@@ -19,78 +28,310 @@ and orchestrates the transcription process, returning the result as JSON.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import hmac
+import json
 import logging
 import os
+import re
 import tempfile
+import time
+import uuid
 from collections.abc import Iterable
+from contextvars import Token
 from pathlib import Path
+from typing import Any
 
+import av
 import dotenv
+from api_metrics import (
+    AUDIO_SECONDS,
+    IN_FLIGHT_JOBS,
+    MODEL_LOAD_SECONDS,
+    REAL_TIME_FACTOR,
+    REJECTED_REQUESTS,
+    REQUEST_LATENCY,
+    render_metrics,
+)
 from faster_whisper import WhisperModel
 from faster_whisper.transcribe import Segment
-from flask import Flask, Response, jsonify, request
+from flask import Flask, Response, g, jsonify, request
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from log_config import bind_request_id, request_id_var, setup_logging
+from platformdirs import user_cache_path
+from quota_store import QuotaStore, create_quota_store
 from werkzeug.datastructures import FileStorage
 
 app: Flask = Flask(__name__)
-limiter = Limiter(
-    get_remote_address,
-    app=app,
-    storage_uri="memory://",
-)
 
 
 parent_path: Path = Path(__file__).parent
-logfile_path: Path = parent_path / "app.log"
-log_formatter: logging.Formatter = logging.Formatter(
-    "%(asctime)s - %(levelname)s - [%(name)s:%(lineno)d] - %(message)s"
-)
-file_handler: logging.FileHandler = logging.FileHandler(
-    logfile_path, mode="a", encoding="utf-8"
-)
-file_handler.setFormatter(log_formatter)
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-
-if logger.hasHandlers():
-    logger.handlers.clear()
-
-logger.addHandler(file_handler)
-
-
 dotenv.load_dotenv(parent_path / ".env")
+
+logger: logging.Logger = setup_logging(
+    Path(os.getenv("LOG_FILE", parent_path / "app.log")),
+    max_bytes=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+    backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+)
 api_secret_key: str | None = os.getenv("API_SECRET_KEY")
 
 if api_secret_key is None:
     logger.error("API_SECRET_KEY environment variable not set")
     raise ValueError("API_SECRET_KEY environment variable not set")
 
+default_daily_audio_seconds: float = float(os.getenv("DAILY_AUDIO_SECONDS", "7200"))
+api_key_quotas: dict[str, float] = {api_secret_key: default_daily_audio_seconds}
+api_keys_file: str | None = os.getenv("API_KEYS_FILE")
+if api_keys_file:
+    with Path(api_keys_file).open("r", encoding="utf-8") as f:
+        api_key_quotas.update(
+            {key: float(seconds) for key, seconds in json.load(f).items()}
+        )
+
+# Kept in the per-user cache by default, so the quota does not depend on the
+# directory the server is started from.
+default_quota_db_path: Path = user_cache_path("content-summarizer-api") / "quota.db"
+quota_store: QuotaStore = create_quota_store(
+    os.getenv("QUOTA_STORAGE_URI", f"sqlite:///{default_quota_db_path}")
+)
+limiter = Limiter(
+    lambda: _get_api_key_id() or get_remote_address(),
+    app=app,
+    storage_uri=os.getenv("RATELIMIT_STORAGE_URI", "memory://"),
+    on_breach=lambda _limit: _count_rate_limit_breach(),
+)
+transcribe_rate_limit: str = os.getenv("TRANSCRIBE_RATE_LIMIT", "10 per minute")
+
+transcriptions_dir_path: Path = Path(
+    os.getenv("TRANSCRIPTIONS_DIR", parent_path / "transcriptions")
+)
+transcriptions_dir_path.mkdir(parents=True, exist_ok=True)
+CONTENT_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+REQUEST_ID_PATTERN = re.compile(r"^[\w.-]{1,128}$")
+
+model_load_started: float = time.perf_counter()
 whisper_model = WhisperModel("base", device="cpu", compute_type="int8")
+MODEL_LOAD_SECONDS.set(time.perf_counter() - model_load_started)
+
+
+def _count_rate_limit_breach() -> None:
+    """Count a request rejected by the request-count limit."""
+    REJECTED_REQUESTS.labels(reason="rate_limit").inc()
+
+
+@app.before_request
+def _start_request() -> None:
+    """Record when the request started and bind its ID to the logs.
+
+    A well-formed 'X-Request-Id' header from a proxy is reused, so log lines
+    can be matched across services; otherwise a new ID is generated.
+    """
+    g.request_started = time.perf_counter()
+    request_id: str = request.headers.get("X-Request-Id", "")
+    if not REQUEST_ID_PATTERN.match(request_id):
+        request_id = uuid.uuid4().hex
+    g.request_id = request_id
+    g.request_id_token = bind_request_id(request_id)
+
+
+@app.after_request
+def _finish_request(response: Response) -> Response:
+    """Observe the request latency and return the request ID to the client."""
+    started: float | None = g.get("request_started")
+    if started is not None:
+        REQUEST_LATENCY.labels(
+            endpoint=request.endpoint or "unknown",
+            method=request.method,
+            status=response.status_code,
+        ).observe(time.perf_counter() - started)
+    if "request_id" in g:
+        response.headers["X-Request-Id"] = g.request_id
+    return response
+
+
+@app.teardown_request
+def _unbind_request_id(_error: BaseException | None) -> None:
+    """Stop attaching the finished request's ID to the logs."""
+    token: Token[str | None] | None = g.pop("request_id_token", None)
+    if token is not None:
+        request_id_var.reset(token)
+
+
+def _get_api_key_id() -> str | None:
+    """Identify the caller by its 'X-Api-Key' header.
+
+    Returns:
+        A short, non-reversible identifier of the matching API key, or None if
+        the header is missing or does not match any configured key.
+
+    """
+    provided_api_key: str | None = request.headers.get("X-Api-Key")
+    if not provided_api_key:
+        return None
+    for api_key in api_key_quotas:
+        if hmac.compare_digest(provided_api_key, api_key):
+            return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return None
+
+
+def _get_api_key_quota() -> float:
+    """Return the daily audio-seconds quota of the authorized caller."""
+    provided_api_key: str = request.headers.get("X-Api-Key", "")
+    return api_key_quotas.get(provided_api_key, default_daily_audio_seconds)
+
+
+def _probe_audio_seconds(audio_path: Path) -> float:
+    """Read the duration of an audio file from its container metadata."""
+    with av.open(str(audio_path)) as container:
+        if container.duration is not None:
+            return container.duration / av.time_base
+        stream = container.streams.audio[0]
+        assert stream.duration is not None and stream.time_base is not None
+        return float(stream.duration * stream.time_base)
+
+
+def _build_result(segments: Iterable[Segment], language: str) -> dict[str, Any]:
+    """Build the response payload with the plain text and the timed segments.
+
+    The segments are laid out in columns (one list per field) to keep the
+    JSON compact, matching the client's Transcript format.
+    """
+    columns: dict[str, Any] = {
+        "version": 1,
+        "start": [],
+        "end": [],
+        "text": [],
+        "avg_logprob": [],
+        "no_speech_prob": [],
+        "language": language,
+    }
+    for segment in segments:
+        columns["start"].append(round(segment.start, 3))
+        columns["end"].append(round(segment.end, 3))
+        columns["text"].append(segment.text)
+        columns["avg_logprob"].append(round(segment.avg_logprob, 4))
+        columns["no_speech_prob"].append(round(segment.no_speech_prob, 4))
+    return {"transcription": "".join(columns["text"]), "segments": columns}
+
+
+def _stored_transcription_path(content_hash: str, language: str | None) -> Path:
+    """Get the path of a result, kept apart for each language that was forced."""
+    if language is None:
+        return transcriptions_dir_path / f"{content_hash}.json"
+    return transcriptions_dir_path / f"{content_hash}.{language}.json"
+
+
+def _read_stored_transcription(stored_path: Path) -> dict[str, Any] | None:
+    """Read a stored result, or None if it does not exist or is unreadable."""
+    try:
+        with stored_path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _load_stored_transcription(
+    content_hash: str, language: str | None = None
+) -> dict[str, Any] | None:
+    """Return the stored result for a content hash and language, if any.
+
+    A result transcribed in a forced language only answers requests for that
+    language. A result with the language detected answers requests for any
+    language it was detected as.
+    """
+    stored_result: dict[str, Any] | None = _read_stored_transcription(
+        _stored_transcription_path(content_hash, language)
+    )
+    if stored_result is None and language is not None:
+        stored_result = _read_stored_transcription(
+            _stored_transcription_path(content_hash, None)
+        )
+        if stored_result is not None and (
+            stored_result.get("segments", {}).get("language") != language
+        ):
+            return None
+    return stored_result
+
+
+def _store_transcription(
+    content_hash: str, language: str | None, result: dict[str, Any]
+) -> None:
+    """Persist a transcription result under its content hash, atomically."""
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=transcriptions_dir_path,
+        suffix=".tmp",
+        delete=False,
+    ) as f:
+        json.dump(result, f, ensure_ascii=False, separators=(",", ":"))
+    Path(f.name).replace(_stored_transcription_path(content_hash, language))
+
+
+@app.route("/transcribe/<content_hash>", methods=["GET"])
+@limiter.limit("60 per minute")
+def get_transcription(content_hash: str) -> Response | tuple[Response, int]:
+    """Return a previously computed transcription by its audio content hash.
+
+    Lets clients skip uploading audio that the server has already transcribed.
+    An optional 'language' query parameter only matches results in that
+    language. It requires a valid 'X-Api-Key' header for authentication.
+
+    Returns:
+        - 200 OK: A JSON object with the transcription text.
+        - 400 Bad Request: If the hash is not a SHA-256 hex digest, or the
+          language is not supported.
+        - 401 Unauthorized: If the API key is missing or invalid.
+        - 404 Not Found: If no transcription is stored for the hash.
+
+    """
+    if _get_api_key_id() is None:
+        logger.warning("Unauthorized request from %s", request.remote_addr)
+        return jsonify({"error": "Unauthorized"}), 401
+
+    if not CONTENT_HASH_PATTERN.match(content_hash):
+        return jsonify({"error": "Invalid content hash"}), 400
+    language: str | None = request.args.get("language") or None
+    if language is not None and language not in whisper_model.supported_languages:
+        return jsonify({"error": f"Unsupported language: {language}"}), 400
+
+    stored_result: dict[str, Any] | None = _load_stored_transcription(
+        content_hash, language
+    )
+    if stored_result is None:
+        return jsonify({"error": "Not found"}), 404
+
+    logger.info("Serving stored transcription for %s", content_hash)
+    return jsonify(stored_result)
 
 
 @app.route("/transcribe", methods=["POST"])
-@limiter.limit("2 per minute, 5 per day")
+@limiter.limit(lambda: transcribe_rate_limit)
 def transcribe() -> Response | tuple[Response, int]:
     """Handle audio transcription requests.
 
-    Accepts a POST request with a multipart form containing an 'audio' file.
-    It requires a valid 'X-Api-Key' header for authentication.
+    Accepts a POST request with a multipart form containing an 'audio' file
+    and, optionally, the Whisper code of its spoken 'language', which skips
+    the language detection. It requires a valid 'X-Api-Key' header for
+    authentication. Results are stored under the SHA-256 of the uploaded
+    content and the forced language, so a retried or repeated upload of the
+    same audio is answered without transcribing it again, and without being
+    charged to the caller's audio-seconds quota. A transcription that fails
+    is not charged either.
 
     Returns:
         - 200 OK: A JSON object with the transcription text.
-        - 400 Bad Request: If no audio file is provided.
+        - 400 Bad Request: If no audio file is provided, or the language is
+          not supported.
         - 401 Unauthorized: If the API key is missing or invalid.
-        - 429 Too Many Requests: If the rate limit is exceeded.
+        - 429 Too Many Requests: If the rate limit or the daily audio-seconds
+          quota is exceeded.
         - 500 Internal Server Error: If an unexpected error occurs.
 
     """
-    provided_api_key: str | None = request.headers.get("X-Api-Key")
-    assert api_secret_key
-    if not provided_api_key or not hmac.compare_digest(
-        provided_api_key, api_secret_key
-    ):
+    key_id: str | None = _get_api_key_id()
+    if key_id is None:
         logger.warning("Unauthorized request from %s", request.remote_addr)
         return jsonify({"error": "Unauthorized"}), 401
 
@@ -99,21 +340,65 @@ def transcribe() -> Response | tuple[Response, int]:
     if not audio_file:
         logger.warning("No audio file uploaded")
         return jsonify({"error": "No audio file uploaded"}), 400
+    language: str | None = request.form.get("language") or None
+    if language is not None and language not in whisper_model.supported_languages:
+        logger.warning("Unsupported language: %s", language)
+        return jsonify({"error": f"Unsupported language: {language}"}), 400
 
     try:
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir) / "audio.mp3"
+            suffix: str = Path(audio_file.filename or "").suffix or ".mp3"
+            temp_path = Path(temp_dir) / f"audio{suffix}"
 
             audio_file.save(temp_path)
 
+            with temp_path.open("rb") as f:
+                content_hash: str = hashlib.file_digest(f, "sha256").hexdigest()
+            stored_result: dict[str, Any] | None = _load_stored_transcription(
+                content_hash, language
+            )
+            if stored_result is not None:
+                logger.info("Serving stored transcription for %s", content_hash)
+                return jsonify(stored_result)
+
+            audio_seconds: float = _probe_audio_seconds(temp_path)
+            quota: float = _get_api_key_quota()
+            if not quota_store.try_consume(key_id, audio_seconds, quota):
+                logger.warning("Audio quota exceeded for key %s", key_id)
+                REJECTED_REQUESTS.labels(reason="quota").inc()
+                return jsonify(
+                    {
+                        "error": "Daily audio quota exceeded",
+                        "used_seconds": quota_store.used(key_id),
+                        "quota_seconds": quota,
+                        "requested_seconds": audio_seconds,
+                    }
+                ), 429
+
             logger.info("Initializing transcription")
 
-            segments: Iterable[Segment]
-            segments, _ = whisper_model.transcribe(str(temp_path), beam_size=5)
-            transcription_text: str = "".join(segment.text for segment in segments)
+            try:
+                with IN_FLIGHT_JOBS.track_inprogress():
+                    transcription_started: float = time.perf_counter()
+                    segments: Iterable[Segment]
+                    segments, info = whisper_model.transcribe(
+                        str(temp_path), beam_size=5, language=language
+                    )
+                    # Segments are decoded lazily, while the result is built.
+                    result: dict[str, Any] = _build_result(segments, info.language)
+                    transcription_seconds: float = (
+                        time.perf_counter() - transcription_started
+                    )
+            except Exception:
+                quota_store.refund(key_id, audio_seconds)
+                raise
+            AUDIO_SECONDS.inc(audio_seconds)
+            if audio_seconds > 0:
+                REAL_TIME_FACTOR.observe(transcription_seconds / audio_seconds)
 
+            _store_transcription(content_hash, language, result)
             logger.info("Transcription completed")
-            return jsonify({"transcription": transcription_text})
+            return jsonify(result)
 
     except Exception:
         logger.exception("Error occurred during transcription")
@@ -122,5 +407,21 @@ def transcribe() -> Response | tuple[Response, int]:
         ), 500
 
 
+@app.route("/metrics", methods=["GET"])
+@limiter.exempt
+def metrics() -> Response:
+    """Expose the API metrics in the Prometheus text format.
+
+    The endpoint is unauthenticated so a scraper can reach it without an API
+    key; restrict it at the reverse proxy if the server is public.
+
+    Returns:
+        - 200 OK: The current metrics.
+
+    """
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type)
+
+
 if __name__ == "__main__":
     app.run(debug=True, port=8000)
@@ -0,0 +1,33 @@
+"""Gunicorn settings for the transcription API.
+
+Gunicorn loads this file automatically when started from this directory.
+It only matters when Prometheus multiprocess mode is enabled through the
+PROMETHEUS_MULTIPROC_DIR environment variable: the live gauges of a worker
+that exits must be discarded so they do not linger in the aggregated metrics.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import Any
+
+
+def child_exit(server: Any, worker: Any) -> None:  # noqa: ANN401
+    """Mark an exited worker as dead in the multiprocess metrics directory."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,132 @@
+"""Configures non-blocking, structured logging for the transcription API.
+
+Request threads only put records on an in-memory queue. A background
+listener thread writes them as JSON lines to a size-rotated file, so a slow
+disk never holds up a request. Every record logged while a request is being
+handled carries that request's ID.
+
+Functions:
+    bind_request_id: Binds a request ID to the records logged in a context.
+    setup_logging: Routes the root logger through the queue to the log file.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import copy
+import json
+import logging
+import queue
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+def bind_request_id(request_id: str) -> Token[str | None]:
+    """Attach a request ID to every record logged in the current context.
+
+    Args:
+        request_id: The ID of the request being handled.
+
+    Returns:
+        The token to pass to request_id_var.reset() when the request ends.
+
+    """
+    return request_id_var.set(request_id)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, without modifying them."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the log record as a single line of JSON.
+
+        Args:
+            record: The log record to be formatted.
+
+        Returns:
+            The JSON object, without a trailing newline.
+
+        """
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "line": f"{record.module}:{record.lineno}",
+            "message": record.getMessage(),
+        }
+        request_id: str | None = getattr(record, "request_id", None)
+        if request_id is not None:
+            entry["request_id"] = request_id
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _RequestQueueHandler(QueueHandler):
+    """Queues records with their request ID, leaving formatting to the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared: logging.LogRecord = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info and not record.exc_text:
+            prepared.exc_text = logging.Formatter().formatException(record.exc_info)
+        prepared.exc_info = None
+        prepared.request_id = request_id_var.get()
+        return prepared
+
+
+def setup_logging(
+    log_file_path: Path, max_bytes: int, backup_count: int
+) -> logging.Logger:
+    """Route the root logger through a queue to a rotating JSON-lines file.
+
+    Args:
+        log_file_path: The destination path of the log file.
+        max_bytes: The size at which the file is rotated, 0 to never rotate.
+        backup_count: How many rotated files are kept.
+
+    Returns:
+        The configured root logger.
+
+    """
+    file_handler = RotatingFileHandler(
+        log_file_path,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8",
+    )
+    file_handler.setFormatter(JsonLinesFormatter())
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    if logger.hasHandlers():
+        logger.handlers.clear()
+    logger.addHandler(_RequestQueueHandler(log_queue))
+    return logger
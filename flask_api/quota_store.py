@@ -0,0 +1,323 @@
+"""Stores per-API-key transcription quotas measured in audio seconds.
+
+This module provides interchangeable storage backends for the API's usage
+quotas. Every backend exposes the same atomic check-and-consume operation, so
+the quota stays accurate when several gunicorn workers, or several hosts,
+share the same store.
+
+Classes:
+    QuotaStore: Abstract base class for quota storage backends.
+    MemoryQuotaStore: A single-process store, also a stand-in for Redis.
+    SQLiteQuotaStore: A file-backed store shared by processes on one host.
+    RedisQuotaStore: A store shared by every host connected to a Redis server.
+
+Functions:
+    create_quota_store: Builds a store from a storage URI.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+WINDOW_SECONDS: int = 24 * 60 * 60
+
+_REDIS_CONSUME_SCRIPT = """
+local used = tonumber(redis.call('GET', KEYS[1]) or '0')
+if used + tonumber(ARGV[1]) > tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('INCRBYFLOAT', KEYS[1], ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+_REDIS_REFUND_SCRIPT = """
+local used = tonumber(redis.call('GET', KEYS[1]) or '0')
+if used > 0 then
+    redis.call('INCRBYFLOAT', KEYS[1], -math.min(tonumber(ARGV[1]), used))
+end
+return 1
+"""
+
+
+def _current_window() -> int:
+    """Return the start timestamp of the current daily quota window."""
+    now = int(time.time())
+    return now - now % WINDOW_SECONDS
+
+
+class QuotaStore(ABC):
+    """Abstract base class for quota storage backends."""
+
+    @abstractmethod
+    def try_consume(self, key_id: str, seconds: float, limit: float) -> bool:
+        """Atomically consume audio seconds if the quota allows it.
+
+        Args:
+            key_id: The identifier of the API key being charged.
+            seconds: The audio seconds to consume.
+            limit: The maximum audio seconds allowed in the current window.
+
+        Returns:
+            True if the seconds were consumed, False if the quota would be
+            exceeded, in which case nothing is consumed.
+
+        """
+        pass
+
+    @abstractmethod
+    def refund(self, key_id: str, seconds: float) -> None:
+        """Give back audio seconds consumed by a request that failed.
+
+        The seconds are taken off the current window, without going below
+        zero, so a refund after the window rolled over is dropped.
+
+        Args:
+            key_id: The identifier of the API key that was charged.
+            seconds: The audio seconds to give back.
+
+        """
+        pass
+
+    @abstractmethod
+    def used(self, key_id: str) -> float:
+        """Get the audio seconds consumed in the current window.
+
+        Args:
+            key_id: The identifier of the API key.
+
+        Returns:
+            The consumed audio seconds.
+
+        """
+        pass
+
+
+class MemoryQuotaStore(QuotaStore):
+    """An in-process quota store.
+
+    Counters follow the same key and expiry layout as RedisQuotaStore, which
+    makes this class a drop-in stand-in for Redis in development. Counters are
+    not shared between processes.
+
+    Attributes:
+        _counters: A mapping of window keys to consumed seconds.
+        _lock: A lock guarding the counters.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the MemoryQuotaStore."""
+        self._counters: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(key_id: str) -> str:
+        return f"quota:{key_id}:{_current_window()}"
+
+    def _expire_old_windows(self) -> None:
+        current_suffix = f":{_current_window()}"
+        for key in [k for k in self._counters if not k.endswith(current_suffix)]:
+            del self._counters[key]
+
+    def try_consume(self, key_id: str, seconds: float, limit: float) -> bool:
+        """Atomically consume audio seconds if the quota allows it."""
+        key = self._key(key_id)
+        with self._lock:
+            self._expire_old_windows()
+            used = self._counters.get(key, 0.0)
+            if used + seconds > limit:
+                return False
+            self._counters[key] = used + seconds
+            return True
+
+    def refund(self, key_id: str, seconds: float) -> None:
+        """Give back audio seconds consumed by a request that failed."""
+        key = self._key(key_id)
+        with self._lock:
+            if key in self._counters:
+                self._counters[key] = max(self._counters[key] - seconds, 0.0)
+
+    def used(self, key_id: str) -> float:
+        """Get the audio seconds consumed in the current window."""
+        with self._lock:
+            return self._counters.get(self._key(key_id), 0.0)
+
+
+class SQLiteQuotaStore(QuotaStore):
+    """A quota store backed by a SQLite database file.
+
+    SQLite's file locking makes the check-and-consume operation atomic across
+    every worker process on the same host.
+
+    Attributes:
+        _db_path: The path to the SQLite database file.
+
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the SQLiteQuotaStore and create its schema.
+
+        Args:
+            db_path: The path to the SQLite database file.
+
+        """
+        self._db_path = db_path
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS usage ("
+                "key_id TEXT NOT NULL, "
+                "window INTEGER NOT NULL, "
+                "seconds REAL NOT NULL, "
+                "PRIMARY KEY (key_id, window))"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path, timeout=30, isolation_level=None)
+
+    def try_consume(self, key_id: str, seconds: float, limit: float) -> bool:
+        """Atomically consume audio seconds if the quota allows it."""
+        window = _current_window()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT seconds FROM usage WHERE key_id = ? AND window = ?",
+                (key_id, window),
+            ).fetchone()
+            used = row[0] if row else 0.0
+            if used + seconds > limit:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute(
+                "INSERT INTO usage (key_id, window, seconds) VALUES (?, ?, ?) "
+                "ON CONFLICT (key_id, window) "
+                "DO UPDATE SET seconds = seconds + excluded.seconds",
+                (key_id, window, seconds),
+            )
+            conn.execute("DELETE FROM usage WHERE window < ?", (window,))
+            conn.execute("COMMIT")
+            return True
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def refund(self, key_id: str, seconds: float) -> None:
+        """Give back audio seconds consumed by a request that failed."""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE usage SET seconds = MAX(seconds - ?, 0) "
+                "WHERE key_id = ? AND window = ?",
+                (seconds, key_id, _current_window()),
+            )
+        finally:
+            conn.close()
+
+    def used(self, key_id: str) -> float:
+        """Get the audio seconds consumed in the current window."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT seconds FROM usage WHERE key_id = ? AND window = ?",
+                (key_id, _current_window()),
+            ).fetchone()
+            return row[0] if row else 0.0
+        finally:
+            conn.close()
+
+
+class RedisQuotaStore(QuotaStore):
+    """A quota store backed by a Redis server.
+
+    Requires the optional 'redis' package. The check-and-consume operation
+    runs as a Lua script, so it is atomic across every host.
+
+    Attributes:
+        _client: The Redis client.
+
+    """
+
+    def __init__(self, storage_uri: str) -> None:
+        """Initialize the RedisQuotaStore.
+
+        Args:
+            storage_uri: A Redis URL (e.g., 'redis://localhost:6379/0').
+
+        """
+        import redis
+
+        self._client: Any = redis.Redis.from_url(storage_uri)
+        self._consume_script = self._client.register_script(_REDIS_CONSUME_SCRIPT)
+        self._refund_script = self._client.register_script(_REDIS_REFUND_SCRIPT)
+
+    @staticmethod
+    def _key(key_id: str) -> str:
+        return f"quota:{key_id}:{_current_window()}"
+
+    def try_consume(self, key_id: str, seconds: float, limit: float) -> bool:
+        """Atomically consume audio seconds if the quota allows it."""
+        result = self._consume_script(
+            keys=[self._key(key_id)], args=[seconds, limit, WINDOW_SECONDS]
+        )
+        return bool(result)
+
+    def refund(self, key_id: str, seconds: float) -> None:
+        """Give back audio seconds consumed by a request that failed."""
+        self._refund_script(keys=[self._key(key_id)], args=[seconds])
+
+    def used(self, key_id: str) -> float:
+        """Get the audio seconds consumed in the current window."""
+        value = self._client.get(self._key(key_id))
+        return float(value) if value else 0.0
+
+
+def create_quota_store(storage_uri: str) -> QuotaStore:
+    """Build a quota store from a storage URI.
+
+    Supported schemes are 'memory://', 'sqlite:///path/to/file.db' and
+    'redis://host:port/db' (or 'rediss://').
+
+    Args:
+        storage_uri: The URI describing the storage backend.
+
+    Returns:
+        The configured quota store.
+
+    Raises:
+        ValueError: If the URI scheme is not supported.
+
+    """
+    scheme, _, location = storage_uri.partition("://")
+    if scheme == "memory":
+        return MemoryQuotaStore()
+    if scheme == "sqlite":
+        return SQLiteQuotaStore(Path(location.removeprefix("/")))
+    if scheme in ("redis", "rediss"):
+        return RedisQuotaStore(storage_uri)
+    raise ValueError(f"Unsupported quota storage URI: {storage_uri}")
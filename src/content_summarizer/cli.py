@@ -20,6 +20,7 @@ It is the main entry point for user interaction.
 # limitations under the License.
 
 import argparse
+from datetime import date
 from pathlib import Path
 
 WHISPER_MODEL_LIST = [
@@ -46,12 +47,62 @@ DEVICES_LIST = [
     "auto",
 ]
 
+COMPUTE_TYPE_LIST = [
+    "auto",
+    "int8",
+    "int8_float32",
+    "int8_float16",
+    "int16",
+    "float16",
+    "float32",
+]
+
+AUTO_CAPTIONS_LIST = [
+    "off",
+    "check",
+    "always",
+]
+
+SEARCH_KIND_LIST = [
+    "caption",
+    "transcription",
+    "summary",
+]
+
+REPORT_GROUP_LIST = [
+    "channel",
+    "day",
+    "video",
+]
+
+
+def parse_language_list(value: str) -> list[str]:
+    """Parse a comma-separated list of language codes, without duplicates.
+
+    Args:
+        value: The list as given on the command line, such as 'en-US,pt-BR'.
+
+    Returns:
+        The language codes, in the given order.
+
+    Raises:
+        argparse.ArgumentTypeError: If the list has no language code.
+
+    """
+    languages: list[str] = list(
+        dict.fromkeys(code.strip() for code in value.split(",") if code.strip())
+    )
+    if not languages:
+        raise argparse.ArgumentTypeError("expected at least one language code")
+    return languages
+
 
 def parse_arguments() -> argparse.Namespace:
     """Set up and parse all command-line arguments.
 
     Builds the complete CLI structure, defining the main parser,
-    the 'summarize' and 'config' subparsers, and all their options.
+    the 'summarize', 'config', 'search', 'tune', 'sync', 'watch', 'report'
+    and 'daemon' subparsers, and all their options.
 
     Returns:
         An object containing the parsed command-line arguments.
@@ -73,7 +124,11 @@ def parse_arguments() -> argparse.Namespace:
         help="Summarize a YouTube video from a given URL.",
     )
 
-    parser_summarize.add_argument("url", type=str, help="The URL of the YouTube video.")
+    parser_summarize.add_argument(
+        "url",
+        type=str,
+        help="The URL of the YouTube video, or the path of a local media file.",
+    )
 
     parser_summarize.add_argument(
         "-o",
@@ -141,6 +196,16 @@ def parse_arguments() -> argparse.Namespace:
         help="Specify the Gemini model to use for summarization.",
     )
 
+    parser_summarize.add_argument(
+        "--languages",
+        type=parse_language_list,
+        help=(
+            "Summarize in each of these comma-separated languages, such as "
+            "'en-US,pt-BR,es', from the same transcript (default: the system "
+            "language)."
+        ),
+    )
+
     parser_summarize.add_argument(
         "-w",
         "--whisper-model",
@@ -163,12 +228,95 @@ def parse_arguments() -> argparse.Namespace:
         help="Specify the device for local transcription",
     )
 
+    parser_summarize.add_argument(
+        "--compute-type",
+        type=str,
+        choices=COMPUTE_TYPE_LIST,
+        help="Specify the Whisper quantization for local transcription.",
+    )
+
+    parser_summarize.add_argument(
+        "--auto-captions",
+        type=str,
+        choices=AUTO_CAPTIONS_LIST,
+        help=(
+            "Use auto-generated captions when there are no manual ones: 'check' "
+            "uses them if they pass quality checks (default), 'always' uses "
+            "them as they are, 'off' always transcribes the audio instead."
+        ),
+    )
+
     parser_summarize.add_argument(
         "--no-terminal",
         action="store_true",
         help="Disable printing the final summary to the terminal.",
     )
 
+    parser_summarize.add_argument(
+        "--metrics-out",
+        type=Path,
+        help="Write per-stage timing and resource usage as JSON to this path.",
+    )
+
+    parser_summarize.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=(
+            "Specify the cache root, which may be shared with other users or "
+            "machines (env: CONTENT_SUMMARIZER_CACHE_DIR)."
+        ),
+    )
+
+    parser_summarize.add_argument(
+        "--cache-ttl",
+        type=float,
+        help=(
+            "Keep unused video caches for this many hours, so other runs can "
+            "reuse them (default: 0, removed when the last run finishes)."
+        ),
+    )
+
+    parser_summarize.add_argument(
+        "--cache-max-size",
+        type=float,
+        help=(
+            "Trim the local video caches to this many GB, least recently used "
+            "first (default: 0, no limit)."
+        ),
+    )
+
+    parser_summarize.add_argument(
+        "--context-cache-ttl",
+        type=float,
+        help=(
+            "Upload transcripts once to Gemini's context cache and keep them "
+            "for this many minutes, so later summaries of the same transcript "
+            "with the same Gemini model, such as in other languages, reuse them "
+            "(default: 0, off)."
+        ),
+    )
+
+    parser_summarize.add_argument(
+        "--storage-url",
+        type=str,
+        help=(
+            "Keep artifacts in remote storage, as s3://BUCKET/PREFIX or a "
+            "directory (env: CONTENT_SUMMARIZER_STORAGE_URL)."
+        ),
+    )
+
+    parser_summarize.add_argument(
+        "--storage-endpoint-url",
+        type=str,
+        help="Specify the URL of an S3-compatible service, such as MinIO.",
+    )
+
+    parser_summarize.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run in this process even if the background daemon is running.",
+    )
+
     parser_config = subparsers.add_parser(
         "config",
         help="Specify the default configuration values.",
@@ -214,6 +362,12 @@ def parse_arguments() -> argparse.Namespace:
         help="Specify the default Gemini model to use for summarization.",
     )
 
+    parser_config.add_argument(
+        "--languages",
+        type=parse_language_list,
+        help="Specify the default comma-separated languages of the summaries.",
+    )
+
     parser_config.add_argument(
         "-w",
         "--whisper-model",
@@ -236,4 +390,342 @@ def parse_arguments() -> argparse.Namespace:
         help="Specify the default device for local transcription",
     )
 
+    parser_config.add_argument(
+        "--compute-type",
+        type=str,
+        choices=COMPUTE_TYPE_LIST,
+        help="Specify the default Whisper quantization for local transcription.",
+    )
+
+    parser_config.add_argument(
+        "--auto-captions",
+        type=str,
+        choices=AUTO_CAPTIONS_LIST,
+        help="Specify when auto-generated captions are used by default.",
+    )
+
+    parser_config.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Specify the default cache root, which may be shared.",
+    )
+
+    parser_config.add_argument(
+        "--cache-ttl",
+        type=float,
+        help="Specify the default hours unused video caches are kept.",
+    )
+
+    parser_config.add_argument(
+        "--cache-max-size",
+        type=float,
+        help="Specify the default size limit of the local video caches, in GB.",
+    )
+
+    parser_config.add_argument(
+        "--context-cache-ttl",
+        type=float,
+        help="Specify the default minutes transcripts are kept in Gemini's cache.",
+    )
+
+    parser_config.add_argument(
+        "--storage-url",
+        type=str,
+        help="Specify the default remote storage, as s3://BUCKET/PREFIX or a path.",
+    )
+
+    parser_config.add_argument(
+        "--storage-endpoint-url",
+        type=str,
+        help="Specify the default URL of an S3-compatible service.",
+    )
+
+    subparsers.add_parser(
+        "daemon",
+        help=(
+            "Run a background process that keeps models and caches warm. "
+            "The summarize command forwards to it while it is running."
+        ),
+    )
+
+    parser_search = subparsers.add_parser(
+        "search",
+        help="Search the cached captions, transcriptions and summaries.",
+    )
+
+    parser_search.add_argument(
+        "query", type=str, nargs="+", help="The terms to search for."
+    )
+
+    parser_search.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        default=10,
+        help="Specify the maximum number of results (default: 10).",
+    )
+
+    parser_search.add_argument(
+        "--kind",
+        type=str,
+        choices=SEARCH_KIND_LIST,
+        help="Only search one type of cached text.",
+    )
+
+    parser_tune = subparsers.add_parser(
+        "tune",
+        help=(
+            "Measure transcription accuracy against speed on a reference clip "
+            "and save the best settings as defaults."
+        ),
+    )
+
+    parser_tune.add_argument(
+        "audio", type=Path, help="A reference audio file of a few minutes."
+    )
+
+    parser_tune.add_argument(
+        "reference", type=Path, help="A text file with the exact words spoken."
+    )
+
+    parser_tune.add_argument(
+        "-w",
+        "--whisper-models",
+        type=str,
+        nargs="+",
+        choices=WHISPER_MODEL_LIST,
+        default=["tiny", "base", "small"],
+        help="Specify the Whisper models to try (default: tiny base small).",
+    )
+
+    parser_tune.add_argument(
+        "-b",
+        "--beam-sizes",
+        type=int,
+        nargs="+",
+        default=[1, 5],
+        help="Specify the beam sizes to try (default: 1 5).",
+    )
+
+    parser_tune.add_argument(
+        "-s",
+        "--speed-factors",
+        type=float,
+        nargs="+",
+        default=[1.0, 1.25, 1.5, 2.0],
+        help="Specify the speed factors to try (default: 1.0 1.25 1.5 2.0).",
+    )
+
+    parser_tune.add_argument(
+        "--compute-types",
+        type=str,
+        nargs="+",
+        choices=COMPUTE_TYPE_LIST,
+        default=["int8", "float32"],
+        help="Specify the Whisper quantizations to try (default: int8 float32).",
+    )
+
+    parser_tune.add_argument(
+        "--device",
+        type=str,
+        choices=DEVICES_LIST,
+        default="cpu",
+        help="Specify the device to tune for (default: cpu).",
+    )
+
+    parser_tune.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Specify how many trials run in parallel (default: 2).",
+    )
+
+    parser_tune.add_argument(
+        "--wer-tolerance",
+        type=float,
+        default=0.01,
+        help=(
+            "Accept a word error rate this much above the best one in exchange "
+            "for speed (default: 0.01)."
+        ),
+    )
+
+    parser_tune.add_argument(
+        "--json",
+        type=Path,
+        help="Write every trial and its scores as JSON to this path.",
+    )
+
+    parser_tune.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report the results without changing the configuration.",
+    )
+
+    parser_sync = subparsers.add_parser(
+        "sync",
+        help=(
+            "Summarize the videos of playlists or channels that are not "
+            "summarized yet with the current settings."
+        ),
+    )
+
+    parser_sync.add_argument(
+        "sources",
+        type=str,
+        nargs="+",
+        help="The URLs of the YouTube playlists or channels.",
+    )
+
+    parser_sync.add_argument(
+        "-o",
+        "--output-path",
+        type=Path,
+        help="Specify a custom directory for output files.",
+    )
+
+    parser_sync.add_argument(
+        "-a",
+        "--api",
+        action="store_true",
+        help="Use a remote API for transcription instead of local processing.",
+    )
+
+    parser_sync.add_argument(
+        "-q",
+        "--quiet",
+        action="count",
+        default=0,
+        help="Decrease console verbosity. Use -q for warnings/errors, -qq for silent.",
+    )
+
+    parser_sync.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        help="Summarize at most this many new videos.",
+    )
+
+    parser_sync.add_argument(
+        "--stop-after-known",
+        type=int,
+        default=20,
+        help=(
+            "Stop listing a channel after this many summarized videos in a "
+            "row, 0 to list every video (default: 20). Playlists are always "
+            "listed in full."
+        ),
+    )
+
+    parser_sync.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Specify how many videos are summarized in parallel (default: 1).",
+    )
+
+    parser_sync.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List the new videos without summarizing them.",
+    )
+
+    parser_watch = subparsers.add_parser(
+        "watch",
+        help=(
+            "Summarize the audio and video files that appear in a folder, "
+            "such as local recordings."
+        ),
+    )
+
+    parser_watch.add_argument(
+        "directory",
+        type=Path,
+        help="The folder to watch for media files.",
+    )
+
+    parser_watch.add_argument(
+        "-o",
+        "--output-path",
+        type=Path,
+        help="Specify a custom directory for output files.",
+    )
+
+    parser_watch.add_argument(
+        "-a",
+        "--api",
+        action="store_true",
+        help="Use a remote API for transcription instead of local processing.",
+    )
+
+    parser_watch.add_argument(
+        "-q",
+        "--quiet",
+        action="count",
+        default=0,
+        help="Decrease console verbosity. Use -q for warnings/errors, -qq for silent.",
+    )
+
+    parser_watch.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="Watch the subfolders too.",
+    )
+
+    parser_watch.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Specify how many files are summarized in parallel (default: 1).",
+    )
+
+    parser_watch.add_argument(
+        "--interval",
+        type=float,
+        default=5.0,
+        help=(
+            "Specify the seconds between two scans of the folder (default: 5). "
+            "A file is summarized once it is unchanged between two scans."
+        ),
+    )
+
+    parser_watch.add_argument(
+        "--once",
+        action="store_true",
+        help="Summarize the files present in the folder, then exit.",
+    )
+
+    parser_report = subparsers.add_parser(
+        "report",
+        help="Report the tokens, audio, compute time and cost spent on videos.",
+    )
+
+    parser_report.add_argument(
+        "--by",
+        type=str,
+        choices=REPORT_GROUP_LIST,
+        default="day",
+        help=(
+            "Group the usage by channel, by day or by video, the most "
+            "expensive first (default: day)."
+        ),
+    )
+
+    parser_report.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="Only count the usage from this date on, as YYYY-MM-DD.",
+    )
+
+    parser_report.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        default=20,
+        help="Specify the maximum number of rows (default: 20).",
+    )
+
     return parser.parse_args()
@@ -12,7 +12,13 @@ Classes:
 Functions:
     build_app_config: Initializes and returns the main AppConfig object.
     summarize_video_pipeline: Runs the complete video summarization workflow.
+    run_pipeline: Runs the summarization workflow with a prebuilt AppConfig.
+    copy_app_config: Copies an AppConfig to summarize another video alongside.
+    find_summarized_video_ids: Lists the videos already summarized in every
+        configured language.
+    print_summary: Renders a summary as Markdown in the terminal.
     handle_config_command: Processes and saves user configuration settings.
+    handle_search_command: Searches the cached texts and prints ranked results.
 """
 # Copyright 2025 Gabriel Carvalho
 #
@@ -29,32 +35,63 @@ Functions:
 # limitations under the License.
 
 import argparse
+import contextlib
+import contextvars
+import copy
+import functools
 import locale
 import logging
 import os
+import sqlite3
+import time
+import uuid
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from shutil import rmtree
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import google.generativeai as genai
-from dotenv import load_dotenv
-from google.generativeai.generative_models import GenerativeModel
-from rich.console import Console
-from rich.markdown import Markdown
-
-from content_summarizer.data.data_models import VideoMetadata
+from content_summarizer.data.data_models import (
+    SummaryResult,
+    Transcript,
+    VideoMetadata,
+)
 from content_summarizer.managers.cache_manager import CacheManager
 from content_summarizer.managers.config_manager import ConfigManager
 from content_summarizer.managers.path_manager import PathManager
+from content_summarizer.managers.search_index import (
+    MATCH_END,
+    MATCH_START,
+    SearchHit,
+    SearchIndex,
+)
+from content_summarizer.managers.storage_backend import (
+    BaseStorageBackend,
+    open_storage_backend,
+)
+from content_summarizer.managers.transcript_store import TranscriptStore
+from content_summarizer.managers.usage_ledger import UsageLedger, UsageRecord
 from content_summarizer.processors.audio_processor import AudioProcessor
+from content_summarizer.services.context_cache import GeminiContextCache
+from content_summarizer.services.local_file_service import (
+    LocalFileService,
+    local_source_path,
+)
 from content_summarizer.services.summary_service import generate_summary
 from content_summarizer.services.transcription_service import (
-    fetch_transcription_api,
+    TranscriptionApiClient,
     fetch_transcription_local,
 )
+from content_summarizer.services.video_service_interface import BaseVideoService
 from content_summarizer.services.youtube_service import YoutubeService
+from content_summarizer.utils.file_lock import FileLock
+from content_summarizer.utils.logger_config import log_context
+from content_summarizer.utils.metrics import MetricsRecorder
+from content_summarizer.utils.pricing import estimate_gemini_cost
+
+if TYPE_CHECKING:
+    from google.generativeai.generative_models import GenerativeModel
 
 
 class SetupError(Exception):
@@ -79,10 +116,13 @@ class AppConfig:
     Attributes:
         logger: The configured logger instance for the application.
         path_manager: The manager for all application paths.
-        youtube_service: The service for interacting with YouTube.
+        video_service: The service that loads the video and its audio, from
+            YouTube or from a local file.
         cache_manager: The manager for cache file operations.
         config_manager: The manager for user configuration files.
         gemini_model: The initialized Gemini GenerativeModel instance.
+        transcription_client: The remote transcription client, or None when
+            running in local mode.
         url: The URL of the content to be summarized.
         output_path: The root directory for output files.
         keep_cache: A boolean to prevent cache deletion.
@@ -96,17 +136,36 @@ class AppConfig:
         whisper_model: The name of the local Whisper model being used.
         beam_size: The beam size for local transcription.
         device: The device for local transcription (e.g., 'cuda', 'cpu').
+        compute_type: The Whisper quantization, or None to pick it by device.
+        auto_captions: When auto-generated captions are used instead of a
+            transcription: 'off', 'check' (if they pass quality checks) or
+            'always'.
         no_terminal: A boolean to disable terminal output of the summary.
-        user_language: The detected user system language code.
+        user_language: The language code of the first summary, used to pick
+            captions: the first of 'languages', if given, or the detected
+            system language.
+        languages: The language codes of the summaries to write, all from
+            the same source text.
+        metrics: The recorder of per-stage timing and resource usage.
+        metrics_out: The path of the JSON metrics report, or None to skip it.
+        cache_ttl: The hours an unused video cache is kept, or 0 to remove it
+            as soon as no run uses it.
+        cache_max_size: The size in GB the local video caches are trimmed to,
+            least recently used first, or 0 for no limit.
+        context_cache: The Gemini context cache transcripts are uploaded to
+            once, or None to send them with every summary request.
+        usage_ledger: The ledger recording the tokens, audio and compute
+            time spent on every video.
 
     """
 
     logger: logging.Logger
     path_manager: PathManager
-    youtube_service: YoutubeService
+    video_service: BaseVideoService
     cache_manager: CacheManager
     config_manager: ConfigManager
-    gemini_model: GenerativeModel
+    gemini_model: "GenerativeModel"
+    transcription_client: TranscriptionApiClient | None
     url: str
     output_path: Path | None
     keep_cache: bool
@@ -120,8 +179,17 @@ class AppConfig:
     whisper_model: str
     beam_size: int
     device: str
+    compute_type: str | None
+    auto_captions: str
     no_terminal: bool
     user_language: str
+    languages: list[str]
+    metrics: MetricsRecorder
+    metrics_out: Path | None
+    cache_ttl: float
+    cache_max_size: float
+    context_cache: GeminiContextCache | None
+    usage_ledger: UsageLedger
 
 
 def _resolve_config(
@@ -158,17 +226,31 @@ def _resolve_config(
         "whisper_model": "base",
         "beam_size": 5,
         "device": "auto",
+        "compute_type": None,
+        "auto_captions": "check",
         "no_terminal": False,
+        "metrics_out": None,
+        "cache_dir": None,
+        "cache_ttl": 0.0,
+        "cache_max_size": 0.0,
+        "context_cache_ttl": 0.0,
+        "languages": None,
+        "storage_url": None,
+        "storage_endpoint_url": None,
     }
 
     user_saved_config: dict[str, Any] = config_manager.load_config()
 
     final_config.update(user_saved_config)
 
+    from dotenv import load_dotenv
+
     load_dotenv(path_manager.parent_path / ".env")
     gemini_key: str | None = os.getenv("GEMINI_API_KEY")
     api_url: str | None = os.getenv("API_URL")
     api_key: str | None = os.getenv("TRANSCRIPTION_API_KEY")
+    cache_dir: str | None = os.getenv("CONTENT_SUMMARIZER_CACHE_DIR")
+    storage_url: str | None = os.getenv("CONTENT_SUMMARIZER_STORAGE_URL")
 
     if gemini_key:
         final_config["gemini_key"] = gemini_key
@@ -176,6 +258,10 @@ def _resolve_config(
         final_config["api_url"] = api_url
     if api_key:
         final_config["api_key"] = api_key
+    if cache_dir:
+        final_config["cache_dir"] = cache_dir
+    if storage_url:
+        final_config["storage_url"] = storage_url
 
     dict_args = vars(args)
     for key, value in dict_args.items():
@@ -249,8 +335,93 @@ def _get_user_system_language(logger: logging.Logger) -> str:
     return lang_code.split(".")[0].replace("_", "-")
 
 
-def build_app_config(
+_FAN_OUT_CONTEXT_CACHE_TTL_MINUTES: float = 10.0
+
+GEMINI_MODEL_MAP: dict[str, str] = {
+    "1.0-pro": "models/gemini-1.0-pro",
+    "1.5-flash": "models/gemini-1.5-flash-latest",
+    "1.5-pro": "models/gemini-1.5-pro-latest",
+    "2.5-flash": "models/gemini-2.5-flash",
+    "2.5-pro": "models/gemini-2.5-pro",
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gemini_model(gemini_key: str, gemini_model_name: str) -> "GenerativeModel":
+    """Create a Gemini model, reusing it across runs in the same process."""
+    import google.generativeai as genai
+
+    genai.configure(api_key=gemini_key)
+    return genai.GenerativeModel(GEMINI_MODEL_MAP[gemini_model_name])
+
+
+@functools.lru_cache(maxsize=4)
+def _get_transcription_client(api_url: str, api_key: str) -> TranscriptionApiClient:
+    """Create a transcription API client, reusing its pooled session."""
+    return TranscriptionApiClient(api_url, api_key)
+
+
+@functools.lru_cache(maxsize=2)
+def _get_context_cache(registry_path: Path, ttl_minutes: float) -> GeminiContextCache:
+    """Create a context cache, keeping its models across runs in the process."""
+    return GeminiContextCache(registry_path, ttl_minutes)
+
+
+@functools.lru_cache(maxsize=2)
+def _get_cache_manager(
+    transcript_store_path: Path,
+    search_index_path: Path,
+    cache_dir_path: Path,
+    storage_url: str | None,
+    storage_endpoint_url: str | None,
+) -> CacheManager:
+    """Create a cache manager, keeping its archive index and storage client warm."""
+    storage: BaseStorageBackend | None = (
+        open_storage_backend(storage_url, storage_endpoint_url) if storage_url else None
+    )
+    return CacheManager(
+        TranscriptStore(transcript_store_path),
+        SearchIndex(search_index_path, cache_dir_path),
+        storage,
+    )
+
+
+def resolve_run_config(
     args: argparse.Namespace, logger: logging.Logger, path_manager: PathManager
+) -> dict[str, Any]:
+    """Resolve the configuration of a run so that another process can run it.
+
+    The daemon has its own working directory, environment, '.env' file and
+    locale. Resolving everything on the caller's side, with absolute paths
+    and the caller's system language, lets it run exactly what was asked.
+
+    Args:
+        args: The parsed command-line arguments.
+        logger: The application's logger.
+        path_manager: The application's path manager.
+
+    Returns:
+        The resolved configuration, with every path as an absolute string.
+
+    """
+    config_manager: ConfigManager = ConfigManager(path_manager.config_file_path)
+    final_config: dict[str, Any] = _resolve_config(args, path_manager, config_manager)
+    for key in ("output_path", "metrics_out", "cache_dir"):
+        if final_config[key]:
+            final_config[key] = str(Path(final_config[key]).expanduser().resolve())
+    local_path: Path | None = local_source_path(final_config.get("url", ""))
+    if local_path is not None:
+        final_config["url"] = str(local_path.resolve())
+    if not final_config["languages"]:
+        final_config["languages"] = [_get_user_system_language(logger)]
+    return final_config
+
+
+def build_app_config(
+    args: argparse.Namespace,
+    logger: logging.Logger,
+    path_manager: PathManager,
+    resolved: bool = False,
 ) -> AppConfig:
     """Initialize and build the complete AppConfig object.
 
@@ -262,42 +433,67 @@ def build_app_config(
         args: The parsed command-line arguments.
         logger: The application's logger.
         path_manager: The application's path manager.
+        resolved: Whether the arguments are a configuration already resolved
+            by resolve_run_config, to use as is without reading the local
+            configuration file and environment.
 
     Returns:
         A populated AppConfig instance with all dependencies.
 
     """
-    GEMINI_MODEL_MAP = {
-        "1.0-pro": "models/gemini-1.0-pro",
-        "1.5-flash": "models/gemini-1.5-flash-latest",
-        "1.5-pro": "models/gemini-1.5-pro-latest",
-        "2.5-flash": "models/gemini-2.5-flash",
-        "2.5-pro": "models/gemini-2.5-pro",
-    }
-
     config_manager: ConfigManager = ConfigManager(path_manager.config_file_path)
-    youtube_service: YoutubeService = YoutubeService()
-    cache_manager: CacheManager = CacheManager()
-
-    final_config: dict[str, Any] = _resolve_config(args, path_manager, config_manager)
+    final_config: dict[str, Any] = (
+        vars(args) if resolved else _resolve_config(args, path_manager, config_manager)
+    )
+    video_service: BaseVideoService = (
+        LocalFileService()
+        if local_source_path(final_config.get("url", ""))
+        else YoutubeService()
+    )
 
     _check_required_config_params(final_config, logger)
 
-    user_language: str = _get_user_system_language(logger)
+    path_manager.set_cache_dir(
+        Path(final_config["cache_dir"]).expanduser()
+        if final_config["cache_dir"]
+        else None
+    )
+    cache_manager: CacheManager = _get_cache_manager(
+        path_manager.transcript_store_path,
+        path_manager.search_index_path,
+        path_manager.cache_dir_path,
+        final_config["storage_url"],
+        final_config["storage_endpoint_url"],
+    )
 
-    genai.configure(api_key=final_config["gemini_key"])
-    gemini_model: GenerativeModel = genai.GenerativeModel(
-        GEMINI_MODEL_MAP[final_config["gemini_model"]]
+    languages: list[str] = final_config["languages"] or [
+        _get_user_system_language(logger)
+    ]
+    # Summaries in several languages share the transcript, which is worth
+    # caching for the few minutes they take even if caching is off.
+    context_cache_ttl: float = final_config["context_cache_ttl"]
+    if context_cache_ttl <= 0 and len(languages) > 1:
+        context_cache_ttl = _FAN_OUT_CONTEXT_CACHE_TTL_MINUTES
+
+    gemini_model: GenerativeModel = _get_gemini_model(
+        final_config["gemini_key"], final_config["gemini_model"]
     )
 
+    transcription_client: TranscriptionApiClient | None = None
+    if final_config["api"]:
+        transcription_client = _get_transcription_client(
+            final_config["api_url"], final_config["api_key"]
+        )
+
     return AppConfig(
         logger=logger,
         path_manager=path_manager,
-        youtube_service=youtube_service,
+        video_service=video_service,
         cache_manager=cache_manager,
         config_manager=config_manager,
         gemini_model=gemini_model,
-        url=final_config["url"],
+        transcription_client=transcription_client,
+        url=final_config.get("url", ""),
         output_path=(
             Path(final_config["output_path"]) if final_config["output_path"] else None
         ),
@@ -311,81 +507,371 @@ def build_app_config(
         gemini_model_name=final_config["gemini_model"],
         whisper_model=final_config["whisper_model"],
         beam_size=final_config["beam_size"],
-        user_language=user_language,
+        user_language=languages[0],
+        languages=languages,
         no_terminal=final_config["no_terminal"],
         device=final_config["device"],
+        compute_type=final_config["compute_type"],
+        auto_captions=final_config["auto_captions"],
+        metrics=MetricsRecorder(),
+        metrics_out=(
+            Path(final_config["metrics_out"]) if final_config["metrics_out"] else None
+        ),
+        cache_ttl=final_config["cache_ttl"],
+        cache_max_size=final_config["cache_max_size"],
+        context_cache=(
+            _get_context_cache(
+                path_manager.context_cache_registry_path, context_cache_ttl
+            )
+            if context_cache_ttl > 0
+            else None
+        ),
+        usage_ledger=UsageLedger(path_manager.usage_ledger_path),
+    )
+
+
+def copy_app_config(
+    config: AppConfig, url: str, video_service: BaseVideoService
+) -> AppConfig:
+    """Copy a configuration for another video, to run it alongside the original.
+
+    The copy shares the settings and the thread-safe clients of the original,
+    but has its own per-video state and never prints its summary.
+
+    Args:
+        config: The configuration to copy.
+        url: The URL or path of the other video.
+        video_service: A new video service for the other video.
+
+    Returns:
+        The configuration for the other video.
+
+    """
+    return replace(
+        config,
+        url=url,
+        path_manager=copy.copy(config.path_manager),
+        video_service=video_service,
+        metrics=MetricsRecorder(),
+        no_terminal=True,
+        metrics_out=None,
+    )
+
+
+def _cache_compute_type(config: AppConfig) -> str | None:
+    """Get the quantization transcripts are cached by, None with the API."""
+    return None if config.api else config.compute_type
+
+
+def find_summarized_video_ids(config: AppConfig) -> set[str]:
+    """Get the IDs of the videos already summarized in every configured language.
+
+    A video missing the summary of any of the languages is not included, so
+    batch commands queue it again and only the missing summaries are made.
+
+    Args:
+        config: The application's configuration object.
+
+    Returns:
+        The IDs of the videos with a summary in each language.
+
+    """
+    search_index: SearchIndex = SearchIndex(config.path_manager.search_index_path)
+    summarized_ids: set[str] | None = None
+    for language in config.languages:
+        summary_name: str = config.path_manager.get_summary_filename(
+            config.gemini_model_name,
+            language,
+            config.whisper_model,
+            config.speed_factor,
+            config.beam_size,
+            _cache_compute_type(config),
+        )
+        language_ids: set[str] = search_index.get_video_ids_with(summary_name)
+        summarized_ids = (
+            language_ids if summarized_ids is None else summarized_ids & language_ids
+        )
+    return summarized_ids or set()
+
+
+def _is_cached(config: AppConfig, file_path: Path) -> bool:
+    """Check that a cache file exists and matches its recorded checksum."""
+    return config.cache_manager.verify_artifact(
+        config.path_manager.metadata_file_path, file_path
+    )
+
+
+def _record_artifact(config: AppConfig, file_path: Path) -> None:
+    """Record a completed cache file's checksum and publish it to storage."""
+    config.cache_manager.record_artifact(
+        config.path_manager.metadata_file_path, file_path
+    )
+    config.cache_manager.publish_artifact(
+        file_path, config.path_manager.get_storage_key(file_path)
+    )
+
+
+def _fetch_cached(config: AppConfig, file_path: Path) -> bool:
+    """Check the local cache for a file, reading through to remote storage.
+
+    Returns:
+        True if a verified file exists locally afterwards, False otherwise.
+
+    """
+    if _is_cached(config, file_path):
+        return True
+    fetched: bool = config.cache_manager.fetch_artifact(
+        config.path_manager.get_storage_key(file_path), file_path
+    )
+    if fetched:
+        config.cache_manager.record_artifact(
+            config.path_manager.metadata_file_path, file_path
+        )
+    return fetched
+
+
+def _produce_once(
+    config: AppConfig, file_path: Path, produce: Callable[[], None]
+) -> None:
+    """Create a cache file unless a verified copy exists, once across runs.
+
+    Concurrent runs needing the same file take turns on its lock. The first
+    one fetches it from remote storage or creates it, and the others find it
+    in the cache once the lock is released instead of creating it again.
+    """
+    if _is_cached(config, file_path):
+        return
+    with config.cache_manager.artifact_lock(file_path):
+        if not _fetch_cached(config, file_path):
+            produce()
+
+
+def _save_cached_text(
+    config: AppConfig, text: str, file_path: Path, log_success: bool
+) -> None:
+    """Save a text artifact to the video cache and to the transcript archive."""
+    config.cache_manager.save_text_file(text, file_path, log_success)
+    _record_artifact(config, file_path)
+    config.cache_manager.archive_text(
+        text, config.path_manager.get_archive_key(file_path)
+    )
+
+
+def _restore_cached_text(config: AppConfig, file_path: Path, log_success: bool) -> bool:
+    """Recreate a missing or damaged text artifact from storage or the archive.
+
+    Returns:
+        True if a verified file exists afterwards, False otherwise.
+
+    """
+    if _fetch_cached(config, file_path):
+        return True
+    restored: bool = config.cache_manager.restore_text_file(
+        config.path_manager.get_archive_key(file_path), file_path, log_success
     )
+    if restored:
+        _record_artifact(config, file_path)
+    return restored
 
 
-def _save_caption(config: AppConfig, caption: str, log_success: bool) -> None:
-    """Save the provided caption text to a cache file."""
-    config.cache_manager.save_text_file(
-        caption, config.path_manager.caption_file_path, log_success
+def _save_caption(config: AppConfig, caption: Transcript, log_success: bool) -> None:
+    """Save the provided caption to the cache, as plain text and with its timing."""
+    caption_segments_path: Path = config.path_manager.caption_segments_file_path
+    config.cache_manager.save_transcript_file(
+        caption, caption_segments_path, log_success
+    )
+    _record_artifact(config, caption_segments_path)
+    _save_cached_text(
+        config,
+        caption.to_text().strip(),
+        config.path_manager.caption_file_path,
+        log_success,
     )
 
 
+def _ensure_audio_downloaded(config: AppConfig) -> None:
+    """Download the original audio if it is not already in the cache."""
+    audio_file_path: Path = config.path_manager.audio_file_path
+
+    def _download() -> None:
+        with (
+            config.metrics.span("download") as stage,
+            config.cache_manager.atomic_path(audio_file_path) as temp_path,
+        ):
+            config.video_service.audio_download(temp_path)
+            stage.add("bytes_downloaded", temp_path.stat().st_size)
+        _record_artifact(config, audio_file_path)
+
+    _produce_once(config, audio_file_path, _download)
+
+
 def _save_accelerated_audio(config: AppConfig, accelerated_audio_path: Path) -> None:
     """Ensure the accelerated audio file exists, creating it if necessary.
 
-    This function orchestrates the audio processing. It first ensures the
-    original audio is downloaded and then accelerates it to the target speed
-    if the accelerated version doesn't already exist in the cache.
+    This function orchestrates the audio processing. If a verified accelerated
+    version isn't already in the cache, it ensures the original audio is
+    downloaded and then accelerates it to the target speed.
     """
-    audio_processor: AudioProcessor = AudioProcessor(
-        config.path_manager.audio_file_path, accelerated_audio_path
+
+    def _accelerate() -> None:
+        _ensure_audio_downloaded(config)
+        with (
+            config.metrics.span("acceleration") as stage,
+            config.cache_manager.atomic_path(accelerated_audio_path) as temp_path,
+        ):
+            AudioProcessor(
+                config.path_manager.audio_file_path, temp_path
+            ).accelerate_audio(config.speed_factor)
+            stage.add("output_bytes", temp_path.stat().st_size)
+        _record_artifact(config, accelerated_audio_path)
+
+    _produce_once(config, accelerated_audio_path, _accelerate)
+
+
+def _save_compressed_audio(config: AppConfig, compressed_audio_path: Path) -> None:
+    """Ensure the compressed upload audio exists, creating it if necessary.
+
+    The remote API only needs speech-quality audio, so the original download is
+    accelerated and transcoded in a single FFmpeg pass instead of going through
+    the intermediate accelerated MP3.
+    """
+
+    def _compress() -> None:
+        _ensure_audio_downloaded(config)
+        with (
+            config.metrics.span("acceleration") as stage,
+            config.cache_manager.atomic_path(compressed_audio_path) as temp_path,
+        ):
+            AudioProcessor(
+                config.path_manager.audio_file_path, temp_path
+            ).compress_audio(config.speed_factor)
+            stage.add("output_bytes", temp_path.stat().st_size)
+        _record_artifact(config, compressed_audio_path)
+
+    _produce_once(config, compressed_audio_path, _compress)
+
+
+def _record_usage(config: AppConfig, usage_record: UsageRecord) -> None:
+    """Add a paid operation to the usage ledger and to the video's metadata.
+
+    Accounting is best effort: a failure to record usage is logged but never
+    fails the summary it accounts for.
+    """
+    try:
+        config.usage_ledger.record(usage_record)
+        config.cache_manager.record_usage(
+            config.path_manager.metadata_file_path, usage_record.totals()
+        )
+    except (sqlite3.Error, OSError):
+        config.logger.warning("Failed to record the usage", exc_info=True)
+
+
+def _video_language(config: AppConfig) -> str | None:
+    """Get the spoken language detected by an earlier transcription, if any."""
+    video_metadata: VideoMetadata | None = config.cache_manager.load_metadata_file(
+        config.path_manager.metadata_file_path
     )
+    return video_metadata.language if video_metadata else None
 
-    if not config.path_manager.audio_file_path.exists():
-        config.youtube_service.audio_download(config.path_manager.audio_file_path)
 
-    if not accelerated_audio_path.exists():
-        audio_processor.accelerate_audio(config.speed_factor)
+def _fetch_transcript(config: AppConfig, audio_path: Path) -> Transcript:
+    """Transcribe the prepared audio file.
+
+    This function selects the appropriate transcription method (local or API)
+    based on the user's configuration and maps the resulting timestamps back to
+    the original, non-accelerated timeline. The language detected by an
+    earlier transcription of the video is passed along, so it is not detected
+    again with other settings.
+    """
+    language: str | None = _video_language(config)
+    if language:
+        config.logger.info("Transcribing in the detected language '%s'", language)
+
+    def _fetch_from_api() -> Transcript:
+        """Handle API transcription, including prerequisite checks."""
+        assert config.transcription_client, "API client is required for API mode"
+        return config.transcription_client.transcribe(audio_path, language)
+
+    transcription_fetcher: dict[bool, Callable[[], Transcript]] = {
+        True: _fetch_from_api,
+        False: lambda: fetch_transcription_local(
+            audio_path,
+            config.whisper_model,
+            config.beam_size,
+            config.device,
+            config.compute_type,
+            language=language,
+        ),
+    }
+
+    selected_fetcher: Callable[[], Transcript] = transcription_fetcher[config.api]
+    with config.metrics.span("transcription") as stage:
+        transcript: Transcript = selected_fetcher()
+        transcript.scale_timestamps(config.speed_factor)
+        audio_seconds: float = transcript.end[-1] if transcript.end else 0.0
+        stage.add("segments", len(transcript.text))
+        stage.add("audio_seconds", audio_seconds)
+    _record_usage(
+        config,
+        UsageRecord(
+            video_id=config.video_service.video_id,
+            author=config.video_service.author,
+            title=config.video_service.title,
+            kind="transcription",
+            model="api" if config.api else config.whisper_model,
+            language=transcript.language,
+            audio_seconds=audio_seconds,
+            compute_seconds=stage.wall_seconds,
+        ),
+    )
+    return transcript
 
 
 def _save_transcription(
     config: AppConfig,
-    accelerated_audio_path: Path,
     transcription_file_path: Path,
+    segments_file_path: Path,
     log_success: bool,
 ) -> None:
-    """Ensure the transcription file exists, creating it if necessary.
+    """Ensure the transcription files exist, creating them if necessary.
 
-    This function orchestrates the transcription process. It selects the
-    appropriate transcription method (local or API) based on the user's
-    configuration and saves the resulting text to a cache file if it
-    doesn't already exist.
+    Both the timed transcript and the plain text are saved to the cache. A
+    cached timed transcript is reused to rebuild a missing plain text file
+    without downloading audio or running Whisper again.
     """
-    if not transcription_file_path.exists():
-
-        def _fetch_from_api() -> str:
-            """Handle API transcription, including prerequisite checks."""
-            assert config.api_url, "API URL is required for API mode"
-            assert config.api_key, "API key is required for API mode"
-            return fetch_transcription_api(
-                config.api_url,
-                accelerated_audio_path,
-                config.api_key,
+    transcript: Transcript | None = None
+    if _fetch_cached(config, segments_file_path):
+        transcript = config.cache_manager.load_transcript_file(segments_file_path)
+
+    if transcript is None:
+        audio_path: Path
+        if config.api:
+            audio_path = config.path_manager.get_compressed_audio_path(
+                config.speed_factor
+            )
+            _save_compressed_audio(config, audio_path)
+        else:
+            audio_path = config.path_manager.get_accelerated_audio_path(
+                config.speed_factor
             )
+            _save_accelerated_audio(config, audio_path)
 
-        transcription_fetcher: dict[bool, Callable[[], str]] = {
-            True: _fetch_from_api,
-            False: lambda: fetch_transcription_local(
-                accelerated_audio_path,
-                config.whisper_model,
-                config.beam_size,
-                config.device,
-            ),
-        }
+        transcript = _fetch_transcript(config, audio_path)
+        config.cache_manager.save_transcript_file(
+            transcript, segments_file_path, log_success
+        )
+        _record_artifact(config, segments_file_path)
 
-        selected_fetcher: Callable[[], str] = transcription_fetcher[config.api]
-        transcription: str = selected_fetcher()
+    if transcript.language:
+        config.cache_manager.record_language(
+            config.path_manager.metadata_file_path, transcript.language
+        )
 
-        if not transcription:
-            raise PipelineError("Failed to fetch transcription")
+    transcription: str = transcript.to_text()
+    if not transcription:
+        raise PipelineError("Failed to fetch transcription")
 
-        config.cache_manager.save_text_file(
-            transcription, transcription_file_path, log_success
-        )
+    _save_cached_text(config, transcription, transcription_file_path, log_success)
 
 
 def _handle_metadata(config: AppConfig, log_success: bool) -> None:
@@ -395,7 +881,9 @@ def _handle_metadata(config: AppConfig, log_success: bool) -> None:
     persistence of the 'keep_cache' flag. It reads any existing metadata to
     check if the cache was previously marked for persistence. The flag is then
     made "sticky," meaning once it's set to True, it will not be reverted to
-    False by subsequent runs that don't use the --keep-cache flag.
+    False by subsequent runs that don't use the --keep-cache flag. The recorded
+    checksums of cached files, the detected language and the usage totals are
+    carried over.
 
     Args:
         config: The application's configuration object, containing all necessary
@@ -403,153 +891,513 @@ def _handle_metadata(config: AppConfig, log_success: bool) -> None:
         log_success: Whether to log a success message upon saving the file.
 
     """
-    _existing_keep_cache: bool = config.cache_manager.read_keep_cache_flag(
-        config.path_manager.metadata_file_path
-    )
-    _final_keep_cache: bool = _existing_keep_cache or config.keep_cache
-    video_metadata: VideoMetadata = VideoMetadata(
-        id=config.youtube_service.video_id,
-        url=config.url,
-        title=config.youtube_service.title,
-        author=config.youtube_service.author,
-        keep_cache=_final_keep_cache,
-    )
+    metadata_file_path: Path = config.path_manager.metadata_file_path
+    with config.cache_manager.artifact_lock(metadata_file_path):
+        existing_metadata: VideoMetadata | None = (
+            config.cache_manager.load_metadata_file(metadata_file_path)
+        )
+        _existing_keep_cache: bool = (
+            existing_metadata is not None and existing_metadata.keep_cache
+        )
+        _final_keep_cache: bool = _existing_keep_cache or config.keep_cache
+        video_metadata: VideoMetadata = VideoMetadata(
+            id=config.video_service.video_id,
+            url=config.url,
+            title=config.video_service.title,
+            author=config.video_service.author,
+            keep_cache=_final_keep_cache,
+            artifacts=existing_metadata.artifacts if existing_metadata else {},
+            language=existing_metadata.language if existing_metadata else None,
+            usage=existing_metadata.usage if existing_metadata else {},
+        )
 
-    config.cache_manager.save_metadata_file(
-        video_metadata,
-        config.path_manager.metadata_file_path,
-        log_success,
-    )
+        config.cache_manager.save_metadata_file(
+            video_metadata, metadata_file_path, log_success
+        )
 
 
 def _prepare_source_file(
-    config: AppConfig, caption: str | None, log_success: bool
+    config: AppConfig, caption: Transcript | None, log_success: bool
 ) -> Path:
     """Prepare the source text file for summarization.
 
-    This function acts as a dispatcher. If a manual caption is available,
+    This function acts as a dispatcher. If a usable caption is available,
     it saves it to a file. Otherwise, it triggers the full audio download
     and transcription pipeline to generate the source file.
 
     Args:
         config: The application's configuration object.
-        caption: The pre-fetched caption text, or None.
+        caption: The pre-fetched timed caption, or None.
         log_success: Whether to log a success message.
 
     Returns:
         The path to the prepared source text file (caption or transcription).
 
     """
-    if caption:
+    if caption is not None:
         _save_caption(config, caption, log_success)
         return config.path_manager.caption_file_path
 
-    accelerated_audio_path: Path = config.path_manager.get_accelerated_audio_path(
-        config.speed_factor
-    )
+    compute_type: str | None = _cache_compute_type(config)
     transcription_file_path: Path = config.path_manager.get_transcription_path(
-        config.whisper_model, config.speed_factor, config.beam_size
+        config.whisper_model, config.speed_factor, config.beam_size, compute_type
     )
-    _save_accelerated_audio(config, accelerated_audio_path)
-    _save_transcription(
-        config, accelerated_audio_path, transcription_file_path, log_success
+    segments_file_path: Path = config.path_manager.get_segments_path(
+        config.whisper_model, config.speed_factor, config.beam_size, compute_type
     )
+    with config.cache_manager.artifact_lock(transcription_file_path):
+        if not _restore_cached_text(config, transcription_file_path, log_success):
+            _save_transcription(
+                config, transcription_file_path, segments_file_path, log_success
+            )
 
     return transcription_file_path
 
 
+def _generate_summary(
+    config: AppConfig,
+    source_path: Path,
+    source_language: str | None,
+    summary_language: str,
+) -> str | None:
+    """Generate a summary with Gemini, recording the tokens and cost it took."""
+    with config.metrics.span("summary") as stage:
+        summary_result: SummaryResult = generate_summary(
+            config.gemini_model,
+            summary_language,
+            source_path,
+            source_language,
+            config.context_cache,
+        )
+        cost: float = estimate_gemini_cost(
+            config.gemini_model_name,
+            summary_result.input_tokens,
+            summary_result.cached_tokens,
+            summary_result.output_tokens,
+        )
+        stage.add("tokens_sent", summary_result.input_tokens)
+        stage.add("tokens_cached", summary_result.cached_tokens)
+        stage.add("tokens_received", summary_result.output_tokens)
+        stage.add("cost_usd", cost)
+    _record_usage(
+        config,
+        UsageRecord(
+            video_id=config.video_service.video_id,
+            author=config.video_service.author,
+            title=config.video_service.title,
+            kind="summary",
+            model=config.gemini_model_name,
+            language=summary_language,
+            input_tokens=summary_result.input_tokens,
+            cached_tokens=summary_result.cached_tokens,
+            output_tokens=summary_result.output_tokens,
+            compute_seconds=stage.wall_seconds,
+            cost_usd=cost,
+        ),
+    )
+    return summary_result.text
+
+
+def _get_summary(
+    config: AppConfig,
+    source_path: Path,
+    source_language: str | None,
+    summary_language: str,
+    log_success: bool,
+) -> str | None:
+    """Load the summary from the cache, or generate and save it.
+
+    Args:
+        config: The application's configuration object.
+        source_path: The path to the source text (caption or transcription).
+        source_language: The language of the source text, if known.
+        summary_language: The language to write the summary in.
+        log_success: Whether to log a success message.
+
+    Returns:
+        The summary text, or None if the model returned no text.
+
+    """
+    summary_file_path: Path = config.path_manager.get_summary_path(
+        config.gemini_model_name,
+        summary_language,
+        config.whisper_model,
+        config.speed_factor,
+        config.beam_size,
+        _cache_compute_type(config),
+    )
+
+    summary: str | None = None
+    with config.cache_manager.artifact_lock(summary_file_path):
+        if _restore_cached_text(config, summary_file_path, log_success):
+            config.logger.info("Summary found in cache, loading from file")
+            with summary_file_path.open("r", encoding="utf-8") as f:
+                summary = f.read()
+
+        if not summary:
+            summary = _generate_summary(
+                config, source_path, source_language, summary_language
+            )
+
+        with config.metrics.span("write"):
+            if summary:
+                _save_cached_text(config, summary, summary_file_path, log_success)
+
+            if summary and config.output_path:
+                summary_output_path: Path = config.path_manager.get_final_summary_path(
+                    config.video_service.title,
+                    config.output_path,
+                    summary_language if len(config.languages) > 1 else None,
+                )
+                # False because we have an better log message literally below
+                config.cache_manager.save_text_file(summary, summary_output_path, False)
+                config.logger.info(f"Summary saved to {summary_output_path}")
+
+    return summary
+
+
+def _get_summaries(
+    config: AppConfig,
+    source_path: Path,
+    source_language: str | None,
+    log_success: bool,
+) -> list[str | None]:
+    """Get the summary in every requested language from the same source.
+
+    The summaries of several languages are generated concurrently, as each
+    one is a single Gemini call and the source text is already prepared.
+
+    Args:
+        config: The application's configuration object.
+        source_path: The path to the source text (caption or transcription).
+        source_language: The language of the source text, if known.
+        log_success: Whether to log a success message.
+
+    Returns:
+        The summary in each language of config.languages, in the same order,
+        or None for those the model returned no text for.
+
+    """
+    if len(config.languages) == 1:
+        return [
+            _get_summary(
+                config, source_path, source_language, config.languages[0], log_success
+            )
+        ]
+
+    config.logger.info("Summarizing in %s", ", ".join(config.languages))
+    with ThreadPoolExecutor(max_workers=len(config.languages)) as executor:
+        # Each task runs in a copy of this context, to keep the log fields.
+        futures: list[Future[str | None]] = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _get_summary,
+                config,
+                source_path,
+                source_language,
+                language,
+                log_success,
+            )
+            for language in config.languages
+        ]
+        return [future.result() for future in futures]
+
+
+def print_summary(summary: str) -> None:
+    """Render the summary as Markdown in the terminal."""
+    from rich.console import Console
+    from rich.markdown import Markdown
+
+    console: Console = Console()
+    markdown_summary: Markdown = Markdown(summary)
+    console.print("-" * console.width)
+    console.print(markdown_summary)
+    console.print("-" * console.width)
+
+
 def summarize_video_pipeline(
-    args: argparse.Namespace, logger: logging.Logger, path_manager: PathManager
-) -> None:
+    args: argparse.Namespace,
+    logger: logging.Logger,
+    path_manager: PathManager,
+    resolved: bool = False,
+) -> list[str | None]:
     """Run the main video summarization pipeline.
 
-    This function orchestrates the entire workflow, from setting up the
-    configuration and loading video info to preparing the source text and
-    generating the final summary. It contains the primary error handling for
-    the application's workflow.
+    This function builds the configuration from the user's arguments and then
+    runs the workflow, from loading video info to preparing the source text and
+    generating the final summary.
 
     Args:
         args: The parsed command-line arguments from the user.
         logger: The application's configured logger.
         path_manager: The application's path manager.
+        resolved: Whether the arguments are a configuration already resolved
+            by resolve_run_config.
+
+    Returns:
+        The generated or cached summary of each configured language, in
+        order, with None where none was produced.
 
     Raises:
         PipelineError: If an error occurs during the main processing stage.
         SetupError: If an error occurs during the initial setup stage.
 
     """
-    config: AppConfig | None = None
+    metrics: MetricsRecorder = MetricsRecorder()
+    metrics.attributes["url"] = args.url
     try:
-        config = build_app_config(args, logger, path_manager)
-        config.youtube_service.load_from_url(config.url)
-        config.path_manager.set_video_id(config.youtube_service.video_id)
+        with metrics.span("setup"):
+            config: AppConfig = replace(
+                build_app_config(args, logger, path_manager, resolved),
+                metrics=metrics,
+            )
     except Exception as e:
         logger.exception("An error occurred during the setup")
+        metrics.attributes["ok"] = False
+        _write_metrics(metrics, args.metrics_out, logger)
         raise SetupError("An error occurred during the setup") from e
 
+    return run_pipeline(config)
+
+
+def _write_metrics(
+    metrics: MetricsRecorder, metrics_out: Path | None, logger: logging.Logger
+) -> None:
+    """Write the metrics report if one was requested, warning on failure."""
+    if not metrics_out:
+        return
     try:
-        _log_success: bool = True
-        if not config.keep_cache:
-            _log_success = False
+        metrics.write_json(metrics_out)
+    except OSError:
+        logger.warning("Failed to write metrics to %s", metrics_out)
+
+
+def run_pipeline(config: AppConfig) -> list[str | None]:
+    """Run the summarization workflow with an already built configuration.
+
+    This is the part of the pipeline shared by the CLI and by callers that
+    assemble their own AppConfig, such as the benchmark harness. It contains
+    the primary error handling for the application's workflow.
+
+    Args:
+        config: The application's configuration object.
+
+    Returns:
+        The generated or cached summary of each configured language, in
+        order, with None where none was produced.
+
+    Raises:
+        PipelineError: If an error occurs during the main processing stage.
+        SetupError: If the video cannot be loaded.
+
+    """
+    with log_context(run_id=uuid.uuid4().hex[:12]):
+        # The report is written even when the run fails, as a partial one.
+        try:
+            try:
+                config.metrics.attributes["url"] = config.url
+                with config.metrics.span("load"):
+                    config.video_service.load_from_url(config.url)
+                video_id: str = config.video_service.video_id
+                config.path_manager.set_video_id(video_id)
+                config.metrics.attributes["video_id"] = video_id
+            except Exception as e:
+                config.metrics.attributes["ok"] = False
+                config.logger.exception("An error occurred during the setup")
+                raise SetupError("An error occurred during the setup") from e
+
+            with log_context(video_id=video_id):
+                return _summarize_loaded_video(config)
+        finally:
+            _write_metrics(config.metrics, config.metrics_out, config.logger)
+
+
+def _evict_video(
+    config: AppConfig, path_manager: PathManager, min_idle_seconds: float
+) -> bool:
+    """Remove a video's cache directory if it is unused, idle and not kept.
+
+    Every run holds a shared lock and a lease on the video while it works on
+    it. The exclusive lock is only available when no local run holds the
+    video, and the leases also account for runs on other machines.
 
-        caption: str | None = config.youtube_service.find_best_captions(
-            config.user_language
+    Args:
+        config: The application's configuration object.
+        path_manager: A path manager set to the video to evict.
+        min_idle_seconds: How long the video must have gone unused.
+
+    Returns:
+        True if the directory was removed, False if it was kept.
+
+    """
+    eviction_lock: FileLock = FileLock(path_manager.video_lock_path)
+    if not eviction_lock.acquire(blocking=False):
+        return False
+    try:
+        cache_manager: CacheManager = config.cache_manager
+        if cache_manager.count_leases(path_manager.lease_dir_path):
+            return False
+        if cache_manager.read_keep_cache_flag(path_manager.metadata_file_path):
+            return False
+        idle_seconds: float = time.time() - cache_manager.last_used(
+            path_manager.lease_dir_path, path_manager.video_dir_path
         )
-        _handle_metadata(config, _log_success)
+        if idle_seconds < min_idle_seconds:
+            return False
+        if path_manager.video_dir_path.exists():
+            rmtree(path_manager.video_dir_path)
+        with contextlib.suppress(OSError):
+            path_manager.lease_dir_path.rmdir()
+        return True
+    finally:
+        eviction_lock.release()
+
+
+def _cached_videos(config: AppConfig) -> list[PathManager]:
+    """List the video caches in the cache root, as path managers set to them."""
+    videos: list[PathManager] = []
+    for video_dir_path in config.path_manager.cache_dir_path.iterdir():
+        # Only directories that look like video caches are ever removed, in
+        # case the cache root is shared with other files.
+        if (video_dir_path / "metadata.json").is_file():
+            videos.append(
+                copy.copy(config.path_manager).set_video_id(video_dir_path.name)
+            )
+    return videos
 
-        source_path = _prepare_source_file(config, caption, _log_success)
 
-        summary_file_path: Path = path_manager.get_summary_path(
-            config.gemini_model_name,
-            config.user_language,
-            config.whisper_model,
-            config.speed_factor,
-            config.beam_size,
+def _directory_size(directory: Path) -> int:
+    """Sum the sizes of the files in a directory tree that may be changing."""
+    size: int = 0
+    for path in directory.rglob("*"):
+        with contextlib.suppress(FileNotFoundError):
+            if path.is_file():
+                size += path.stat().st_size
+    return size
+
+
+def _evict_idle_videos(config: AppConfig) -> None:
+    """Remove every video cache that has gone unused for the cache TTL."""
+    min_idle_seconds: float = config.cache_ttl * 60 * 60
+    evicted: int = sum(
+        _evict_video(config, path_manager, min_idle_seconds)
+        for path_manager in _cached_videos(config)
+    )
+    if evicted:
+        config.logger.info("Evicted %d idle videos from the cache", evicted)
+
+
+def _evict_least_recently_used(config: AppConfig) -> None:
+    """Trim the video caches to the size limit, least recently used first."""
+    max_bytes: float = config.cache_max_size * 1024**3
+    videos: list[tuple[float, int, PathManager]] = [
+        (
+            config.cache_manager.last_used(
+                path_manager.lease_dir_path, path_manager.video_dir_path
+            ),
+            _directory_size(path_manager.video_dir_path),
+            path_manager,
         )
+        for path_manager in _cached_videos(config)
+    ]
+    total_bytes: int = sum(size for _, size, _ in videos)
+    evicted: int = 0
+    for _, size, path_manager in sorted(videos, key=lambda video: video[0]):
+        if total_bytes <= max_bytes:
+            break
+        if _evict_video(config, path_manager, 0):
+            total_bytes -= size
+            evicted += 1
+    if evicted:
+        config.logger.info("Evicted %d videos to fit the cache size limit", evicted)
+
+
+def _release_video_cache(config: AppConfig) -> None:
+    """Clean up the cache after a run released its lease on the video.
+
+    With no cache TTL or size limit, the video's directory is removed as soon
+    as the last run using it finishes. Otherwise videos stay cached for other
+    runs and machines: the ones unused for longer than the TTL are evicted,
+    then the least recently used ones until the caches fit the size limit.
+    Failures are only logged, as the summary was already produced.
+    """
+    try:
+        if config.cache_ttl <= 0 and config.cache_max_size <= 0:
+            if _evict_video(config, config.path_manager, 0):
+                config.logger.info("Cache cleared")
+            elif config.path_manager.video_dir_path.exists():
+                config.logger.info("Cache kept")
+            return
+        if config.cache_ttl > 0:
+            _evict_idle_videos(config)
+        if config.cache_max_size > 0:
+            _evict_least_recently_used(config)
+    except OSError:
+        config.logger.warning("Failed to clean up the cache", exc_info=True)
 
-        summary: str | None = None
-        if summary_file_path.exists():
-            config.logger.info("Summary found in cache, loading from file")
-            with summary_file_path.open("r", encoding="utf-8") as f:
-                summary = f.read()
 
-        if not summary:
-            summary = generate_summary(
-                config.gemini_model,
-                config.user_language,
-                source_path,
-            )
+def _summarize_loaded_video(config: AppConfig) -> list[str | None]:
+    """Summarize the loaded video and clean up its cache afterwards.
 
-        if summary:
-            config.cache_manager.save_text_file(
-                summary, summary_file_path, _log_success
-            )
+    Concurrent runs for the same video share its cache directory, which is
+    only removed once no run uses it anymore.
+
+    Args:
+        config: The application's configuration object, with the video loaded.
+
+    Returns:
+        The generated or cached summary of each configured language, in
+        order, with None where none was produced.
 
-        if summary and not config.no_terminal:
-            console: Console = Console()
-            markdown_summary: Markdown = Markdown(summary)
-            console.print("-" * console.width)
-            console.print(markdown_summary)
-            console.print("-" * console.width)
+    Raises:
+        PipelineError: If an error occurs during the main processing stage.
 
-        if summary and config.output_path:
-            summary_output_path: Path = path_manager.get_final_summary_path(
-                config.youtube_service.title, config.output_path
+    """
+    video_lock: FileLock = FileLock(config.path_manager.video_lock_path, shared=True)
+    video_lock.acquire()
+    try:
+        lease_path: Path = config.cache_manager.acquire_lease(
+            config.path_manager.lease_dir_path
+        )
+    except OSError:
+        video_lock.release()
+        raise
+    try:
+        _log_success: bool = True
+        if not config.keep_cache:
+            _log_success = False
+
+        with config.metrics.span("captions"):
+            caption: Transcript | None = config.video_service.find_best_captions(
+                config.user_language, config.auto_captions
             )
-            # False because we have an better log message literally below
-            config.cache_manager.save_text_file(summary, summary_output_path, False)
-            logger.info(f"Summary saved to {summary_output_path}")
+        _handle_metadata(config, _log_success)
+
+        source_path = _prepare_source_file(config, caption, _log_success)
+        source_language: str | None = (
+            caption.language if caption is not None else _video_language(config)
+        )
+
+        summaries: list[str | None] = _get_summaries(
+            config, source_path, source_language, _log_success
+        )
+
+        if not config.no_terminal:
+            for summary in summaries:
+                if summary:
+                    print_summary(summary)
+
+        config.metrics.attributes["ok"] = True
+        return summaries
 
     except Exception as e:
+        config.metrics.attributes["ok"] = False
         config.logger.exception("An error occurred during the pipeline")
         raise PipelineError("An error occurred during the pipeline:") from e
     finally:
-        _keep_cache: bool = config.cache_manager.read_keep_cache_flag(
-            config.path_manager.metadata_file_path
-        )
-        if path_manager.video_dir_path.exists() and not _keep_cache:
-            rmtree(path_manager.video_dir_path)
-            logger.info("Cache cleared")
+        config.cache_manager.release_lease(lease_path)
+        video_lock.release()
+        _release_video_cache(config)
 
 
 def handle_config_command(
@@ -582,7 +1430,7 @@ def handle_config_command(
                 continue
             if key == "command":
                 continue
-            if key == "output-path":
+            if isinstance(value, Path):
                 current_configs[key] = str(value)
                 continue
             current_configs[key] = value
@@ -592,3 +1440,52 @@ def handle_config_command(
     except OSError:
         logger.exception("Failed to save configuration")
         raise
+
+
+def handle_search_command(
+    args: argparse.Namespace, logger: logging.Logger, path_manager: PathManager
+) -> None:
+    """Search the cached texts and print the ranked results.
+
+    Args:
+        args: The parsed command-line arguments from the user.
+        logger: The application's configured logger.
+        path_manager: The application's path manager.
+
+    Raises:
+        sqlite3.Error: If the search index cannot be queried.
+
+    """
+    search_index: SearchIndex = SearchIndex(path_manager.search_index_path)
+    query: str = " ".join(args.query)
+
+    try:
+        hits: list[SearchHit] = search_index.search(query, args.limit, args.kind)
+    except sqlite3.Error:
+        logger.exception("Failed to search the cache")
+        raise
+
+    if not hits:
+        logger.info('No cached text matches "%s"', query)
+        return
+
+    from rich.console import Console
+    from rich.text import Text
+
+    console: Console = Console()
+    for hit in hits:
+        heading: Text = Text.assemble(
+            (hit.title or hit.video_id, "bold"),
+            f" - {hit.author or 'unknown author'} ({hit.kind})",
+        )
+        snippet: Text = Text()
+        for index, part in enumerate(hit.snippet.replace("\n", " ").split(MATCH_START)):
+            if index:
+                matched, _, part = part.partition(MATCH_END)
+                snippet.append(matched, "bold yellow")
+            snippet.append(part)
+        console.print(heading)
+        if hit.url:
+            console.print(hit.url, style="cyan", markup=False)
+        console.print(snippet)
+        console.print()
@@ -0,0 +1,248 @@
+"""Runs the summarization pipeline in a long-lived background process.
+
+This module provides a small Unix socket server that keeps the Gemini model,
+the Whisper models, the transcription HTTP session and the cache indexes warm
+between runs, and the client used by the 'summarize' command to forward its
+arguments to that server when it is running.
+
+The protocol is newline-delimited JSON: the client sends one request with its
+resolved configuration, and the server streams back log records followed by a
+single result message. Requests are handled one at a time.
+
+The client resolves the configuration itself, from its own configuration
+file, environment, '.env' file, working directory and locale, and sends the
+result with absolute paths and its API keys. The daemon runs every request
+with the configuration it was sent, never with its own, so a request behaves
+as it would in-process. Only credentials read by third-party libraries, such
+as the AWS credentials of an S3 archive, come from the daemon's environment.
+
+Functions:
+    serve_daemon: Runs the daemon server until interrupted.
+    forward_to_daemon: Sends a summarize request to a running daemon.
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import logging
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import IO, Any
+
+from content_summarizer.managers.path_manager import PathManager
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_PATH_ARGS: tuple[str, ...] = ("output_path", "metrics_out", "cache_dir")
+
+
+class DaemonError(Exception):
+    """Custom exception for errors while starting or talking to the daemon."""
+
+
+def _send_message(stream: IO[bytes], message: dict[str, Any]) -> None:
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+class _StreamLogHandler(logging.Handler):
+    """Forwards log records to the connected client as JSON messages."""
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        super().__init__(logging.INFO)
+        self._stream = stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            _send_message(
+                self._stream,
+                {
+                    "type": "log",
+                    "name": record.name,
+                    "level": record.levelno,
+                    "message": record.getMessage(),
+                },
+            )
+        except OSError:
+            self.handleError(record)
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Runs one summarize request and streams its logs and result back."""
+
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        from content_summarizer.core import summarize_video_pipeline
+
+        request: dict[str, Any] = json.loads(self.rfile.readline())
+        run_config: dict[str, Any] = request["config"]
+        for key in _PATH_ARGS:
+            if run_config.get(key) is not None:
+                run_config[key] = Path(run_config[key])
+        # The client renders the summary itself.
+        run_config["no_terminal"] = True
+        args = argparse.Namespace(**run_config)
+
+        root_logger: logging.Logger = logging.getLogger()
+        stream_handler = _StreamLogHandler(self.wfile)
+        root_logger.addHandler(stream_handler)
+        try:
+            summaries: list[str | None] = summarize_video_pipeline(
+                args, self.server.app_logger, self.server.path_manager, resolved=True
+            )
+            result: dict[str, Any] = {
+                "type": "result",
+                "ok": True,
+                "summaries": summaries,
+            }
+        except Exception:
+            result = {"type": "result", "ok": False, "summaries": []}
+        finally:
+            root_logger.removeHandler(stream_handler)
+
+        try:
+            _send_message(self.wfile, result)
+        except OSError:
+            logger.warning("Client disconnected before the result was sent")
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    """A Unix socket server holding the state shared across requests."""
+
+    def __init__(
+        self, socket_path: Path, app_logger: logging.Logger, path_manager: PathManager
+    ) -> None:
+        self.app_logger = app_logger
+        self.path_manager = path_manager
+        super().__init__(str(socket_path), _DaemonRequestHandler)
+
+
+def _is_daemon_listening(socket_path: Path) -> bool:
+    """Check whether a daemon accepts connections on the socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def serve_daemon(app_logger: logging.Logger, path_manager: PathManager) -> None:
+    """Run the daemon server until interrupted.
+
+    The socket is created with owner-only permissions. A socket file left
+    behind by a daemon that is no longer running is replaced.
+
+    Args:
+        app_logger: The application's configured logger.
+        path_manager: The application's path manager.
+
+    Raises:
+        DaemonError: If Unix sockets are unavailable or a daemon is running.
+
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        app_logger.error("The daemon requires Unix domain sockets")
+        raise DaemonError("The daemon requires Unix domain sockets")
+
+    socket_path: Path = path_manager.daemon_socket_path
+    socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    if socket_path.exists():
+        if _is_daemon_listening(socket_path):
+            app_logger.error("A daemon is already listening on %s", socket_path)
+            raise DaemonError("A daemon is already running")
+        socket_path.unlink()
+
+    previous_umask: int = os.umask(0o177)
+    try:
+        server = _DaemonServer(socket_path, app_logger, path_manager)
+    finally:
+        os.umask(previous_umask)
+
+    app_logger.info("Daemon listening on %s", socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        app_logger.info("Daemon stopped")
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def _print_summaries(summaries: list[str | None]) -> None:
+    """Print the summaries the daemon sent back, one per language."""
+    from content_summarizer.core import print_summary
+
+    for summary in summaries:
+        if summary:
+            print_summary(summary)
+
+
+def forward_to_daemon(
+    args: argparse.Namespace, path_manager: PathManager
+) -> bool | None:
+    """Send a summarize request to a running daemon.
+
+    The configuration is resolved locally and sent in full, so the daemon
+    uses this process's configuration file, environment, '.env' file, paths
+    and locale rather than its own. Log records from the daemon are re-emitted
+    through the local loggers, so they honor the local verbosity settings,
+    and the summary of every language is printed locally unless
+    '--no-terminal' was given.
+
+    Args:
+        args: The parsed command-line arguments from the user.
+        path_manager: The application's path manager.
+
+    Returns:
+        True if the daemon completed the request, False if it failed, or None
+        if no daemon is running and the request must run in-process.
+
+    """
+    socket_path: Path = path_manager.daemon_socket_path
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+
+    from content_summarizer.core import resolve_run_config
+
+    run_config: dict[str, Any] = resolve_run_config(
+        args, logging.getLogger(__name__), path_manager
+    )
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path))
+    except OSError:
+        client.close()
+        return None
+
+    with client, client.makefile("rwb") as stream:
+        _send_message(stream, {"config": run_config})
+        for line in stream:
+            message: dict[str, Any] = json.loads(line)
+            if message["type"] == "log":
+                logging.getLogger(message["name"]).log(
+                    message["level"], "%s", message["message"]
+                )
+                continue
+            if not args.no_terminal:
+                _print_summaries(message["summaries"])
+            return bool(message["ok"])
+
+    logging.getLogger(__name__).error("The daemon closed the connection unexpectedly")
+    return False
@@ -18,7 +18,22 @@ and stable data contract.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+from typing import Any, ClassVar
+
+
+@dataclass
+class ArtifactChecksum:
+    """Represents the expected content of a cached file.
+
+    Attributes:
+        sha256: The SHA-256 hex digest of the file content.
+        size: The file size in bytes.
+
+    """
+
+    sha256: str
+    size: int
 
 
 @dataclass
@@ -31,6 +46,12 @@ class VideoMetadata:
         title: The title of the video.
         author: The creator or channel name of the video.
         keep_cache: Used to prevent cache deletion on further runs.
+        artifacts: The checksum of every complete file in the video's cache
+            directory, keyed by file name.
+        language: The spoken language of the video as a Whisper language
+            code, once it has been detected.
+        usage: The tokens, audio seconds, compute seconds and estimated cost
+            spent on the video, summed over its runs.
 
     """
 
@@ -39,3 +60,160 @@ class VideoMetadata:
     title: str
     author: str
     keep_cache: bool
+    artifacts: dict[str, ArtifactChecksum] = field(default_factory=dict)
+    language: str | None = None
+    usage: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "VideoMetadata":
+        """Build the metadata from a dictionary created by dataclasses.asdict().
+
+        Args:
+            data: The serialized metadata. Files written before checksums,
+                languages or usage were recorded have no 'artifacts',
+                'language' or 'usage' entry.
+
+        Returns:
+            The deserialized VideoMetadata instance.
+
+        Raises:
+            KeyError: If a required field is missing.
+            TypeError: If an artifact entry has unexpected fields.
+
+        """
+        return cls(
+            id=data["id"],
+            url=data["url"],
+            title=data["title"],
+            author=data["author"],
+            keep_cache=data.get("keep_cache", False),
+            artifacts={
+                name: ArtifactChecksum(**checksum)
+                for name, checksum in data.get("artifacts", {}).items()
+            },
+            language=data.get("language"),
+            usage=data.get("usage", {}),
+        )
+
+
+@dataclass
+class Transcript:
+    """Represents a timed transcription in a compact, columnar layout.
+
+    Each attribute holding a list is a column, and the values at the same
+    index across columns describe one Whisper segment. Timestamps are in
+    seconds on the original (non-accelerated) timeline of the video.
+
+    Attributes:
+        start: The start time of each segment.
+        end: The end time of each segment.
+        text: The text of each segment.
+        avg_logprob: The average token log probability of each segment.
+        no_speech_prob: The probability that each segment contains no speech.
+        language: The language detected by the transcription model, if known.
+
+    """
+
+    start: list[float] = field(default_factory=list)
+    end: list[float] = field(default_factory=list)
+    text: list[str] = field(default_factory=list)
+    avg_logprob: list[float] = field(default_factory=list)
+    no_speech_prob: list[float] = field(default_factory=list)
+    language: str | None = None
+
+    FORMAT_VERSION: ClassVar[int] = 1
+
+    def append(
+        self,
+        start: float,
+        end: float,
+        text: str,
+        avg_logprob: float = 0.0,
+        no_speech_prob: float = 0.0,
+    ) -> None:
+        """Append one segment to the transcript.
+
+        Args:
+            start: The start time of the segment in seconds.
+            end: The end time of the segment in seconds.
+            text: The text of the segment.
+            avg_logprob: The average token log probability of the segment.
+            no_speech_prob: The probability that the segment contains no speech.
+
+        """
+        self.start.append(round(start, 3))
+        self.end.append(round(end, 3))
+        self.text.append(text)
+        self.avg_logprob.append(round(avg_logprob, 4))
+        self.no_speech_prob.append(round(no_speech_prob, 4))
+
+    def scale_timestamps(self, speed_factor: float) -> None:
+        """Map timestamps from an accelerated audio back to the original timeline.
+
+        Args:
+            speed_factor: The acceleration factor applied to the transcribed audio.
+
+        """
+        self.start = [round(t * speed_factor, 3) for t in self.start]
+        self.end = [round(t * speed_factor, 3) for t in self.end]
+
+    def to_text(self) -> str:
+        """Join the segment texts into the plain transcription text."""
+        return "".join(self.text)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the transcript into a JSON-compatible dictionary."""
+        return {"version": self.FORMAT_VERSION, **asdict(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Transcript":
+        """Build a transcript from a dictionary created by to_dict().
+
+        Args:
+            data: The serialized transcript.
+
+        Returns:
+            The deserialized Transcript instance.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+
+        """
+        transcript = cls(
+            start=list(data["start"]),
+            end=list(data["end"]),
+            text=list(data["text"]),
+            avg_logprob=list(data["avg_logprob"]),
+            no_speech_prob=list(data["no_speech_prob"]),
+            language=data.get("language"),
+        )
+        columns = (
+            transcript.start,
+            transcript.end,
+            transcript.avg_logprob,
+            transcript.no_speech_prob,
+        )
+        if any(len(column) != len(transcript.text) for column in columns):
+            raise ValueError("Transcript columns have different lengths")
+        return transcript
+
+
+@dataclass
+class SummaryResult:
+    """Represents a generated summary and the tokens it consumed.
+
+    Attributes:
+        text: The summary text, or None if the model returned no text.
+        input_tokens: The number of prompt tokens sent to the model,
+            including the cached ones.
+        output_tokens: The number of tokens generated by the model,
+            including its thinking tokens, which are billed as output.
+        cached_tokens: The number of prompt tokens read from the context
+            cache.
+
+    """
+
+    text: str | None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
@@ -19,15 +19,23 @@ core functions. It acts as the primary orchestrator and final error handler.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
 import logging
 import sys
 
 from content_summarizer.cli import parse_arguments
-from content_summarizer.core import handle_config_command, summarize_video_pipeline
 from content_summarizer.managers.path_manager import PathManager
 from content_summarizer.utils.logger_config import setup_logging
 from content_summarizer.utils.warning_config import setup_warnings
 
+# Commands living in their own modules, imported only when they are run.
+_FEATURE_COMMANDS: dict[str, tuple[str, str]] = {
+    "tune": ("content_summarizer.tuning", "handle_tune_command"),
+    "sync": ("content_summarizer.sync", "handle_sync_command"),
+    "watch": ("content_summarizer.watch", "handle_watch_command"),
+    "report": ("content_summarizer.report", "handle_report_command"),
+}
+
 
 def main() -> None:
     """Run the main application logic.
@@ -35,7 +43,9 @@ def main() -> None:
     This function initializes all necessary components (warnings, args, logging),
     acts as a dispatcher to call the correct core function based on the
     user's command, and serves as the final safety net, catching any
-    unhandled exceptions.
+    unhandled exceptions. The core module is imported only after the
+    arguments are parsed, so '--help' and argument errors stay instant.
+    Summarize requests are forwarded to the daemon when one is running.
 
     """
     setup_warnings()
@@ -47,9 +57,40 @@ def main() -> None:
     setup_logging(path_manager.log_file_path, quiet_level)
     logger: logging.Logger = logging.getLogger(__name__)
     try:
+        if args.command == "summarize" and not args.no_daemon:
+            from content_summarizer.daemon import forward_to_daemon
+
+            forwarded: bool | None = forward_to_daemon(args, path_manager)
+            if forwarded is False:
+                raise RuntimeError("The daemon failed to summarize the video")
+            if forwarded:
+                logger.info("Application completed successfully")
+                return
+
+        if args.command == "daemon":
+            from content_summarizer.daemon import serve_daemon
+
+            serve_daemon(logger, path_manager)
+            return
+
+        if args.command in _FEATURE_COMMANDS:
+            module_name, handler_name = _FEATURE_COMMANDS[args.command]
+            handler = getattr(importlib.import_module(module_name), handler_name)
+            handler(args, logger, path_manager)
+            return
+
+        from content_summarizer.core import (
+            handle_config_command,
+            handle_search_command,
+            summarize_video_pipeline,
+        )
+
         if args.command == "config":
             handle_config_command(args, logger, path_manager)
             return
+        if args.command == "search":
+            handle_search_command(args, logger, path_manager)
+            return
         summarize_video_pipeline(args, logger, path_manager)
         logger.info("Application completed successfully")
     except Exception:
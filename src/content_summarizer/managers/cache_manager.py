@@ -1,9 +1,17 @@
 """Manages the creation and writing of cache files.
 
-This module provides a stateless utility class responsible for all
+This module provides a utility class responsible for all
 file-writing operations related to caching (e.g., metadata,
 transcripts, summaries), ensuring that this logic is centralized
-and decoupled from the main application pipeline.
+and decoupled from the main application pipeline. Text artifacts can
+also be archived into a compact TranscriptStore that outlives the
+per-video cache directories, and indexed for full-text search.
+
+Concurrent runs coordinate through per-artifact lock files, so a file needed
+by several runs at once is only created by one of them. Runs also hold lease
+files on the videos they use, so a cache shared by many users or machines
+is only evicted once no run needs it. Completed artifacts can also be
+published to a remote storage backend and fetched back on any machine.
 
 """
 # Copyright 2025 Gabriel Carvalho
@@ -22,16 +30,146 @@ and decoupled from the main application pipeline.
 
 import json
 import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict
 from pathlib import Path
 
-from content_summarizer.data.data_models import VideoMetadata
+from content_summarizer.data.data_models import (
+    ArtifactChecksum,
+    Transcript,
+    VideoMetadata,
+)
+from content_summarizer.managers.search_index import SearchIndex
+from content_summarizer.managers.storage_backend import (
+    BaseStorageBackend,
+    StorageError,
+)
+from content_summarizer.managers.transcript_store import (
+    TranscriptStore,
+    TranscriptStoreError,
+)
+from content_summarizer.utils.file_lock import FileLock
+from content_summarizer.utils.hashing import hash_file
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Leases from other machines cannot be checked for a live process, so they
+# are considered abandoned after this long.
+_LEASE_TIMEOUT_SECONDS: float = 24 * 60 * 60
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory, where the platform allows it."""
+    if os.name == "nt":
+        return
+    fd: int = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 
 class CacheManager:
-    """A stateless utility class for handling cache file operations."""
+    """A utility class for handling cache file operations.
+
+    Attributes:
+        _transcript_store: The optional archive for text artifacts.
+        _search_index: The optional full-text index updated on every save.
+        _storage: The optional remote tier behind the local cache.
+
+    """
+
+    def __init__(
+        self,
+        transcript_store: TranscriptStore | None = None,
+        search_index: SearchIndex | None = None,
+        storage: BaseStorageBackend | None = None,
+    ) -> None:
+        """Initialize the CacheManager.
+
+        Args:
+            transcript_store: The archive used by archive_text() and
+                restore_text_file(). Archiving is disabled when None.
+            search_index: The index updated whenever a caption, transcription,
+                summary or metadata file is saved. Indexing is disabled when None.
+            storage: The backend used by publish_artifact() and
+                fetch_artifact(). The remote tier is disabled when None.
+
+        """
+        self._transcript_store = transcript_store
+        self._search_index = search_index
+        self._storage = storage
+
+    @contextmanager
+    def atomic_path(self, file_path: Path) -> Iterator[Path]:
+        """Provide a temporary path that replaces the file once fully written.
+
+        The caller (or a tool like FFmpeg) writes to the yielded path, which
+        keeps the final suffix so the format can be inferred from it. When the
+        block exits normally, the file is synced to disk and renamed over the
+        destination in one step, so readers never see a partial file. If the
+        block raises, the temporary file is removed and the destination is
+        left untouched.
+
+        Args:
+            file_path: The final destination of the file.
+
+        Yields:
+            The temporary path to write to, in the destination directory.
+
+        Raises:
+            OSError: If the file cannot be synced or renamed.
+
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = file_path.with_name(
+            f".{file_path.stem}.{uuid.uuid4().hex[:8]}.tmp{file_path.suffix}"
+        )
+        try:
+            yield temp_path
+            # Opened for appending, as Windows cannot sync read-only handles.
+            with temp_path.open("ab") as f:
+                os.fsync(f.fileno())
+            temp_path.replace(file_path)
+            _fsync_directory(file_path.parent)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    @contextmanager
+    def artifact_lock(self, file_path: Path) -> Iterator[None]:
+        """Hold the exclusive, cross-process lock of a cache file.
+
+        The lock lives in a hidden file next to the artifact. A run that needs
+        the artifact takes the lock, checks the cache again and only creates
+        the file if it is still missing, so a concurrent run waiting on the
+        same lock reuses the result instead of recomputing it.
+
+        Args:
+            file_path: The cache file to lock.
+
+        Yields:
+            None, while the lock is held.
+
+        Raises:
+            OSError: If the lock file cannot be created.
+
+        """
+        lock: FileLock = FileLock(file_path.with_name(f".{file_path.name}.lock"))
+        if not lock.acquire(blocking=False):
+            logger.info("Waiting for another run to finish %s", file_path.name)
+            lock.acquire()
+        try:
+            yield
+        finally:
+            lock.release()
 
     def _write_to_file(
         self, content: str, file_path: Path, log_success: bool = True
@@ -39,7 +177,8 @@ class CacheManager:
         """Private helper method to write text content to a specified file path.
 
         This method is the core of the cache writing logic, handling directory
-        creation and OS-level errors.
+        creation and OS-level errors. The file is replaced atomically, so an
+        interrupted write never leaves a truncated file behind.
 
         Args:
             content: The string content to be written to the file.
@@ -50,9 +189,11 @@ class CacheManager:
             OSError: If the file cannot be written due to I/O or permission issues.
 
         """
-        file_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with file_path.open("w", encoding="utf-8") as f:
+            with (
+                self.atomic_path(file_path) as temp_path,
+                temp_path.open("w", encoding="utf-8") as f,
+            ):
                 f.write(content)
             if log_success:
                 logger.info("File saved successfully to %s", file_path)
@@ -79,12 +220,20 @@ class CacheManager:
         json_content = json.dumps(video_metadata_dict, indent=4)
 
         self._write_to_file(json_content, metadata_file_path, log_success)
+        if self._search_index is not None:
+            try:
+                self._search_index.index_video(video_metadata)
+            except sqlite3.Error:
+                logger.warning("Failed to update the search index", exc_info=True)
 
     def save_text_file(
         self, text: str, text_file_path: Path, log_success: bool = True
     ) -> None:
         """Save a plain text string to a specified file path.
 
+        Captions, transcriptions and summaries inside the cache directory are
+        also added to the search index, if one is configured.
+
         Args:
             text: The text content to save.
             text_file_path: The destination file path.
@@ -92,6 +241,357 @@ class CacheManager:
 
         """
         self._write_to_file(text, text_file_path, log_success)
+        if self._search_index is not None:
+            try:
+                self._search_index.index_file(text, text_file_path)
+            except sqlite3.Error:
+                logger.warning("Failed to update the search index", exc_info=True)
+
+    def save_transcript_file(
+        self,
+        transcript: Transcript,
+        transcript_file_path: Path,
+        log_success: bool = True,
+    ) -> None:
+        """Serialize a Transcript to compact columnar JSON and save it to a file.
+
+        Args:
+            transcript: The timed transcript to be saved.
+            transcript_file_path: The destination file path.
+            log_success: Whether to log a success message.
+
+        """
+        json_content = json.dumps(
+            transcript.to_dict(), ensure_ascii=False, separators=(",", ":")
+        )
+
+        self._write_to_file(json_content, transcript_file_path, log_success)
+
+    def load_transcript_file(self, transcript_file_path: Path) -> Transcript | None:
+        """Safely load a Transcript saved by save_transcript_file().
+
+        Args:
+            transcript_file_path: The path to the transcript file.
+
+        Returns:
+            The deserialized transcript, or None if the file is missing or invalid.
+
+        """
+        try:
+            with transcript_file_path.open("r", encoding="utf-8") as f:
+                return Transcript.from_dict(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+            return None
+
+    def archive_text(self, text: str, archive_key: str) -> None:
+        """Store a text artifact in the compressed archive, if one is configured.
+
+        Failures are logged and ignored, as the archive is only an optimization.
+
+        Args:
+            text: The text content to archive.
+            archive_key: The key under which the text is archived.
+
+        """
+        if self._transcript_store is None:
+            return
+        try:
+            self._transcript_store.put(archive_key, text)
+        except OSError:
+            logger.warning("Failed to archive %s", archive_key, exc_info=True)
+
+    def restore_text_file(
+        self, archive_key: str, text_file_path: Path, log_success: bool = True
+    ) -> bool:
+        """Recreate a missing text file from the compressed archive.
+
+        Args:
+            archive_key: The key under which the text was archived.
+            text_file_path: The destination file path.
+            log_success: Whether to log a success message.
+
+        Returns:
+            True if the file was restored, False if the archive does not have
+            it or its copy cannot be read, so the file is made again.
+
+        """
+        if self._transcript_store is None:
+            return False
+        try:
+            text: str | None = self._transcript_store.get(archive_key)
+        except (TranscriptStoreError, OSError):
+            logger.warning("Failed to read %s from the archive", archive_key)
+            return False
+        if text is None:
+            return False
+        logger.info("Restoring %s from the transcript archive", text_file_path.name)
+        self._write_to_file(text, text_file_path, log_success)
+        return True
+
+    def load_metadata_file(self, metadata_path: Path) -> VideoMetadata | None:
+        """Safely load the metadata saved by save_metadata_file().
+
+        Args:
+            metadata_path: The path to the metadata file.
+
+        Returns:
+            The deserialized metadata, or None if the file is missing or invalid.
+
+        """
+        try:
+            with metadata_path.open("r", encoding="utf-8") as f:
+                return VideoMetadata.from_dict(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def record_artifact(self, metadata_path: Path, file_path: Path) -> None:
+        """Record the checksum and size of a completed cache file.
+
+        Only files recorded here pass verify_artifact(), so this must be called
+        after the file is fully written. The metadata file is locked while it
+        is updated, so concurrent runs do not lose each other's records.
+
+        Args:
+            metadata_path: The path to the metadata file of the video.
+            file_path: The completed file, in the same directory.
+
+        Raises:
+            OSError: If the file cannot be read or the metadata cannot be saved.
+
+        """
+        checksum: ArtifactChecksum = ArtifactChecksum(
+            sha256=hash_file(file_path), size=file_path.stat().st_size
+        )
+        with self.artifact_lock(metadata_path):
+            video_metadata: VideoMetadata | None = self.load_metadata_file(
+                metadata_path
+            )
+            if video_metadata is None:
+                logger.warning("No metadata to record %s in", file_path.name)
+                return
+            video_metadata.artifacts[file_path.name] = checksum
+            self._write_to_file(
+                json.dumps(asdict(video_metadata), indent=4), metadata_path, False
+            )
+
+    def record_language(self, metadata_path: Path, language: str) -> None:
+        """Record the detected spoken language of a video in its metadata.
+
+        Like record_artifact(), the metadata file is locked while it is
+        updated, and it is only rewritten if the language changed.
+
+        Args:
+            metadata_path: The path to the metadata file of the video.
+            language: The Whisper code of the spoken language.
+
+        Raises:
+            OSError: If the metadata cannot be saved.
+
+        """
+        with self.artifact_lock(metadata_path):
+            video_metadata: VideoMetadata | None = self.load_metadata_file(
+                metadata_path
+            )
+            if video_metadata is None or video_metadata.language == language:
+                return
+            video_metadata.language = language
+            self._write_to_file(
+                json.dumps(asdict(video_metadata), indent=4), metadata_path, False
+            )
+
+    def record_usage(self, metadata_path: Path, totals: dict[str, float]) -> None:
+        """Add the usage of an operation to the totals of a video.
+
+        Like record_artifact(), the metadata file is locked while it is
+        updated.
+
+        Args:
+            metadata_path: The path to the metadata file of the video.
+            totals: The quantities to add, such as 'output_tokens'.
+
+        Raises:
+            OSError: If the metadata cannot be saved.
+
+        """
+        with self.artifact_lock(metadata_path):
+            video_metadata: VideoMetadata | None = self.load_metadata_file(
+                metadata_path
+            )
+            if video_metadata is None:
+                return
+            for name, value in totals.items():
+                video_metadata.usage[name] = video_metadata.usage.get(name, 0) + value
+            self._write_to_file(
+                json.dumps(asdict(video_metadata), indent=4), metadata_path, False
+            )
+
+    def verify_artifact(self, metadata_path: Path, file_path: Path) -> bool:
+        """Check that a cache file is complete and matches its recorded checksum.
+
+        Args:
+            metadata_path: The path to the metadata file of the video.
+            file_path: The cache file to check.
+
+        Returns:
+            True if the file can be used, False if it is missing, was never
+            recorded, or does not match its recorded size and checksum.
+
+        """
+        video_metadata: VideoMetadata | None = self.load_metadata_file(metadata_path)
+        expected: ArtifactChecksum | None = (
+            video_metadata.artifacts.get(file_path.name) if video_metadata else None
+        )
+        if expected is None:
+            return False
+        try:
+            if file_path.stat().st_size != expected.size:
+                logger.warning("Discarding truncated cache file %s", file_path.name)
+                return False
+            if hash_file(file_path) != expected.sha256:
+                logger.warning("Discarding corrupted cache file %s", file_path.name)
+                return False
+        except FileNotFoundError:
+            return False
+        return True
+
+    def publish_artifact(self, file_path: Path, storage_key: str) -> None:
+        """Upload a completed cache file to the storage backend, if any.
+
+        Files the backend already holds with the same checksum are skipped.
+        Failures are logged and ignored, as the local file is still usable.
+
+        Args:
+            file_path: The completed cache file.
+            storage_key: The key under which the file is stored.
+
+        """
+        if self._storage is None:
+            return
+        try:
+            sha256: str = hash_file(file_path)
+            if self._storage.get_checksum(storage_key) == sha256:
+                return
+            self._storage.upload_file(file_path, storage_key, sha256)
+        except (OSError, StorageError):
+            logger.warning("Failed to upload %s", storage_key, exc_info=True)
+
+    def fetch_artifact(self, storage_key: str, file_path: Path) -> bool:
+        """Download a missing cache file from the storage backend, if any.
+
+        The download is checked against the checksum it was stored with, and
+        only then moved into place.
+
+        Args:
+            storage_key: The key under which the file is stored.
+            file_path: The destination cache file.
+
+        Returns:
+            True if the file was downloaded, False if it is not available.
+
+        """
+        if self._storage is None:
+            return False
+        try:
+            expected: str | None = self._storage.get_checksum(storage_key)
+            if expected is None:
+                return False
+            with self.atomic_path(file_path) as temp_path:
+                self._storage.download_file(storage_key, temp_path)
+                if hash_file(temp_path) != expected:
+                    msg = f"Downloaded {storage_key} does not match its checksum"
+                    raise StorageError(msg)
+        except (OSError, StorageError):
+            logger.warning("Failed to download %s", storage_key, exc_info=True)
+            return False
+        logger.info("Fetched %s from storage", file_path.name)
+        return True
+
+    def acquire_lease(self, lease_dir: Path) -> Path:
+        """Register the current run as a user of a video's cache.
+
+        Args:
+            lease_dir: The directory holding the video's leases.
+
+        Returns:
+            The path of the new lease, to pass to release_lease().
+
+        Raises:
+            OSError: If the lease file cannot be created.
+
+        """
+        lease_dir.mkdir(parents=True, exist_ok=True)
+        lease_path: Path = lease_dir / (
+            f"{socket.gethostname()}.{os.getpid()}.{uuid.uuid4().hex[:8]}.lease"
+        )
+        lease_path.touch(exist_ok=False)
+        return lease_path
+
+    def release_lease(self, lease_path: Path) -> None:
+        """Unregister a run from a video's cache.
+
+        Args:
+            lease_path: The lease returned by acquire_lease().
+
+        """
+        lease_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _is_stale_lease(lease_path: Path) -> bool:
+        """Check whether a lease was left behind by a run that died."""
+        host, _, pid = lease_path.stem.rpartition(".")[0].rpartition(".")
+        if host == socket.gethostname() and pid.isdigit() and os.name != "nt":
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                return True
+            except PermissionError:
+                pass
+        try:
+            age: float = time.time() - lease_path.stat().st_mtime
+        except FileNotFoundError:
+            return True
+        return age > _LEASE_TIMEOUT_SECONDS
+
+    def count_leases(self, lease_dir: Path) -> int:
+        """Count the runs using a video's cache, dropping abandoned leases.
+
+        Args:
+            lease_dir: The directory holding the video's leases.
+
+        Returns:
+            The number of live leases.
+
+        """
+        if not lease_dir.is_dir():
+            return 0
+        live: int = 0
+        for lease_path in lease_dir.glob("*.lease"):
+            if self._is_stale_lease(lease_path):
+                logger.info("Removing abandoned cache lease %s", lease_path.name)
+                lease_path.unlink(missing_ok=True)
+                continue
+            live += 1
+        return live
+
+    def last_used(self, lease_dir: Path, video_dir: Path) -> float:
+        """Get when a video's cache was last acquired or released by a run.
+
+        Args:
+            lease_dir: The directory holding the video's leases.
+            video_dir: The video's cache directory, used when it has never
+                been leased.
+
+        Returns:
+            The time of the last use, in seconds since the epoch, or 0.0 if
+            neither directory exists.
+
+        """
+        for path in (lease_dir, video_dir):
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+        return 0.0
 
     def read_keep_cache_flag(self, metadata_path: Path) -> bool:
         """Safely reads the 'keep_cache' flag from the metadata file.
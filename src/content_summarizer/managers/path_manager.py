@@ -26,7 +26,12 @@ import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Self
 
-from platformdirs import user_cache_path, user_config_path, user_data_path
+from platformdirs import (
+    user_cache_path,
+    user_config_path,
+    user_data_path,
+    user_runtime_path,
+)
 
 if TYPE_CHECKING:
     from hashlib import _Hash
@@ -45,12 +50,14 @@ class PathManager:
 
     Attributes:
         _video_id: The unique identifier for the content being processed.
+        _cache_dir: The configured cache root, or None to use the user cache.
 
     """
 
     def __init__(self) -> None:
         """Initialize the PathManager."""
         self._video_id: str | None = None
+        self._cache_dir: Path | None = None
 
     @staticmethod
     def _get_params_hash(params: dict[str, str]) -> str:
@@ -102,6 +109,22 @@ class PathManager:
         self._video_id = video_id
         return self
 
+    def set_cache_dir(self, cache_dir: Path | None) -> Self:
+        """Set the root directory of the video caches.
+
+        The root may be shared by several users or machines, such as an NFS
+        export or a volume mounted into many containers.
+
+        Args:
+            cache_dir: The cache root, or None to use the per-user cache.
+
+        Returns:
+            The instance of the PathManager.
+
+        """
+        self._cache_dir = cache_dir
+        return self
+
     def get_accelerated_audio_path(self, speed_factor: float) -> Path:
         """Get the path for the accelerated audio file.
 
@@ -115,8 +138,25 @@ class PathManager:
         _speed_factor = str(speed_factor)
         return self.video_dir_path / f"audio-{_speed_factor}x.mp3"
 
+    def get_compressed_audio_path(self, speed_factor: float) -> Path:
+        """Get the path for the compressed audio file sent to the remote API.
+
+        Args:
+            speed_factor: The playback speed multiplier.
+
+        Returns:
+            The full path for the speed-adjusted, speech-compressed audio file.
+
+        """
+        _speed_factor = str(speed_factor)
+        return self.video_dir_path / f"audio-{_speed_factor}x.opus"
+
     def get_transcription_path(
-        self, whisper_model_name: str, speed_factor: float, beam_size: int
+        self,
+        whisper_model_name: str,
+        speed_factor: float,
+        beam_size: int,
+        compute_type: str | None = None,
     ) -> Path:
         """Get the path for the transcription file based on its parameters.
 
@@ -124,6 +164,8 @@ class PathManager:
             whisper_model_name: The name of the Whisper model used.
             speed_factor: The audio speed factor used.
             beam_size: The beam size used for transcription.
+            compute_type: The Whisper quantization chosen, or None for the
+                default of the device.
 
         Returns:
             The full path for the generated transcription file.
@@ -134,19 +176,54 @@ class PathManager:
             "speed_factor": str(speed_factor),
             "beam_size": str(beam_size),
         }
+        # Left out when not chosen, so existing caches keep their names.
+        if compute_type is not None:
+            params["compute_type"] = compute_type
         return (
             self.video_dir_path / f"transcription-{self._get_params_hash(params)}.txt"
         )
 
-    def get_summary_path(
+    def get_segments_path(
+        self,
+        whisper_model_name: str,
+        speed_factor: float,
+        beam_size: int,
+        compute_type: str | None = None,
+    ) -> Path:
+        """Get the path for the timed transcript file based on its parameters.
+
+        The file shares its parameters hash with the plain transcription file
+        it was generated alongside.
+
+        Args:
+            whisper_model_name: The name of the Whisper model used.
+            speed_factor: The audio speed factor used.
+            beam_size: The beam size used for transcription.
+            compute_type: The Whisper quantization chosen, or None for the
+                default of the device.
+
+        Returns:
+            The full path for the generated timed transcript file.
+
+        """
+        transcription_path: Path = self.get_transcription_path(
+            whisper_model_name, speed_factor, beam_size, compute_type
+        )
+        return transcription_path.with_suffix(".segments.json")
+
+    def get_summary_filename(
         self,
         gemini_model_name: str,
         user_language: str,
         whisper_model_name: str,
         speed_factor: float,
         beam_size: int,
-    ) -> Path:
-        """Get the path for the summary file based on its parameters.
+        compute_type: str | None = None,
+    ) -> str:
+        """Get the filename of the summary file based on its parameters.
+
+        The filename does not depend on the video, so it identifies the
+        settings a summary was made with.
 
         Args:
             gemini_model_name: The name of the Gemini model used.
@@ -154,9 +231,11 @@ class PathManager:
             whisper_model_name: The name of the Whisper model used for the source.
             speed_factor: The audio speed factor used for the source.
             beam_size: The beam size used for the source transcription.
+            compute_type: The Whisper quantization chosen for the source, or
+                None for the default of the device.
 
         Returns:
-            The full path for the generated summary file.
+            The filename of the summary file.
 
         """
         params: dict[str, str] = {
@@ -166,9 +245,72 @@ class PathManager:
             "speed_factor": str(speed_factor),
             "beam_size": str(beam_size),
         }
-        return self.video_dir_path / f"summary-{self._get_params_hash(params)}.md"
+        if compute_type is not None:
+            params["compute_type"] = compute_type
+        return f"summary-{self._get_params_hash(params)}.md"
+
+    def get_summary_path(
+        self,
+        gemini_model_name: str,
+        user_language: str,
+        whisper_model_name: str,
+        speed_factor: float,
+        beam_size: int,
+        compute_type: str | None = None,
+    ) -> Path:
+        """Get the path for the summary file based on its parameters.
+
+        Args:
+            gemini_model_name: The name of the Gemini model used.
+            user_language: The target language of the summary.
+            whisper_model_name: The name of the Whisper model used for the source.
+            speed_factor: The audio speed factor used for the source.
+            beam_size: The beam size used for the source transcription.
+            compute_type: The Whisper quantization chosen for the source, or
+                None for the default of the device.
+
+        Returns:
+            The full path for the generated summary file.
+
+        """
+        return self.video_dir_path / self.get_summary_filename(
+            gemini_model_name,
+            user_language,
+            whisper_model_name,
+            speed_factor,
+            beam_size,
+            compute_type,
+        )
 
-    def get_final_summary_path(self, video_title: str, output_dir: Path) -> Path:
+    def get_archive_key(self, file_path: Path) -> str:
+        """Get the key under which a video's text artifact is archived.
+
+        Args:
+            file_path: The cache path of the artifact.
+
+        Returns:
+            The archive key, made of the video ID and the artifact filename.
+
+        """
+        return f"{self.video_id}/{file_path.name}"
+
+    def get_storage_key(self, file_path: Path) -> str:
+        """Get the key under which a video's artifact is kept in remote storage.
+
+        Storage keys are the same as archive keys.
+
+        Args:
+            file_path: The cache path of the artifact.
+
+        Returns:
+            The storage key, made of the video ID and the artifact filename.
+
+        """
+        return self.get_archive_key(file_path)
+
+    def get_final_summary_path(
+        self, video_title: str, output_dir: Path, language: str | None = None
+    ) -> Path:
         """Get the path for the final, user-facing summary file.
 
         This method generates a sanitized, human-readable filename based on the
@@ -177,12 +319,16 @@ class PathManager:
         Args:
             video_title: The title of the video to be used for the filename.
             output_dir: The target directory where the file will be saved.
+            language: The language of the summary, added to the filename when
+                a video is summarized in several languages.
 
         Returns:
             The full, final path for the summary file.
 
         """
         safe_title: str = self._sanitize_video_title(video_title)
+        if language:
+            return output_dir / f"{safe_title}.{language}.md"
         return output_dir / f"{safe_title}.md"
 
     @property
@@ -231,6 +377,32 @@ class PathManager:
         """
         return self.cache_dir_path / self.video_id
 
+    @property
+    def video_lock_path(self) -> Path:
+        """Get the path of the lock file guarding the video directory.
+
+        It is kept outside the video directory, so it survives the directory
+        being removed while other runs wait on it.
+
+        Returns:
+            Path: The path of the video's lock file.
+
+        """
+        return self.cache_dir_path / ".locks" / f"{self.video_id}.lock"
+
+    @property
+    def lease_dir_path(self) -> Path:
+        """Get the path of the directory holding the video's leases.
+
+        Each run using the video's cache keeps a lease file here, so the cache
+        is only evicted once no run needs it anymore.
+
+        Returns:
+            Path: The path of the video's lease directory.
+
+        """
+        return self.cache_dir_path / ".leases" / self.video_id
+
     @property
     def audio_file_path(self) -> Path:
         """Get the path of the audio file.
@@ -251,6 +423,16 @@ class PathManager:
         """
         return self.video_dir_path / "caption.txt"
 
+    @property
+    def caption_segments_file_path(self) -> Path:
+        """Get the path of the timed caption file.
+
+        Returns:
+            Path: The path of the timed caption file.
+
+        """
+        return self.video_dir_path / "caption.segments.json"
+
     @property
     def metadata_file_path(self) -> Path:
         """Get the path of the metadata file.
@@ -261,6 +443,53 @@ class PathManager:
         """
         return self.video_dir_path / "metadata.json"
 
+    @property
+    def transcript_store_path(self) -> Path:
+        """Get the path of the compressed transcript archive.
+
+        Returns:
+            Path: The path of the transcript archive pack file.
+
+        """
+        return self.cache_dir_path / "transcripts.pack"
+
+    @property
+    def search_index_path(self) -> Path:
+        """Get the path of the full-text search index database.
+
+        The index always stays in the per-user cache, as SQLite databases are
+        not safe to share over network file systems.
+
+        Returns:
+            Path: The path of the search index database.
+
+        """
+        return self.local_cache_dir_path / "search.db"
+
+    @property
+    def context_cache_registry_path(self) -> Path:
+        """Get the path of the registry of Gemini context caches.
+
+        The caches live in Gemini, this file only records their names.
+
+        Returns:
+            Path: The path of the context cache registry.
+
+        """
+        return self.local_cache_dir_path / "context_caches.json"
+
+    @property
+    def usage_ledger_path(self) -> Path:
+        """Get the path of the usage ledger database.
+
+        Like the search index, the ledger stays in the per-user cache.
+
+        Returns:
+            Path: The path of the usage ledger database.
+
+        """
+        return self.local_cache_dir_path / "usage.db"
+
     @property
     def log_file_path(self) -> Path:
         """Get the path of the log file.
@@ -271,6 +500,16 @@ class PathManager:
         """
         return user_data_path(app_name, app_author) / "log.log"
 
+    @property
+    def daemon_socket_path(self) -> Path:
+        """Get the path of the daemon's Unix socket.
+
+        Returns:
+            Path: The path of the daemon's Unix socket.
+
+        """
+        return user_runtime_path(app_name, app_author) / "daemon.sock"
+
     @property
     def config_file_path(self) -> Path:
         """Get the path of the config directory.
@@ -286,7 +525,17 @@ class PathManager:
         """Get the path of the cache directory.
 
         Returns:
-            Path: The path of the cache directory.
+            Path: The configured cache root, or the per-user cache directory.
+
+        """
+        return self._cache_dir or self.local_cache_dir_path
+
+    @property
+    def local_cache_dir_path(self) -> Path:
+        """Get the path of the per-user cache directory.
+
+        Returns:
+            Path: The path of the per-user cache directory.
 
         """
         return user_cache_path(app_name, app_author)
@@ -0,0 +1,255 @@
+"""Maintains a full-text search index over cached text artifacts.
+
+This module provides a SQLite FTS5 index of every caption, transcription and
+summary written to the cache, together with the title and author of their
+videos. The index is updated incrementally as artifacts are saved and lives
+at the root of the cache directory, so it outlives per-video cache cleanup.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+from content_summarizer.data.data_models import VideoMetadata
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5(
+    video_id UNINDEXED,
+    kind UNINDEXED,
+    name UNINDEXED,
+    content,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Snippets mark the matched terms with these private-use characters, which
+# never occur in captions or summaries, so literal brackets in the text are
+# not mistaken for matches. They are removed from indexed texts regardless.
+MATCH_START: str = "\ue000"
+MATCH_END: str = "\ue001"
+_STRIP_MARKERS: dict[int, None] = {ord(MATCH_START): None, ord(MATCH_END): None}
+
+
+@dataclass
+class SearchHit:
+    """Represents one ranked search result.
+
+    Attributes:
+        video_id: The ID of the video the matching artifact belongs to.
+        kind: The artifact type ('caption', 'transcription' or 'summary').
+        title: The title of the video, if known.
+        author: The author of the video, if known.
+        url: The URL of the video, if known.
+        snippet: An excerpt of the artifact around the matching terms, which
+            are enclosed in MATCH_START and MATCH_END.
+        score: The BM25 relevance score, lower is more relevant.
+
+    """
+
+    video_id: str
+    kind: str
+    title: str | None
+    author: str | None
+    url: str | None
+    snippet: str
+    score: float
+
+
+class SearchIndex:
+    """A SQLite FTS5 index of cached captions, transcriptions and summaries.
+
+    Attributes:
+        _db_path: The path to the SQLite database file.
+        _cache_dir: The cache root whose per-video directories are indexed.
+        _schema_ready: Whether the schema was already created by this instance.
+
+    """
+
+    def __init__(self, db_path: Path, cache_dir: Path | None = None) -> None:
+        """Initialize the SearchIndex.
+
+        Args:
+            db_path: The path to the SQLite database file.
+            cache_dir: The cache root. Only artifacts stored in its per-video
+                directories are indexed. Defaults to the database's directory.
+
+        """
+        self._db_path = db_path
+        self._cache_dir: Path = cache_dir or db_path.parent
+        self._schema_ready: bool = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=30)
+        if not self._schema_ready:
+            conn.executescript(_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def _classify(self, file_path: Path) -> tuple[str, str] | None:
+        """Get the video ID and artifact kind of a cache file.
+
+        Returns:
+            A tuple of (video_id, kind), or None if the file is not an indexed
+            artifact of a video directory in this cache.
+
+        """
+        if file_path.parent.parent != self._cache_dir:
+            return None
+        name: str = file_path.name
+        kind: str | None = None
+        if name == "caption.txt":
+            kind = "caption"
+        elif name.startswith("transcription-") and name.endswith(".txt"):
+            kind = "transcription"
+        elif name.startswith("summary-") and name.endswith(".md"):
+            kind = "summary"
+        if kind is None:
+            return None
+        return file_path.parent.name, kind
+
+    def index_file(self, text: str, file_path: Path) -> bool:
+        """Add or replace the indexed content of a cache artifact.
+
+        Args:
+            text: The content of the artifact.
+            file_path: The cache path of the artifact.
+
+        Returns:
+            True if the artifact was indexed, False if it is not indexable.
+
+        """
+        classified = self._classify(file_path)
+        if classified is None:
+            return False
+        video_id, kind = classified
+        text = text.translate(_STRIP_MARKERS)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "DELETE FROM documents WHERE video_id = ? AND name = ?",
+                    (video_id, file_path.name),
+                )
+                conn.execute(
+                    "INSERT INTO documents (video_id, kind, name, content) "
+                    "VALUES (?, ?, ?, ?)",
+                    (video_id, kind, file_path.name, text),
+                )
+        finally:
+            conn.close()
+        return True
+
+    def index_video(self, video_metadata: VideoMetadata) -> None:
+        """Add or update the title, author and URL of a video.
+
+        Args:
+            video_metadata: The metadata of the video.
+
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO videos (video_id, url, title, author) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (video_id) DO UPDATE SET "
+                    "url = excluded.url, title = excluded.title, "
+                    "author = excluded.author",
+                    (
+                        video_metadata.id,
+                        video_metadata.url,
+                        video_metadata.title,
+                        video_metadata.author,
+                    ),
+                )
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_match_expression(query: str) -> str:
+        """Quote every term so user input is never parsed as FTS5 syntax."""
+        terms = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+        return " ".join(terms)
+
+    def search(
+        self, query: str, limit: int = 10, kind: str | None = None
+    ) -> list[SearchHit]:
+        """Search the indexed artifacts.
+
+        All terms must match. Results are ranked by BM25.
+
+        Args:
+            query: The search terms.
+            limit: The maximum number of results.
+            kind: Restrict results to one artifact kind, if given.
+
+        Returns:
+            The ranked list of matching artifacts.
+
+        """
+        match: str = self._to_match_expression(query)
+        if not match:
+            return []
+        sql = (
+            "SELECT documents.video_id, documents.kind, "
+            "videos.title, videos.author, videos.url, "
+            "snippet(documents, 3, ?, ?, '...', 16), bm25(documents) AS score "
+            "FROM documents LEFT JOIN videos USING (video_id) "
+            "WHERE documents MATCH ?"
+        )
+        params: list[str | int] = [MATCH_START, MATCH_END, match]
+        if kind is not None:
+            sql += " AND documents.kind = ?"
+            params.append(kind)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return [SearchHit(*row) for row in rows]
+
+    def get_video_ids_with(self, name: str) -> set[str]:
+        """Get the IDs of the videos that have an indexed artifact of this name.
+
+        Summary filenames only depend on the settings they were made with, so
+        this finds every video already summarized with the given settings.
+
+        Args:
+            name: The filename of the artifact, such as 'summary-1a2b3c4.md'.
+
+        Returns:
+            The IDs of the matching videos.
+
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT DISTINCT video_id FROM documents WHERE name = ?", (name,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return {row[0] for row in rows}
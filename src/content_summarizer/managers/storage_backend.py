@@ -0,0 +1,299 @@
+"""Provides durable object storage behind the local cache.
+
+The local cache directory is the working tier: FFmpeg and Whisper read and
+write real files there. A storage backend is an optional remote tier behind
+it. Completed artifacts are uploaded to it, and artifacts missing from the
+local cache are downloaded from it, so work done on one machine is reused on
+every other machine, even after the container that did it is gone.
+
+Every object is stored with the SHA-256 digest of its content, which is
+checked after each download.
+
+Classes:
+    StorageError: Custom exception for errors while accessing the storage.
+    BaseStorageBackend: The interface of a storage backend.
+    LocalStorageBackend: Stores objects as files under a local directory.
+    S3StorageBackend: Stores objects in an S3-compatible bucket.
+
+Functions:
+    open_storage_backend: Creates the backend for a storage URL.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+# Audio files above this size are uploaded and downloaded in parts, in
+# parallel, so a failed part is retried on its own.
+_MULTIPART_CHUNK_BYTES: int = 8 * 1024 * 1024
+_MULTIPART_CONCURRENCY: int = 4
+
+
+class StorageError(Exception):
+    """Custom exception for errors while accessing the storage backend."""
+
+
+class BaseStorageBackend(ABC):
+    """Abstract base class for storage backends.
+
+    Objects are addressed by keys made of the video ID and the artifact
+    filename, such as 'VIDEO_ID/audio.mp3'.
+    """
+
+    @abstractmethod
+    def get_checksum(self, key: str) -> str | None:
+        """Get the SHA-256 digest an object was stored with.
+
+        Args:
+            key: The key of the object.
+
+        Returns:
+            The hex digest, or None if the object does not exist.
+
+        Raises:
+            StorageError: If the storage cannot be reached.
+
+        """
+        pass
+
+    @abstractmethod
+    def upload_file(self, file_path: Path, key: str, sha256: str) -> None:
+        """Store a local file, replacing any object with the same key.
+
+        Args:
+            file_path: The file to upload.
+            key: The key of the object.
+            sha256: The hex digest of the file, stored with the object.
+
+        Raises:
+            StorageError: If the file cannot be stored.
+
+        """
+        pass
+
+    @abstractmethod
+    def download_file(self, key: str, file_path: Path) -> None:
+        """Copy an object to a local file.
+
+        Args:
+            key: The key of the object.
+            file_path: The destination file.
+
+        Raises:
+            StorageError: If the object cannot be read.
+
+        """
+        pass
+
+
+class LocalStorageBackend(BaseStorageBackend):
+    """Stores objects as files under a directory, such as a mounted volume.
+
+    Each object's digest is kept in a '.sha256' file next to it, written
+    after the object itself, so an interrupted upload is never visible.
+
+    Attributes:
+        _root: The directory holding the objects.
+
+    """
+
+    def __init__(self, root: Path) -> None:
+        """Initialize the LocalStorageBackend.
+
+        Args:
+            root: The directory holding the objects.
+
+        """
+        self._root = root
+
+    def _object_path(self, key: str) -> Path:
+        return self._root / key
+
+    @staticmethod
+    def _replace(source: Path | str, destination: Path) -> None:
+        """Copy a file or text into place through a temporary file."""
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = destination.with_name(
+            f".{destination.name}.{uuid.uuid4().hex[:8]}.tmp"
+        )
+        try:
+            if isinstance(source, Path):
+                shutil.copyfile(source, temp_path)
+            else:
+                temp_path.write_text(source, encoding="utf-8")
+            temp_path.replace(destination)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def get_checksum(self, key: str) -> str | None:
+        """Get the SHA-256 digest an object was stored with."""
+        checksum_path: Path = self._object_path(key).with_name(
+            f"{Path(key).name}.sha256"
+        )
+        try:
+            return checksum_path.read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            raise StorageError(f"Failed to read the checksum of {key}") from e
+
+    def upload_file(self, file_path: Path, key: str, sha256: str) -> None:
+        """Copy a local file into the storage directory."""
+        object_path: Path = self._object_path(key)
+        try:
+            self._replace(file_path, object_path)
+            self._replace(sha256, object_path.with_name(f"{object_path.name}.sha256"))
+        except OSError as e:
+            raise StorageError(f"Failed to store {key}") from e
+
+    def download_file(self, key: str, file_path: Path) -> None:
+        """Copy an object out of the storage directory."""
+        try:
+            shutil.copyfile(self._object_path(key), file_path)
+        except OSError as e:
+            raise StorageError(f"Failed to read {key}") from e
+
+
+class S3StorageBackend(BaseStorageBackend):
+    """Stores objects in an S3-compatible bucket, such as AWS S3 or MinIO.
+
+    Credentials and the region are read by boto3 from the usual AWS
+    environment variables and configuration files. Large files are
+    transferred with parallel multipart uploads and ranged downloads.
+
+    Attributes:
+        _bucket: The name of the bucket.
+        _prefix: The key prefix under which objects are stored.
+        _client: The boto3 S3 client.
+        _transfer_config: The multipart transfer settings.
+        _errors: The boto3 exception types wrapped in StorageError.
+
+    """
+
+    def __init__(
+        self, bucket: str, prefix: str = "", endpoint_url: str | None = None
+    ) -> None:
+        """Initialize the S3StorageBackend.
+
+        Args:
+            bucket: The name of the bucket.
+            prefix: The key prefix under which objects are stored.
+            endpoint_url: The URL of an S3-compatible service, or None for
+                AWS S3.
+
+        Raises:
+            StorageError: If the optional 'boto3' package is not installed.
+
+        """
+        try:
+            import boto3
+            from boto3.exceptions import Boto3Error
+            from boto3.s3.transfer import TransferConfig
+            from botocore.exceptions import BotoCoreError, ClientError
+        except ImportError as e:
+            msg = "The 's3' extra is required to use S3 storage"
+            raise StorageError(msg) from e
+
+        self._bucket = bucket
+        self._prefix = prefix.strip("/")
+        self._client: Any = boto3.client("s3", endpoint_url=endpoint_url)
+        self._transfer_config = TransferConfig(
+            multipart_threshold=_MULTIPART_CHUNK_BYTES,
+            multipart_chunksize=_MULTIPART_CHUNK_BYTES,
+            max_concurrency=_MULTIPART_CONCURRENCY,
+        )
+        self._errors: tuple[type[Exception], ...] = (
+            Boto3Error,
+            BotoCoreError,
+            ClientError,
+        )
+
+    def _object_key(self, key: str) -> str:
+        return f"{self._prefix}/{key}" if self._prefix else key
+
+    def get_checksum(self, key: str) -> str | None:
+        """Get the SHA-256 digest an object was stored with."""
+        try:
+            response: dict[str, Any] = self._client.head_object(
+                Bucket=self._bucket, Key=self._object_key(key)
+            )
+        except self._errors as e:
+            error: dict[str, Any] = getattr(e, "response", {}).get("Error", {})
+            if error.get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise StorageError(f"Failed to look up {key}") from e
+        return response.get("Metadata", {}).get("sha256")
+
+    def upload_file(self, file_path: Path, key: str, sha256: str) -> None:
+        """Upload a local file, in parts if it is large."""
+        try:
+            self._client.upload_file(
+                str(file_path),
+                self._bucket,
+                self._object_key(key),
+                ExtraArgs={"Metadata": {"sha256": sha256}},
+                Config=self._transfer_config,
+            )
+        except self._errors as e:
+            raise StorageError(f"Failed to store {key}") from e
+
+    def download_file(self, key: str, file_path: Path) -> None:
+        """Download an object, in parallel ranges if it is large."""
+        try:
+            self._client.download_file(
+                self._bucket,
+                self._object_key(key),
+                str(file_path),
+                Config=self._transfer_config,
+            )
+        except self._errors as e:
+            raise StorageError(f"Failed to read {key}") from e
+
+
+def open_storage_backend(
+    storage_url: str, endpoint_url: str | None = None
+) -> BaseStorageBackend:
+    """Create the storage backend for a storage URL.
+
+    Args:
+        storage_url: Either 's3://BUCKET/PREFIX' or a local directory, as a
+            path or a 'file://' URL.
+        endpoint_url: The URL of an S3-compatible service, such as a local
+            MinIO server. Only used for 's3://' URLs.
+
+    Returns:
+        The storage backend.
+
+    Raises:
+        StorageError: If the URL scheme is not supported, or its backend's
+            dependencies are not installed.
+
+    """
+    parts = urlsplit(storage_url)
+    if parts.scheme == "s3":
+        if not parts.netloc:
+            raise StorageError(f"No bucket in the storage URL: {storage_url}")
+        return S3StorageBackend(parts.netloc, parts.path, endpoint_url)
+    if parts.scheme == "file":
+        return LocalStorageBackend(Path(unquote(parts.path)))
+    if parts.scheme and len(parts.scheme) > 1:
+        raise StorageError(f"Unsupported storage URL: {storage_url}")
+    # No scheme, or a Windows drive letter.
+    return LocalStorageBackend(Path(storage_url).expanduser())
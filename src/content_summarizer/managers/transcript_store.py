@@ -0,0 +1,228 @@
+"""Provides a packed, compressed store for transcripts and summaries.
+
+This module implements an append-only archive that keeps text artifacts as
+independently compressed blocks in a single pack file, next to an index of
+block offsets. Reads go through a memory map, so looking up one document
+never loads more than its decompressed block, regardless of how many videos
+the archive holds. The index is reloaded when another process appends to it,
+so long-running processes see their blocks too.
+
+Blocks are compressed with Zstandard when the optional 'zstandard' package is
+installed, and with zlib otherwise. The codec is recorded per block, so
+archives written with either codec remain readable.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import zlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from content_summarizer.utils.file_lock import FileLock
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TranscriptStoreError(Exception):
+    """Custom exception for errors while reading or writing the store."""
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    """Describes the location of one compressed block in the pack file."""
+
+    offset: int
+    length: int
+    size: int
+    codec: str
+    sha256: str
+
+
+def _compress(data: bytes) -> tuple[bytes, str]:
+    """Compress a block with the best codec available."""
+    try:
+        import zstandard
+    except ImportError:
+        return zlib.compress(data, 6), "zlib"
+    return zstandard.ZstdCompressor(level=10).compress(data), "zstd"
+
+
+def _decompress(data: bytes | memoryview, codec: str, size: int) -> bytes:
+    """Decompress a block written by _compress()."""
+    if codec == "zlib":
+        try:
+            return zlib.decompress(data)
+        except zlib.error as e:
+            raise TranscriptStoreError("Stored block is corrupt") from e
+    if codec == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            msg = "The 'zstandard' package is required to read this archive"
+            raise TranscriptStoreError(msg) from e
+        try:
+            return zstandard.ZstdDecompressor().decompress(data, max_output_size=size)
+        except zstandard.ZstdError as e:
+            raise TranscriptStoreError("Stored block is corrupt") from e
+    raise TranscriptStoreError(f"Unknown codec: {codec}")
+
+
+class TranscriptStore:
+    """An append-only archive of compressed text documents.
+
+    Documents are addressed by string keys. Writing a key again appends a new
+    block and the index keeps only the latest one; identical content is never
+    written twice.
+
+    Attributes:
+        _pack_path: The path to the pack file holding the compressed blocks.
+        _index_path: The path to the JSON-lines index of block offsets.
+        _index: The in-memory index, loaded lazily on first use.
+        _index_stamp: The size and modification time of the index file when
+            it was loaded, to notice appends by other processes.
+
+    """
+
+    def __init__(self, pack_path: Path) -> None:
+        """Initialize the TranscriptStore.
+
+        Args:
+            pack_path: The path to the pack file. The index is kept next to it
+                with an '.idx' suffix.
+
+        """
+        self._pack_path = pack_path
+        self._index_path = pack_path.with_suffix(".idx")
+        self._index: dict[str, _IndexEntry] | None = None
+        self._index_stamp: tuple[int, int] | None = None
+
+    def _stat_index(self) -> tuple[int, int] | None:
+        try:
+            stat: os.stat_result = self._index_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @property
+    def index(self) -> dict[str, _IndexEntry]:
+        """Get the index, loading it again whenever the index file changed."""
+        stamp: tuple[int, int] | None = self._stat_index()
+        if self._index is None or stamp != self._index_stamp:
+            self._index = self._load_index()
+            self._index_stamp = stamp
+        return self._index
+
+    def _load_index(self) -> dict[str, _IndexEntry]:
+        index: dict[str, _IndexEntry] = {}
+        try:
+            pack_size: int = self._pack_path.stat().st_size
+            with self._index_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        entry = _IndexEntry(**record["entry"])
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        logger.warning("Skipping invalid transcript index record")
+                        continue
+                    if entry.offset + entry.length <= pack_size:
+                        index[record["key"]] = entry
+        except FileNotFoundError:
+            pass
+        return index
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a document is stored under the given key."""
+        return key in self.index
+
+    def put(self, key: str, text: str) -> None:
+        """Compress and append a document to the store.
+
+        Appends are serialized with a lock file, so several processes can
+        share one store.
+
+        Args:
+            key: The key under which the document is stored.
+            text: The document text.
+
+        Raises:
+            OSError: If the pack or index file cannot be written.
+
+        """
+        raw: bytes = text.encode("utf-8")
+        digest: str = hashlib.sha256(raw).hexdigest()
+        existing: _IndexEntry | None = self.index.get(key)
+        if existing is not None and existing.sha256 == digest:
+            return
+
+        block, codec = _compress(raw)
+        with FileLock(self._pack_path.with_suffix(".lock")):
+            with self._pack_path.open("ab") as pack:
+                offset: int = pack.seek(0, os.SEEK_END)
+                pack.write(block)
+                pack.flush()
+                os.fsync(pack.fileno())
+
+            entry = _IndexEntry(
+                offset=offset,
+                length=len(block),
+                size=len(raw),
+                codec=codec,
+                sha256=digest,
+            )
+            record = {"key": key, "entry": asdict(entry)}
+            with self._index_path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.index[key] = entry
+
+    def _read_block(self, view: mmap.mmap, entry: _IndexEntry) -> str:
+        block = memoryview(view)[entry.offset : entry.offset + entry.length]
+        try:
+            raw: bytes = _decompress(block, entry.codec, entry.size)
+        finally:
+            block.release()
+        if len(raw) != entry.size:
+            raise TranscriptStoreError("Stored block has an unexpected size")
+        try:
+            return raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise TranscriptStoreError("Stored block is corrupt") from e
+
+    def get(self, key: str) -> str | None:
+        """Read a document from the store.
+
+        Args:
+            key: The key of the document.
+
+        Returns:
+            The document text, or None if the key is not stored.
+
+        Raises:
+            TranscriptStoreError: If the stored block is corrupt.
+            OSError: If the pack file cannot be read.
+
+        """
+        entry: _IndexEntry | None = self.index.get(key)
+        if entry is None:
+            return None
+        with (
+            self._pack_path.open("rb") as pack,
+            mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_READ) as view,
+        ):
+            return self._read_block(view, entry)
@@ -0,0 +1,231 @@
+"""Records the tokens, audio and compute time spent on every video.
+
+This module provides a SQLite ledger with one row per paid operation: each
+summary generated by Gemini, with its tokens and estimated cost, and each
+transcription, with the seconds of audio it covered and the time it took.
+Work served from the cache costs nothing and is not recorded. The ledger
+lives in the per-user cache next to the search index and, like it, outlives
+the per-video caches, so usage can be aggregated per channel, per day or per
+video long after the files are gone.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sqlite3
+import time
+from dataclasses import astuple, dataclass, field
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    video_id TEXT NOT NULL,
+    author TEXT NOT NULL,
+    title TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    model TEXT NOT NULL,
+    language TEXT,
+    input_tokens INTEGER NOT NULL,
+    cached_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    audio_seconds REAL NOT NULL,
+    compute_seconds REAL NOT NULL,
+    cost_usd REAL NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS usage_recorded_at ON usage (recorded_at);
+"""
+
+# The SQL expression each report groups the rows by, 'all' being the
+# grand total.
+_GROUP_EXPRESSIONS: dict[str, str] = {
+    "all": "'all'",
+    "channel": "author",
+    "day": "date(recorded_at, 'unixepoch', 'localtime')",
+    "video": "video_id",
+}
+
+
+@dataclass
+class UsageRecord:
+    """Represents one paid operation on a video.
+
+    Attributes:
+        video_id: The ID of the video.
+        author: The channel or folder of the video.
+        title: The title of the video.
+        kind: The operation, 'summary' or 'transcription'.
+        model: The Gemini or Whisper model used, or 'api' for the remote
+            transcription API.
+        language: The language of the summary or transcript, if known.
+        input_tokens: The prompt tokens sent, including the cached ones.
+        cached_tokens: The prompt tokens read from the context cache.
+        output_tokens: The tokens generated, thinking included.
+        audio_seconds: The seconds of audio transcribed.
+        compute_seconds: The wall-clock seconds the operation took.
+        cost_usd: The estimated cost in US dollars.
+        recorded_at: When the operation finished, as a Unix timestamp.
+
+    """
+
+    video_id: str
+    author: str
+    title: str
+    kind: str
+    model: str
+    language: str | None = None
+    input_tokens: int = 0
+    cached_tokens: int = 0
+    output_tokens: int = 0
+    audio_seconds: float = 0.0
+    compute_seconds: float = 0.0
+    cost_usd: float = 0.0
+    recorded_at: float = field(default_factory=time.time)
+
+    def totals(self) -> dict[str, float]:
+        """Get the quantities of this record that add up across records."""
+        return {
+            "input_tokens": self.input_tokens,
+            "cached_tokens": self.cached_tokens,
+            "output_tokens": self.output_tokens,
+            "audio_seconds": self.audio_seconds,
+            "compute_seconds": self.compute_seconds,
+            "cost_usd": self.cost_usd,
+        }
+
+
+@dataclass
+class UsageTotals:
+    """Represents the usage of a group of records in a report.
+
+    Attributes:
+        group: The channel, day or video ID of the group.
+        label: A readable name of the group, such as a video's title.
+        videos: The number of distinct videos in the group.
+        summaries: The number of summaries generated.
+        input_tokens: The prompt tokens sent, including the cached ones.
+        cached_tokens: The prompt tokens read from the context cache.
+        output_tokens: The tokens generated.
+        audio_seconds: The seconds of audio transcribed.
+        compute_seconds: The wall-clock seconds spent.
+        cost_usd: The estimated cost in US dollars.
+
+    """
+
+    group: str
+    label: str
+    videos: int
+    summaries: int
+    input_tokens: int
+    cached_tokens: int
+    output_tokens: int
+    audio_seconds: float
+    compute_seconds: float
+    cost_usd: float
+
+
+class UsageLedger:
+    """A SQLite ledger of the tokens, audio and compute spent on videos.
+
+    Attributes:
+        _db_path: The path to the SQLite database file.
+        _schema_ready: Whether the schema was already created by this instance.
+
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the UsageLedger.
+
+        Args:
+            db_path: The path to the SQLite database file.
+
+        """
+        self._db_path = db_path
+        self._schema_ready: bool = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=30)
+        if not self._schema_ready:
+            conn.executescript(_SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def record(self, usage_record: UsageRecord) -> None:
+        """Add a paid operation to the ledger.
+
+        Args:
+            usage_record: The operation to add.
+
+        Raises:
+            sqlite3.Error: If the ledger cannot be written.
+
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO usage (video_id, author, title, kind, model, "
+                    "language, input_tokens, cached_tokens, output_tokens, "
+                    "audio_seconds, compute_seconds, cost_usd, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    astuple(usage_record),
+                )
+        finally:
+            conn.close()
+
+    def aggregate(
+        self, group_by: str, since: float | None = None, limit: int | None = None
+    ) -> list[UsageTotals]:
+        """Sum the recorded usage by channel, day or video.
+
+        Days are listed newest first, channels and videos most expensive
+        first, so the videos that cost the most come at the top.
+
+        Args:
+            group_by: What to group the records by: 'channel', 'day',
+                'video', or 'all' for a single group with the grand total.
+            since: Only count the records made at or after this Unix
+                timestamp, or None to count every record.
+            limit: The maximum number of groups, or None for all of them.
+
+        Returns:
+            The totals of each group.
+
+        Raises:
+            ValueError: If the grouping is not supported.
+            sqlite3.Error: If the ledger cannot be read.
+
+        """
+        if group_by not in _GROUP_EXPRESSIONS:
+            raise ValueError(f"Unsupported grouping: {group_by}")
+        group_expression: str = _GROUP_EXPRESSIONS[group_by]
+        label_expression: str = "MAX(title)" if group_by == "video" else "''"
+        order: str = "grp DESC" if group_by == "day" else "SUM(cost_usd) DESC"
+        query: str = (
+            f"SELECT {group_expression} AS grp, {label_expression}, "
+            "COUNT(DISTINCT video_id), SUM(kind = 'summary'), "
+            "SUM(input_tokens), SUM(cached_tokens), SUM(output_tokens), "
+            "SUM(audio_seconds), SUM(compute_seconds), SUM(cost_usd) "
+            "FROM usage WHERE recorded_at >= ? "
+            f"GROUP BY grp ORDER BY {order} LIMIT ?"
+        )
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                query, (since or 0.0, limit if limit is not None else -1)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [UsageTotals(*row) for row in rows]
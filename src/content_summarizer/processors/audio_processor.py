@@ -1,7 +1,7 @@
 """Handles audio processing operations using FFmpeg.
 
 This module provides a class that wraps FFmpeg command-line operations,
-such as audio acceleration, abstracting the subprocess management
+such as audio acceleration and speech compression, abstracting the subprocess management
 and error handling away from the main application logic.
 
 """
@@ -31,6 +31,45 @@ class AudioProcessingError(Exception):
     """Custom exception for errors during audio processing."""
 
 
+def probe_duration(audio_path: Path) -> float:
+    """Read the duration of an audio file with FFprobe.
+
+    Args:
+        audio_path: The audio file to probe.
+
+    Returns:
+        The duration of the audio in seconds.
+
+    Raises:
+        AudioProcessingError: If the file is not found, if FFprobe is not
+                        installed, or if the duration cannot be read.
+
+    """
+    if not audio_path.exists():
+        logger.error("Input audio file does not exist")
+        raise AudioProcessingError("Input audio file does not exist")
+    ffprobe = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        str(audio_path),
+    ]
+    try:
+        completed = subprocess.run(ffprobe, check=True, capture_output=True, text=True)
+        return float(completed.stdout.strip())
+    except (subprocess.CalledProcessError, ValueError) as e:
+        logger.exception("Failed to read the audio duration")
+        raise AudioProcessingError("Failed to read the audio duration") from e
+    except FileNotFoundError as e:
+        msg = "FFprobe not found. Ensure FFmpeg is installed and in the PATH."
+        logger.exception(msg)
+        raise AudioProcessingError(msg) from e
+
+
 class AudioProcessor:
     """A class to process audio files using FFmpeg.
 
@@ -96,3 +135,109 @@ class AudioProcessor:
             msg = "FFmpeg not found. Ensure it is installed and in the system's PATH."
             logger.exception(msg)
             raise AudioProcessingError(msg) from e
+
+    def extract_audio(self) -> None:
+        """Extract the audio track of a media file into an MP3 file.
+
+        The video track, if any, is dropped. The audio is kept at its original
+        speed, as every acceleration starts from this file.
+
+        Raises:
+            AudioProcessingError: If the input file is not found, if FFmpeg
+                            is not installed, or if the FFmpeg command fails.
+
+        """
+        if not self._input_path.exists():
+            logger.error("Input media file does not exist")
+            raise AudioProcessingError("Input media file does not exist")
+        ffmpeg = [
+            "ffmpeg",
+            "-y",
+            "-i",
+            str(self._input_path),
+            "-vn",
+            "-c:a",
+            "libmp3lame",
+            "-q:a",
+            "2",
+            "-f",
+            "mp3",
+            str(self._output_path),
+        ]
+        try:
+            logger.info("Extracting audio")
+            subprocess.run(ffmpeg, check=True, capture_output=True, text=True)
+            logger.info("Audio extracted successfully")
+        except subprocess.CalledProcessError as e:
+            logger.exception("Audio extraction found an error: %s", e.stderr)
+            raise AudioProcessingError("Audio extraction found an error") from e
+        except FileNotFoundError as e:
+            msg = "FFmpeg not found. Ensure it is installed and in the system's PATH."
+            logger.exception(msg)
+            raise AudioProcessingError(msg) from e
+
+    def compress_audio(
+        self, speed_factor: float, sample_rate: int = 16000, bitrate: str = "24k"
+    ) -> None:
+        """Transcode the audio file into a compact speech-oriented Opus file.
+
+        The acceleration is applied in the same FFmpeg pass, so the remote
+        transcription API receives a mono, low sample rate file that is usually
+        an order of magnitude smaller than the source MP3. The output is
+        bit-exact, so the same source and settings always give the same bytes.
+
+        Args:
+            speed_factor: The factor by which to accelerate the audio (e.g., 1.5).
+            sample_rate: The output sample rate in Hz, Whisper works at 16 kHz.
+            bitrate: The target Opus bitrate.
+
+        Raises:
+            AudioProcessingError: If the input file is not found, if FFmpeg
+                            is not installed, or if the FFmpeg command fails.
+
+        """
+        if not self._input_path.exists():
+            logger.error("Input audio file does not exist")
+            raise AudioProcessingError("Input audio file does not exist")
+        ffmpeg = [
+            "ffmpeg",
+            "-y",
+            "-i",
+            str(self._input_path),
+            "-vn",
+            "-ac",
+            "1",
+            "-ar",
+            str(sample_rate),
+        ]
+        if speed_factor != 1.0:
+            ffmpeg += ["-filter:a", f"atempo={speed_factor}"]
+        ffmpeg += [
+            "-c:a",
+            "libopus",
+            "-b:a",
+            bitrate,
+            "-application",
+            "voip",
+            # Without these, the Ogg muxer picks a random stream serial and
+            # writes the FFmpeg version, so the same source would hash
+            # differently on every encode and the API's dedup would miss.
+            "-fflags",
+            "+bitexact",
+            "-flags:a",
+            "+bitexact",
+            "-f",
+            "ogg",
+            str(self._output_path),
+        ]
+        try:
+            logger.info("Compressing audio for upload")
+            subprocess.run(ffmpeg, check=True, capture_output=True, text=True)
+            logger.info("Audio compressed successfully")
+        except subprocess.CalledProcessError as e:
+            logger.exception("Audio compression found an error: %s", e.stderr)
+            raise AudioProcessingError("Audio compression found an error") from e
+        except FileNotFoundError as e:
+            msg = "FFmpeg not found. Ensure it is installed and in the system's PATH."
+            logger.exception(msg)
+            raise AudioProcessingError(msg) from e
@@ -0,0 +1,117 @@
+"""Reports the tokens, audio, compute time and cost spent on videos.
+
+This module implements the 'report' command. It reads the usage ledger,
+which records every summary generated and every transcription made, and
+prints their totals per channel, per day or per video, so the cost of a
+batch can be budgeted and the videos that cost the most stand out.
+
+Functions:
+    handle_report_command: Prints the usage totals of the ledger.
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import logging
+import sqlite3
+from datetime import datetime
+
+from content_summarizer.managers.path_manager import PathManager
+from content_summarizer.managers.usage_ledger import UsageLedger, UsageTotals
+
+_GROUP_TITLES: dict[str, str] = {
+    "channel": "Channel",
+    "day": "Day",
+    "video": "Video",
+}
+
+
+def _format_duration(seconds: float) -> str:
+    """Format seconds as hours, minutes and seconds."""
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+def _table_row(totals: UsageTotals, name: str) -> list[str]:
+    """Format the totals of a group as the cells of a table row."""
+    return [
+        name,
+        str(totals.videos),
+        str(totals.summaries),
+        f"{totals.input_tokens:,}",
+        f"{totals.cached_tokens:,}",
+        f"{totals.output_tokens:,}",
+        _format_duration(totals.audio_seconds),
+        _format_duration(totals.compute_seconds),
+        f"${totals.cost_usd:,.4f}",
+    ]
+
+
+def handle_report_command(
+    args: argparse.Namespace, logger: logging.Logger, path_manager: PathManager
+) -> None:
+    """Print the usage recorded in the ledger, grouped as requested.
+
+    Args:
+        args: The parsed command-line arguments from the user.
+        logger: The application's configured logger.
+        path_manager: The application's path manager.
+
+    Raises:
+        sqlite3.Error: If the usage ledger cannot be read.
+
+    """
+    ledger: UsageLedger = UsageLedger(path_manager.usage_ledger_path)
+    since: float | None = (
+        datetime.combine(args.since, datetime.min.time()).timestamp()
+        if args.since
+        else None
+    )
+    try:
+        groups: list[UsageTotals] = ledger.aggregate(args.by, since, args.limit)
+        grand_totals: list[UsageTotals] = ledger.aggregate("all", since)
+    except sqlite3.Error:
+        logger.exception("Failed to read the usage ledger")
+        raise
+
+    if not groups:
+        logger.info("No usage recorded yet")
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    table: Table = Table(title="Usage (costs are estimates)", show_footer=True)
+    footer: list[str] = _table_row(grand_totals[0], "Total")
+    for index, header in enumerate(
+        (
+            _GROUP_TITLES[args.by],
+            "Videos",
+            "Summaries",
+            "Input tokens",
+            "Cached tokens",
+            "Output tokens",
+            "Audio",
+            "Compute",
+            "Cost (USD)",
+        )
+    ):
+        table.add_column(
+            header, footer=footer[index], justify="left" if index == 0 else "right"
+        )
+    for totals in groups:
+        name: str = f"{totals.label} ({totals.group})" if totals.label else totals.group
+        table.add_row(*_table_row(totals, name))
+    Console().print(table)
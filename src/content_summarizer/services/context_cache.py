@@ -0,0 +1,258 @@
+"""Uploads transcripts once to Gemini's context cache and reuses them.
+
+Summarizing the same transcript in several languages, or with several
+prompts, sends the same transcript every time. With context caching, the
+transcript is uploaded once as cached content, and every summary request
+refers to it and only sends its own instructions. Cached input tokens are
+billed at a fraction of the normal price and are not uploaded again, which
+makes each extra summary cheaper and faster.
+
+Caches are kept by Gemini until they expire. Their names are recorded in a
+small registry file in the local cache, keyed by the digest of the model and
+the transcript, so later runs in other processes reuse them too.
+
+Classes:
+    ContextCacheError: Custom exception for errors while caching content.
+    BaseCachedContentApi: The interface of a cached-content API.
+    GenaiCachedContentApi: Uses the cached-content API of Gemini.
+    GeminiContextCache: Creates and reuses the caches of transcripts.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from content_summarizer.utils.file_lock import FileLock
+
+if TYPE_CHECKING:
+    from google.generativeai.generative_models import GenerativeModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Gemini rejects cached content below a minimum size, which depends on the
+# model. This is the largest minimum of the supported models, and smaller
+# transcripts are cheap to send anyway.
+MIN_CACHED_TOKENS: int = 4096
+
+# A cache that expires within this many seconds is not reused, so it cannot
+# expire between the lookup and the request.
+_EXPIRY_MARGIN_SECONDS: float = 60.0
+
+
+class ContextCacheError(Exception):
+    """Custom exception for errors while creating or reading cached content."""
+
+
+class BaseCachedContentApi(ABC):
+    """Abstract base class for cached-content APIs."""
+
+    @abstractmethod
+    def create(
+        self, model_name: str, contents: list[str], ttl: timedelta
+    ) -> tuple[str, float]:
+        """Upload contents as a cache for a model.
+
+        Args:
+            model_name: The full name of the model, such as
+                'models/gemini-2.5-flash'.
+            contents: The parts of the content to cache.
+            ttl: How long the cache is kept.
+
+        Returns:
+            The name of the cache and its expiry time as a Unix timestamp.
+
+        Raises:
+            ContextCacheError: If the cache cannot be created.
+
+        """
+        pass
+
+    @abstractmethod
+    def model_from_cache(self, cache_name: str) -> "GenerativeModel":
+        """Create a model whose requests are prefixed with a cache.
+
+        Args:
+            cache_name: The name of the cache.
+
+        Returns:
+            The model to send the summary requests to.
+
+        Raises:
+            ContextCacheError: If the cache no longer exists.
+
+        """
+        pass
+
+
+class GenaiCachedContentApi(BaseCachedContentApi):
+    """Uses the cached-content API of Gemini through google-generativeai."""
+
+    def create(
+        self, model_name: str, contents: list[str], ttl: timedelta
+    ) -> tuple[str, float]:
+        """Upload contents as a cache for a model."""
+        from google.generativeai import caching
+
+        try:
+            cached_content = caching.CachedContent.create(
+                model=model_name,
+                display_name="content-summarizer transcript",
+                contents=contents,
+                ttl=ttl,
+            )
+        except Exception as e:
+            raise ContextCacheError("Failed to create the cached content") from e
+        return cached_content.name, cached_content.expire_time.timestamp()
+
+    def model_from_cache(self, cache_name: str) -> "GenerativeModel":
+        """Create a model whose requests are prefixed with a cache."""
+        import google.generativeai as genai
+
+        try:
+            return genai.GenerativeModel.from_cached_content(cache_name)
+        except Exception as e:
+            raise ContextCacheError("Failed to read the cached content") from e
+
+
+class GeminiContextCache:
+    """Creates the context cache of a transcript once and reuses it.
+
+    Lookups and creations are serialized, within the process by a lock and
+    across processes by a lock on the registry, so summaries of the same
+    transcript started together upload it only once.
+
+    Attributes:
+        _registry_path: The JSON file recording the caches by key.
+        _ttl: How long new caches are kept.
+        _api: The cached-content API.
+        _lock: Serializes the lookups of this process.
+        _models: The models already created for each cache, with the expiry
+            time of the cache. Expired caches are dropped on each lookup, so
+            a long-running daemon only keeps the live ones.
+
+    """
+
+    def __init__(
+        self,
+        registry_path: Path,
+        ttl_minutes: float,
+        api: BaseCachedContentApi | None = None,
+    ) -> None:
+        """Initialize the GeminiContextCache.
+
+        Args:
+            registry_path: The JSON file recording the caches.
+            ttl_minutes: How long new caches are kept, in minutes.
+            api: The cached-content API, Gemini's by default.
+
+        """
+        self._registry_path = registry_path
+        self._ttl = timedelta(minutes=ttl_minutes)
+        self._api: BaseCachedContentApi = api or GenaiCachedContentApi()
+        self._lock = threading.Lock()
+        self._models: dict[str, tuple[GenerativeModel, float]] = {}
+
+    @staticmethod
+    def _cache_key(model_name: str, contents: list[str]) -> str:
+        """Digest the model and contents a cache is made of."""
+        digest = hashlib.sha256(model_name.encode())
+        for part in contents:
+            digest.update(b"\0")
+            digest.update(part.encode())
+        return digest.hexdigest()
+
+    def _load_registry(self) -> dict[str, Any]:
+        """Read the registry, keeping only the caches that are not expiring."""
+        try:
+            with self._registry_path.open("r", encoding="utf-8") as f:
+                registry: dict[str, Any] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        deadline: float = time.time() + _EXPIRY_MARGIN_SECONDS
+        return {
+            key: entry
+            for key, entry in registry.items()
+            if entry.get("expire_time", 0) > deadline
+        }
+
+    def _save_registry(self, registry: dict[str, Any]) -> None:
+        """Replace the registry file."""
+        self._registry_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = self._registry_path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(registry, f)
+        temp_path.replace(self._registry_path)
+
+    def _get_cache(self, model_name: str, contents: list[str]) -> tuple[str, float]:
+        """Find a live cache of the contents, or create one, with its expiry."""
+        key: str = self._cache_key(model_name, contents)
+        registry_lock = FileLock(self._registry_path.with_suffix(".lock"))
+        registry_lock.acquire()
+        try:
+            registry: dict[str, Any] = self._load_registry()
+            if key in registry:
+                logger.info("Reusing the cached transcript")
+                return registry[key]["name"], registry[key]["expire_time"]
+
+            logger.info("Uploading the transcript to the context cache")
+            name, expire_time = self._api.create(model_name, contents, self._ttl)
+            registry[key] = {"name": name, "expire_time": expire_time}
+            self._save_registry(registry)
+            return name, expire_time
+        finally:
+            registry_lock.release()
+
+    def model_for(
+        self, gemini_model: "GenerativeModel", contents: list[str]
+    ) -> "GenerativeModel | None":
+        """Get a model whose requests are prefixed with the cached contents.
+
+        Args:
+            gemini_model: The model the summaries are generated with.
+            contents: The parts of the content to cache, such as a transcript.
+
+        Returns:
+            The model to send requests to, or None if the contents could not
+            be cached, in which case they must be sent with the request.
+
+        """
+        try:
+            with self._lock:
+                deadline: float = time.time() + _EXPIRY_MARGIN_SECONDS
+                for cache_name in [
+                    cache_name
+                    for cache_name, (_, cache_expiry) in self._models.items()
+                    if cache_expiry <= deadline
+                ]:
+                    del self._models[cache_name]
+
+                name, expire_time = self._get_cache(gemini_model.model_name, contents)
+                if name not in self._models:
+                    self._models[name] = (
+                        self._api.model_from_cache(name),
+                        expire_time,
+                    )
+                return self._models[name][0]
+        except (ContextCacheError, OSError):
+            logger.warning("Failed to use the context cache", exc_info=True)
+            return None
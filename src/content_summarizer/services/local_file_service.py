@@ -0,0 +1,178 @@
+"""Provides a service to summarize media files from the local disk.
+
+This module implements the BaseVideoService interface for audio and video
+files that are not on YouTube, such as internal recordings. A file is
+identified by the SHA-256 digest of its content, so a renamed or copied
+recording reuses the cache of the original, and an edited one does not.
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Self
+from urllib.parse import unquote, urlsplit
+
+from content_summarizer.data.data_models import Transcript
+from content_summarizer.processors.audio_processor import AudioProcessor
+from content_summarizer.services.video_service_interface import BaseVideoService
+from content_summarizer.utils.hashing import hash_file
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MEDIA_SUFFIXES: frozenset[str] = frozenset(
+    {
+        ".aac",
+        ".avi",
+        ".flac",
+        ".m4a",
+        ".mkv",
+        ".mov",
+        ".mp3",
+        ".mp4",
+        ".ogg",
+        ".opus",
+        ".wav",
+        ".webm",
+    }
+)
+
+_VIDEO_ID_LENGTH: int = 16
+
+
+def local_source_path(source_url: str) -> Path | None:
+    """Get the local file a source refers to, if it is one.
+
+    Args:
+        source_url: A 'file://' URL, a path, or any other URL.
+
+    Returns:
+        The path of the file, or None if the source is not a local file.
+
+    """
+    parts = urlsplit(source_url)
+    if parts.scheme == "file":
+        return Path(unquote(parts.path))
+    if parts.scheme and len(parts.scheme) > 1:
+        return None
+    # No scheme, or a Windows drive letter.
+    file_path: Path = Path(source_url).expanduser()
+    return file_path if file_path.is_file() else None
+
+
+class LocalFileService(BaseVideoService):
+    """A service to read audio from media files on the local disk.
+
+    The title is the file's name without its extension and the author is the
+    name of the folder holding it. Local files have no captions, so they are
+    always transcribed.
+
+    Attributes:
+        _file_path: The path of the loaded file.
+        _file_state: The size and modification time the file was hashed at.
+        _video_id: The ID of the loaded file, derived from its digest.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the local file service."""
+        self._file_path: Path | None = None
+        self._file_state: tuple[int, int] | None = None
+        self._video_id: str | None = None
+
+    def load_from_url(self, source_url: str) -> Self:
+        """Load a media file from a path or a 'file://' URL.
+
+        The file is only hashed again if it changed since it was last loaded.
+
+        Args:
+            source_url: The path or 'file://' URL of the file.
+
+        Returns:
+            The instance of the local file service.
+
+        Raises:
+            FileNotFoundError: If the source is not an existing file.
+
+        """
+        file_path: Path | None = local_source_path(source_url)
+        if file_path is None or not file_path.is_file():
+            logger.error("Media file not found: %s", source_url)
+            raise FileNotFoundError(f"Media file not found: {source_url}")
+        file_path = file_path.resolve()
+
+        stat = file_path.stat()
+        file_state: tuple[int, int] = (stat.st_size, stat.st_mtime_ns)
+        if file_path != self._file_path or file_state != self._file_state:
+            self._video_id = hash_file(file_path)[:_VIDEO_ID_LENGTH]
+            self._file_path = file_path
+            self._file_state = file_state
+            logger.info('Loaded file: "%s"', file_path)
+        return self
+
+    @property
+    def file_path(self) -> Path:
+        """Get the path of the loaded file.
+
+        Raises:
+            RuntimeError: If no file is loaded.
+
+        """
+        if self._file_path is None:
+            logger.error("You must call load_from_url() first")
+            raise RuntimeError("You must call load_from_url() first")
+        return self._file_path
+
+    @property
+    def video_id(self) -> str:
+        """Get the ID of the file, the start of its SHA-256 digest."""
+        if self._video_id is None:
+            logger.error("You must call load_from_url() first")
+            raise RuntimeError("You must call load_from_url() first")
+        return self._video_id
+
+    @property
+    def title(self) -> str:
+        """Get the name of the file without its extension."""
+        return self.file_path.stem
+
+    @property
+    def author(self) -> str:
+        """Get the name of the folder holding the file."""
+        return self.file_path.parent.name
+
+    def audio_download(self, audio_file_path: Path) -> None:
+        """Copy the file's audio track into the cache as MP3.
+
+        MP3 files are copied as they are. The audio of any other format is
+        extracted, so the video track of a recording is never copied.
+
+        Args:
+            audio_file_path: The path where the audio file will be saved.
+
+        Raises:
+            AudioProcessingError: If the audio cannot be extracted.
+
+        """
+        if self.file_path.suffix.lower() == ".mp3":
+            shutil.copyfile(self.file_path, audio_file_path)
+            return
+        AudioProcessor(self.file_path, audio_file_path).extract_audio()
+
+    def find_best_captions(
+        self, user_language: str, auto_captions: str = "off"
+    ) -> Transcript | None:
+        """Report no captions, as local files are always transcribed."""
+        return None
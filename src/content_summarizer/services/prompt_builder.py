@@ -0,0 +1,195 @@
+"""Builds the summary prompt from a compacted transcript.
+
+Transcripts of speech carry a lot that does not help a summary: filler
+words, phrases repeated by the speaker or by a recognition loop, sound
+annotations such as '[Music]' and irregular whitespace. They are removed
+before the transcript is sent, in a single pass over its words, which makes
+the request smaller and cheaper without changing what was said.
+
+The prompt is returned as separate parts, the instructions and the
+transcript, which the Gemini client sends as parts of a single message, so
+the transcript is never copied into a larger string. When the transcript is
+in Gemini's context cache, the prompt only holds the instructions.
+
+Functions:
+    compact_transcript: Removes fillers, repeated phrases and extra spaces.
+    build_summary_prompt: Builds the summary prompt from a transcript.
+    build_cached_summary_prompt: Builds the prompt for a cached transcript.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import string
+import textwrap
+
+# Dedented once, the transcript is never part of this string.
+_PROMPT_TEMPLATE: str = textwrap.dedent("""\
+    You are an expert summarizer with a knack for clarity and a great sense of humor. Your mission is to distill the following video transcript into a summary that is natural, engaging, and easy to read, as if a friend were explaining the main points.
+
+    Rules:
+
+    Core Mission: Summarize all key points with clarity and objectivity. Capture the essence of the content.
+    Formatting Freedom: Feel free to use bullet points, standard paragraphs, or a hybrid format—whichever presents the information most effectively and clearly.
+    Word Count: Be as concise as possible, but you can go up to  1500 words if the content's complexity truly justifies it. No need to fill space unnecessarily.
+    Match the Vibe: If the video is casual and humorous, reflect that with some clever wit, but keep the core information sharp. If the content is serious, dial back the jokes but maintain an engaging, non-robotic tone. A light, witty remark is fine even in serious topics.
+    Be Seamless: Dive right into the summary. Do not use opening phrases like "This is a summary of..." or "The video discusses...".
+    Output Language: {language_rule} Always output in Markdown format. Ignore self-promosions or ads.
+    """)  # noqa: E501
+
+_CONTENT_HEADER: str = "Content:\n"
+_CACHED_CONTENT_NOTE: str = "Content: the video transcript given before these rules."
+
+# Filler words by base language code. Words that are fillers in one
+# language are often real words in another ('um' is 'a' in Portuguese), so
+# fillers are only removed when the transcript's language is known.
+_FILLER_WORDS: dict[str, frozenset[str]] = {
+    "en": frozenset({"uh", "uhm", "um", "umm", "erm", "hmm", "mhm", "mm"}),
+    "es": frozenset({"eh", "ehm", "mmm"}),
+    "pt": frozenset({"ahn", "hã", "hum", "humm"}),
+}
+
+# Phrases repeated back to back are dropped if they have between these many
+# words. Shorter repetitions ('very, very') are often intended.
+_MIN_REPEATED_WORDS: int = 3
+_MAX_REPEATED_WORDS: int = 24
+
+# Annotations such as '[Music]' or '[Applause]' describe sound, not speech.
+_SOUND_ANNOTATION_PATTERN = re.compile(r"\[[^\]\n]{0,40}\]")
+
+_WORD_PUNCTUATION: str = string.punctuation + "¡¿…“”‘’«»"
+
+
+def _repeated_phrase_size(keys: list[str]) -> int | None:
+    """Find the size of a phrase the words end with twice in a row, if any."""
+    # A repeated phrase ends in the same word twice, so only the sizes at
+    # which the last word appeared before are compared, found with a search
+    # over the recent words in reverse.
+    recent: list[str] = keys[-_MAX_REPEATED_WORDS - 1 : -1]
+    recent.reverse()
+    offset: int = _MIN_REPEATED_WORDS - 1
+    while True:
+        try:
+            offset = recent.index(keys[-1], offset)
+        except ValueError:
+            return None
+        size: int = offset + 1
+        if size * 2 > len(keys):
+            return None
+        if keys[-size:] == keys[-2 * size : -size]:
+            return size
+        offset += 1
+
+
+def compact_transcript(text: str, language: str | None = None) -> str:
+    """Remove fillers, repeated phrases and extra whitespace from a transcript.
+
+    A phrase repeated right after itself is kept once, comparing words
+    without case or punctuation, which collapses recognition loops and
+    speakers restarting a sentence. The first copy's words are kept with the
+    last copy's closing punctuation, so sentence boundaries do not move.
+
+    Args:
+        text: The transcript text.
+        language: The language code of the transcript, used to pick its
+            filler words, or None to keep every word.
+
+    Returns:
+        The compacted transcript, with words separated by single spaces.
+
+    """
+    if "[" in text:
+        text = _SOUND_ANNOTATION_PATTERN.sub(" ", text)
+    fillers: frozenset[str] = _FILLER_WORDS.get(
+        (language or "").split("-")[0].lower(), frozenset()
+    )
+
+    words: list[str] = []
+    keys: list[str] = []
+    for word in text.split():
+        key: str = word.lower().strip(_WORD_PUNCTUATION)
+        if key in fillers:
+            continue
+        words.append(word)
+        keys.append(key)
+        size: int | None = _repeated_phrase_size(keys)
+        if size is not None:
+            closing_word: str = words[-1]
+            del words[-size:], keys[-size:]
+            closing: str = closing_word[len(closing_word.rstrip(_WORD_PUNCTUATION)) :]
+            words[-1] = words[-1].rstrip(_WORD_PUNCTUATION) + closing
+    return " ".join(words)
+
+
+def _language_rule(user_language: str, source_language: str | None) -> str:
+    """Write the prompt's instruction about the summary's language.
+
+    When the transcript is already in the user's language, the model is told
+    to keep it instead of being asked for a translation it does not need.
+    """
+    if source_language is None:
+        return f"The summary must be written in {user_language}."
+    source_base: str = source_language.split("-")[0].lower()
+    if source_base == user_language.split("-")[0].lower():
+        return (
+            f"The transcript is already in {user_language}, write the summary "
+            "in the same language."
+        )
+    return (
+        f"The transcript is in '{source_language}', but the summary must be "
+        f"written in {user_language}."
+    )
+
+
+def build_summary_prompt(
+    transcript: str, user_language: str, source_language: str | None = None
+) -> list[str]:
+    """Build the summary prompt for a compacted transcript.
+
+    Args:
+        transcript: The transcript to summarize, already compacted.
+        user_language: The target language for the summary (e.g., 'en-US').
+        source_language: The language code of the transcript, if known.
+
+    Returns:
+        The prompt's parts: the instructions, then the transcript.
+
+    """
+    instructions: str = _PROMPT_TEMPLATE.format(
+        language_rule=_language_rule(user_language, source_language)
+    )
+    return [instructions + _CONTENT_HEADER, transcript]
+
+
+def build_cached_summary_prompt(
+    user_language: str, source_language: str | None = None
+) -> str:
+    """Build the summary instructions for a transcript in the context cache.
+
+    The transcript itself is not part of the prompt, as the cached content
+    it refers to comes before it.
+
+    Args:
+        user_language: The target language for the summary (e.g., 'en-US').
+        source_language: The language code of the transcript, if known.
+
+    Returns:
+        The prompt, without the transcript.
+
+    """
+    instructions: str = _PROMPT_TEMPLATE.format(
+        language_rule=_language_rule(user_language, source_language)
+    )
+    return instructions + _CACHED_CONTENT_NOTE
@@ -2,8 +2,8 @@
 
 This module contains the function responsible for communicating with the
 Google Generative AI API, sending a transcription, and receiving a
-generated summary. It encapsulates the prompt engineering and error
-handling for this specific task.
+generated summary. It encapsulates the error handling for this specific
+task, while the prompt itself is built by the prompt_builder module.
 
 """
 # Copyright 2025 Gabriel Carvalho
@@ -21,11 +21,23 @@ handling for this specific task.
 # limitations under the License.
 
 import logging
-import textwrap
 from pathlib import Path
-
-from google.generativeai.generative_models import GenerativeModel
-from google.generativeai.types import GenerateContentResponse
+from typing import TYPE_CHECKING
+
+from content_summarizer.data.data_models import SummaryResult
+from content_summarizer.services.context_cache import (
+    MIN_CACHED_TOKENS,
+    GeminiContextCache,
+)
+from content_summarizer.services.prompt_builder import (
+    build_cached_summary_prompt,
+    build_summary_prompt,
+    compact_transcript,
+)
+
+if TYPE_CHECKING:
+    from google.generativeai.generative_models import GenerativeModel
+    from google.generativeai.types import GenerateContentResponse
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -36,25 +48,63 @@ class SummaryError(Exception):
     pass
 
 
+def _build_summary_result(res: "GenerateContentResponse") -> SummaryResult:
+    """Read the summary and the tokens it consumed from a response."""
+    usage = res.usage_metadata
+    if not usage:
+        return SummaryResult(text=res.text)
+    input_tokens: int = usage.prompt_token_count
+    # The total also counts the thinking tokens of newer models, which are
+    # billed as output but not reported as candidates.
+    total_tokens: int = getattr(usage, "total_token_count", 0)
+    output_tokens: int = max(usage.candidates_token_count, total_tokens - input_tokens)
+    return SummaryResult(
+        text=res.text,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cached_tokens=getattr(usage, "cached_content_token_count", 0),
+    )
+
+
+def _count_tokens(gemini_model: "GenerativeModel", prompt: list[str]) -> int | None:
+    """Count the prompt's tokens with the model's tokenizer, if reachable."""
+    try:
+        return gemini_model.count_tokens(prompt).total_tokens
+    except Exception:
+        # The count is informative, a failure must not stop the summary.
+        logger.warning("Failed to count the prompt's tokens", exc_info=True)
+        return None
+
+
 def generate_summary(
-    gemini_model: GenerativeModel,
+    gemini_model: "GenerativeModel",
     user_language: str,
     input_file_path: Path,
-) -> str | None:
+    source_language: str | None = None,
+    context_cache: GeminiContextCache | None = None,
+) -> SummaryResult:
     """Generate a summary from a text file using the Gemini API.
 
-    This function reads a text file (like a transcription or caption), constructs a
-    detailed prompt, sends it to the Gemini API, and returns the
-    resulting summary.
+    This function reads a text file (like a transcription or caption),
+    compacts it, builds the prompt, counts its tokens with the model's
+    tokenizer, sends it to the Gemini API, and returns the resulting summary.
+
+    With a context cache, transcripts large enough to be cached are uploaded
+    once, and every summary of the same transcript only sends its
+    instructions.
 
     Args:
         gemini_model: An initialized instance of the GenerativeModel.
         user_language: The target language for the summary (e.g., 'en-US').
         input_file_path: The path to the text file to be summarized.
+        source_language: The language code of the text, such as the caption's
+            or the one Whisper detected, or None if unknown.
+        context_cache: The context cache to keep the transcript in, or None
+            to send it with the request.
 
     Returns:
-        The generated summary text as a string, or None if the API
-        returns no text.
+        The generated summary text, or None if the API returns no text,
+        along with the number of input and output tokens consumed.
 
     Raises:
         FileNotFoundError: If the input_file_path does not exist.
@@ -67,24 +117,38 @@ def generate_summary(
 
     with input_file_path.open("r", encoding="utf-8") as f:
         transcription_content: str = f.read()
-        prompt: str = textwrap.dedent(f"""
-            You are an expert summarizer with a knack for clarity and a great sense of humor. Your mission is to distill the following video transcript into a summary that is natural, engaging, and easy to read, as if a friend were explaining the main points.
-
-            Rules:
-
-            Core Mission: Summarize all key points with clarity and objectivity. Capture the essence of the content.
-            Formatting Freedom: Feel free to use bullet points, standard paragraphs, or a hybrid format—whichever presents the information most effectively and clearly.
-            Word Count: Be as concise as possible, but you can go up to  1500 words if the content's complexity truly justifies it. No need to fill space unnecessarily.
-            Match the Vibe: If the video is casual and humorous, reflect that with some clever wit, but keep the core information sharp. If the content is serious, dial back the jokes but maintain an engaging, non-robotic tone. A light, witty remark is fine even in serious topics.
-            Be Seamless: Dive right into the summary. Do not use opening phrases like "This is a summary of..." or "The video discusses...".
-            Output Language: The summary must be written in {user_language}. Always output in Markdown format. Ignore self-promosions or ads.
-            Content: {transcription_content}
-            """)  # noqa: E501
+    original_length: int = len(transcription_content)
+    transcription_content = compact_transcript(transcription_content, source_language)
+    if original_length:
+        logger.info(
+            "Compacted the transcript by %.0f%%",
+            (1 - len(transcription_content) / original_length) * 100,
+        )
+    prompt: list[str] = build_summary_prompt(
+        transcription_content, user_language, source_language
+    )
+    prompt_tokens: int | None = _count_tokens(gemini_model, prompt)
+    if prompt_tokens is not None:
+        logger.info("The prompt has %d tokens", prompt_tokens)
+
+    request: str | list[str] = prompt
+    if (
+        context_cache is not None
+        and prompt_tokens is not None
+        and prompt_tokens >= MIN_CACHED_TOKENS
+    ):
+        cached_model: GenerativeModel | None = context_cache.model_for(
+            gemini_model, [transcription_content]
+        )
+        if cached_model is not None:
+            gemini_model = cached_model
+            request = build_cached_summary_prompt(user_language, source_language)
+
     try:
         logger.info("Generating summary")
-        res: GenerateContentResponse = gemini_model.generate_content(prompt)
+        res: GenerateContentResponse = gemini_model.generate_content(request)
         logger.info("Summary generated successfully")
-        return res.text
+        return _build_summary_result(res)
     except Exception as e:
         logger.exception("Failed to generate summary")
         raise SummaryError("Failed to generate summary") from e
@@ -0,0 +1,226 @@
+"""Reads YouTube caption tracks as a stream of timed cues.
+
+Caption tracks are served as timed-text XML, either in the 'srv3' format or
+in the legacy one. The response is parsed incrementally while it downloads,
+without building an XML tree, so only the current chunk and cue are held in
+memory besides the parsed cues, even for the captions of a livestream that
+runs for hours.
+
+Auto-generated captions are often 'rolling': each cue repeats the end of the
+previous one before adding new words, so the track can be read one line at
+a time on screen. In those tracks the repeated words are dropped, so every
+word appears once in the text, with the timestamps of the cue that
+introduced it. Manual captions are kept as written, as their repetitions
+are speech.
+
+Functions:
+    iter_timed_text_cues: Parses timed-text XML chunks into cues.
+    merge_rolling_cues: Drops the words cues repeat from the previous cue.
+    parse_timed_text: Parses timed-text XML chunks into a transcript.
+    read_caption_track: Downloads and parses a caption track.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import html
+from collections.abc import Iterable, Iterator
+from urllib.request import Request, urlopen
+from xml.etree import ElementTree
+
+from content_summarizer.data.data_models import Transcript
+
+Cue = tuple[float, float, str]
+
+_READ_CHUNK_BYTES: int = 64 * 1024
+_REQUEST_TIMEOUT_SECONDS: float = 30.0
+
+# Overlaps of a single word are only merged when they are the whole previous
+# cue, as speech does repeat single words ('no, no').
+_MIN_PARTIAL_OVERLAP_WORDS: int = 2
+
+# A cue only carries words over from a previous cue that ends at most this
+# many seconds before it starts. Rolling cues overlap or touch in time.
+_MAX_ROLLING_GAP_SECONDS: float = 0.5
+
+
+class _CueCollector:
+    """Collects cues from the events of an incremental XML parser.
+
+    The parser calls these methods as it reads the document instead of
+    building a tree, so only the text of the current cue is kept.
+
+    Attributes:
+        cues: The cues read since they were last taken.
+        _cue_times: The start and end of the cue being read, if any.
+        _cue_text: The pieces of text of the cue being read.
+
+    """
+
+    def __init__(self) -> None:
+        self.cues: list[Cue] = []
+        self._cue_times: tuple[float, float] | None = None
+        self._cue_text: list[str] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        """Start reading a 'p' (srv3) or 'text' (legacy) cue."""
+        if tag == "p":
+            start: float = int(attrib.get("t", "0")) / 1000
+            self._cue_times = (start, start + int(attrib.get("d", "0")) / 1000)
+        elif tag == "text":
+            start = float(attrib.get("start", "0"))
+            self._cue_times = (start, start + float(attrib.get("dur", "0")))
+
+    def data(self, data: str) -> None:
+        """Collect the text inside a cue, including its word elements."""
+        if self._cue_times is not None:
+            self._cue_text.append(data)
+
+    def end(self, tag: str) -> None:
+        """Finish reading a cue, keeping it if it has text."""
+        if tag not in ("p", "text") or self._cue_times is None:
+            return
+        text: str = "".join(self._cue_text)
+        if "&" in text:
+            # The legacy format escapes entities twice.
+            text = html.unescape(text)
+        text = " ".join(text.split())
+        if text:
+            self.cues.append((*self._cue_times, text))
+        self._cue_times = None
+        self._cue_text.clear()
+
+    def close(self) -> None:
+        """Finish the document."""
+
+
+def iter_timed_text_cues(chunks: Iterable[bytes]) -> Iterator[Cue]:
+    """Parse timed-text XML into cues as its chunks arrive.
+
+    Args:
+        chunks: The XML document, in pieces of any size.
+
+    Yields:
+        Tuples of (start, end, text) with times in seconds, for every cue
+        with text, in document order.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is not valid XML.
+
+    """
+    collector = _CueCollector()
+    parser = ElementTree.XMLParser(target=collector)
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from collector.cues
+        collector.cues.clear()
+    parser.close()
+    yield from collector.cues
+
+
+def _carried_over_words(previous_words: list[str], words: list[str]) -> int:
+    """Count the words a cue carries over from the end of the previous cue."""
+    # An overlap starts where the previous cue has this cue's first word, the
+    # longest one first. It must leave new words in the cue, as a cue that
+    # only repeats the previous one is speech repeated, not rolled.
+    for index, word in enumerate(previous_words):
+        size: int = len(previous_words) - index
+        if word != words[0] or size >= len(words):
+            continue
+        if size < _MIN_PARTIAL_OVERLAP_WORDS and index != 0:
+            continue
+        if previous_words[index:] == words[:size]:
+            return size
+    return 0
+
+
+def merge_rolling_cues(cues: Iterable[Cue]) -> Iterator[Cue]:
+    """Drop the words each cue repeats from the end of the previous cue.
+
+    Only meant for auto-generated tracks. Words are only dropped when the
+    end of the previous cue is a strict prefix of the cue and the cues are
+    adjacent in time. Comparing with the previous cue alone keeps the work
+    linear in the number of words, as cues are a line or two long.
+
+    Args:
+        cues: Tuples of (start, end, text), in time order.
+
+    Yields:
+        The cues with only their new words, in the same order.
+
+    """
+    previous_words: list[str] = []
+    previous_end: float | None = None
+    for start, end, text in cues:
+        words: list[str] = text.split()
+        overlap: int = 0
+        if (
+            previous_end is not None
+            and start - previous_end <= _MAX_ROLLING_GAP_SECONDS
+        ):
+            overlap = _carried_over_words(previous_words, words)
+        previous_words = words
+        previous_end = end
+        yield start, end, " ".join(words[overlap:])
+
+
+def parse_timed_text(
+    chunks: Iterable[bytes], language: str, rolling: bool = False
+) -> Transcript:
+    """Parse timed-text XML into a transcript of its cues.
+
+    Args:
+        chunks: The XML document, in pieces of any size.
+        language: The language code of the caption track.
+        rolling: Whether the track is auto-generated, so the words its cues
+            carry over from the previous cue are dropped.
+
+    Returns:
+        The caption's cues as transcript segments.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the document is not valid XML.
+
+    """
+    transcript: Transcript = Transcript(language=language)
+    cues: Iterable[Cue] = iter_timed_text_cues(chunks)
+    if rolling:
+        cues = merge_rolling_cues(cues)
+    for start, end, text in cues:
+        # Segments carry their leading space, like Whisper's.
+        transcript.append(start, end, f" {text}")
+    return transcript
+
+
+def read_caption_track(url: str, language: str, rolling: bool = False) -> Transcript:
+    """Download a caption track and parse it while it downloads.
+
+    Args:
+        url: The URL of the caption track.
+        language: The language code of the caption track.
+        rolling: Whether the track is auto-generated, with rolling cues.
+
+    Returns:
+        The caption's cues as transcript segments.
+
+    Raises:
+        OSError: If the track cannot be downloaded.
+        xml.etree.ElementTree.ParseError: If the track is not valid XML.
+
+    """
+    request = Request(url, headers={"User-Agent": "Mozilla/5.0"})
+    with urlopen(request, timeout=_REQUEST_TIMEOUT_SECONDS) as response:
+        return parse_timed_text(
+            iter(lambda: response.read(_READ_CHUNK_BYTES), b""), language, rolling
+        )
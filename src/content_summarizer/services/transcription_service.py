@@ -5,7 +5,11 @@ a local Whisper model or a remote transcription API. It encapsulates
 the logic for both methods, handling model loading, API requests, and
 error handling.
 
+Classes:
+    TranscriptionApiClient: A pooled, retrying client for the remote API.
+
 Functions:
+    preload_whisper_model: Loads a local model ahead of its first use.
     fetch_transcription_local: Transcribes audio using a local model.
     fetch_transcription_api: Transcribes audio using a remote API.
 """
@@ -23,106 +27,359 @@ Functions:
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
 import logging
 from collections.abc import Iterable
 from pathlib import Path
-from typing import IO
+from typing import IO, TYPE_CHECKING, Any
+
+from content_summarizer.data.data_models import Transcript
+from content_summarizer.utils.hashing import hash_file
 
-import requests
+if TYPE_CHECKING:
+    import requests
+    from faster_whisper import WhisperModel
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+# Whisper detects the language from the first 30 seconds of audio. Less
+# confident detections are not kept, so a video starting with music or silence
+# is detected again instead of being transcribed in the wrong language forever.
+_MIN_LANGUAGE_PROBABILITY: float = 0.5
+
+# YouTube language codes that differ from Whisper's.
+_LANGUAGE_CODE_ALIASES: dict[str, str] = {"in": "id", "iw": "he", "jv": "jw"}
+
+# The languages of the multilingual Whisper models. Kept here rather than read
+# from faster_whisper, which would load it and CTranslate2 on the API path.
+_WHISPER_LANGUAGES: str = (
+    "af am ar as az ba be bg bn bo br bs ca cs cy da de el en es et eu fa "
+    "fi fo fr gl gu ha haw he hi hr ht hu hy id is it ja jw ka kk km kn ko "
+    "la lb ln lo lt lv mg mi mk ml mn mr ms mt my ne nl nn no oc pa pl ps "
+    "pt ro ru sa sd si sk sl sn so sq sr su sv sw ta te tg th tk tl tr tt "
+    "uk ur uz vi yi yo yue zh"
+)
+_WHISPER_LANGUAGE_CODES: frozenset[str] = frozenset(_WHISPER_LANGUAGES.split())
+
+
 class TranscriptionError(Exception):
     """Custom exception for errors during the transcription process."""
 
     pass
 
 
+def _whisper_language(language: str | None) -> str | None:
+    """Convert a language code to Whisper's, or None if Whisper lacks it."""
+    if not language:
+        return None
+    base_code: str = language.split("-")[0].lower()
+    base_code = _LANGUAGE_CODE_ALIASES.get(base_code, base_code)
+    return base_code if base_code in _WHISPER_LANGUAGE_CODES else None
+
+
+@functools.lru_cache(maxsize=2)
+def _load_whisper_model(
+    whisper_model_name: str, device: str, compute_type: str, cpu_threads: int = 0
+) -> "WhisperModel":
+    """Load a Whisper model, keeping it in memory for later calls."""
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        whisper_model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+    )
+
+
+def _resolve_compute_type(device: str, compute_type: str | None) -> str:
+    """Pick int8 on the CPU and let CTranslate2 decide elsewhere."""
+    if compute_type is not None:
+        return compute_type
+    return "int8" if device == "cpu" else "auto"
+
+
+def preload_whisper_model(
+    whisper_model_name: str,
+    device: str,
+    compute_type: str | None = None,
+    cpu_threads: int = 0,
+) -> None:
+    """Load a Whisper model ahead of the first transcription that uses it.
+
+    Args:
+        whisper_model_name: The name of the Whisper model to load.
+        device: The device to run the model on (e.g., 'cuda', 'cpu').
+        compute_type: The CTranslate2 quantization, or None to pick it by device.
+        cpu_threads: The number of CPU threads, 0 to let CTranslate2 decide.
+
+    """
+    _load_whisper_model(
+        whisper_model_name,
+        device,
+        _resolve_compute_type(device, compute_type),
+        cpu_threads,
+    )
+
+
 def fetch_transcription_local(
-    audio_file_path: Path, whisper_model_name: str, beam_size: int, device: str
-) -> str:
+    audio_file_path: Path,
+    whisper_model_name: str,
+    beam_size: int,
+    device: str,
+    compute_type: str | None = None,
+    cpu_threads: int = 0,
+    language: str | None = None,
+) -> Transcript:
     """Transcribe an audio file locally using a Whisper model.
 
     This function loads a Whisper model and runs the transcription
-    on the local machine.
+    on the local machine, keeping the timing and confidence of every segment.
+    Loaded models are kept in memory, so long-lived processes only pay the
+    loading cost once.
+
+    Without a language, Whisper detects it from the first 30 seconds of the
+    audio before transcribing. Passing the language detected by an earlier
+    run skips that pass and keeps every transcription of a video in the
+    same language.
 
     Args:
         audio_file_path: The path to the audio file to be transcribed.
         whisper_model_name: The name of the Whisper model to use.
         beam_size: The beam size for the transcription process.
         device: The device to run the model on (e.g., 'cuda', 'cpu').
+        compute_type: The CTranslate2 quantization (e.g., 'int8', 'float32').
+            Defaults to 'int8' on the CPU and 'auto' elsewhere.
+        cpu_threads: The number of CPU threads, 0 to let CTranslate2 decide.
+        language: The spoken language, or None to detect it. Codes Whisper
+            does not know, such as a caption's 'pt-BR', are reduced to their
+            base language or ignored.
 
     Returns:
-        The transcribed text as a string.
+        The timed transcript, with timestamps relative to the given audio file.
+        Its language is None if it was detected with low confidence.
 
     Raises:
         TranscriptionError: If the transcription process fails for any reason.
 
     """
-    from faster_whisper import WhisperModel
     from faster_whisper.transcribe import Segment
 
-    compute_type: str = "auto"
-    if device == "cpu":
-        compute_type = "int8"
     try:
-        whisper_model = WhisperModel(
-            whisper_model_name, device=device, compute_type=compute_type
+        whisper_model = _load_whisper_model(
+            whisper_model_name,
+            device,
+            _resolve_compute_type(device, compute_type),
+            cpu_threads,
         )
         logger.info("Initializing transcription")
 
         segments: Iterable[Segment]
-        segments, _ = whisper_model.transcribe(
-            str(audio_file_path), beam_size=beam_size
+        segments, info = whisper_model.transcribe(
+            str(audio_file_path),
+            beam_size=beam_size,
+            language=_whisper_language(language),
         )
-        transcription_text: str = "".join(segment.text for segment in segments)
+        if info.language_probability >= _MIN_LANGUAGE_PROBABILITY:
+            logger.info(
+                "Transcribing in '%s' (%.0f%% confidence)",
+                info.language,
+                info.language_probability * 100,
+            )
+            transcript: Transcript = Transcript(language=info.language)
+        else:
+            logger.warning(
+                "Unsure of the spoken language, '%s' has %.0f%% confidence",
+                info.language,
+                info.language_probability * 100,
+            )
+            transcript = Transcript()
+        for segment in segments:
+            transcript.append(
+                segment.start,
+                segment.end,
+                segment.text,
+                segment.avg_logprob,
+                segment.no_speech_prob,
+            )
 
         logger.info("Transcription completed")
-        return transcription_text
+        return transcript
 
     except Exception as e:
         logger.exception("Failed to transcribe audio")
         raise TranscriptionError("Failed to transcribe audio") from e
 
 
-def fetch_transcription_api(api_url: str, audio_file_path: Path, api_key: str) -> str:
+class TranscriptionApiClient:
+    """A client for the remote transcription API.
+
+    The client keeps a pooled `requests.Session`, so consecutive calls reuse
+    the same connection, and retries transient failures with exponential
+    backoff. Uploads are keyed by the SHA-256 of the audio content: the server
+    is asked first whether it already has a transcription for that hash, and
+    the upload is only sent when it does not. This also makes a retried POST
+    idempotent, since the server deduplicates by the same hash.
+
+    Attributes:
+        _api_url: The URL of the transcription API endpoint.
+        _api_key: The API key for authentication.
+        _session: The pooled HTTP session used for all requests.
+
+    """
+
+    CONNECT_TIMEOUT: float = 10
+    READ_TIMEOUT: float = 3610
+
+    def __init__(self, api_url: str, api_key: str, max_retries: int = 3) -> None:
+        """Initialize the TranscriptionApiClient.
+
+        Args:
+            api_url: The URL of the transcription API endpoint.
+            api_key: The API key for authentication.
+            max_retries: How many times a failed request is retried.
+
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self._api_url = api_url.rstrip("/")
+        self._api_key = api_key
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+        )
+        self._session = requests.Session()
+        self._session.headers.update({"X-Api-Key": api_key})
+        self._session.mount("http://", HTTPAdapter(max_retries=retry))
+        self._session.mount("https://", HTTPAdapter(max_retries=retry))
+
+    @staticmethod
+    def _parse_response(payload: dict[str, Any]) -> Transcript:
+        """Build a transcript from an API response.
+
+        Servers that predate segment support only return the plain text, which
+        is kept as a single untimed segment.
+        """
+        if "segments" in payload:
+            return Transcript.from_dict(payload["segments"])
+        transcript = Transcript()
+        transcript.append(0.0, 0.0, payload.get("transcription", ""))
+        return transcript
+
+    def _lookup(self, content_hash: str, language: str | None) -> Transcript | None:
+        """Ask the server for an existing transcription of the given content.
+
+        Args:
+            content_hash: The SHA-256 hex digest of the audio content.
+            language: The Whisper code of the spoken language, if known, so
+                only a transcription in that language is returned.
+
+        Returns:
+            The cached transcript, or None if the server does not have it.
+
+        """
+        response: requests.Response = self._session.get(
+            f"{self._api_url}/{content_hash}",
+            params={"language": language} if language else None,
+            timeout=(self.CONNECT_TIMEOUT, self.CONNECT_TIMEOUT),
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return self._parse_response(response.json())
+
+    def _upload(
+        self, audio_file_path: Path, content_hash: str, language: str | None
+    ) -> Transcript:
+        """Upload the audio file and return the transcript."""
+        with audio_file_path.open("rb") as f:
+            files: dict[str, tuple[str, IO[bytes]]] = {
+                "audio": (audio_file_path.name, f)
+            }
+            response: requests.Response = self._session.post(
+                self._api_url,
+                files=files,
+                data={"language": language} if language else None,
+                timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT),
+                headers={"X-Content-Sha256": content_hash},
+            )
+        response.raise_for_status()
+        return self._parse_response(response.json())
+
+    def transcribe(
+        self, audio_file_path: Path, language: str | None = None
+    ) -> Transcript:
+        """Transcribe an audio file, reusing a server-side result when possible.
+
+        Args:
+            audio_file_path: The path to the audio file to be transcribed.
+            language: The spoken language, sent so the server can skip its
+                detection, or None to let it detect the language.
+
+        Returns:
+            The timed transcript, with timestamps relative to the given audio file.
+
+        Raises:
+            TranscriptionError: If the API request fails or returns an error.
+
+        """
+        import requests
+
+        try:
+            content_hash: str = hash_file(audio_file_path)
+            whisper_language: str | None = _whisper_language(language)
+            transcript: Transcript | None = self._lookup(content_hash, whisper_language)
+            if transcript is not None:
+                logger.info("Transcription found on the server, skipping upload")
+                return transcript
+
+            logger.info("Initializing transcription")
+            transcript = self._upload(audio_file_path, content_hash, whisper_language)
+            logger.info("Transcribed audio successfully")
+            return transcript
+
+        except requests.exceptions.RequestException as e:
+            logger.exception("Failed to transcribe audio")
+            raise TranscriptionError("Failed to transcribe audio") from e
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.exception("Failed to parse JSON response")
+            raise TranscriptionError("Failed to parse JSON response") from e
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+
+def fetch_transcription_api(
+    api_url: str, audio_file_path: Path, api_key: str, language: str | None = None
+) -> Transcript:
     """Send an audio file to a remote transcription API.
 
-    This function handles the API request and error handling, returning the
-    transcription text in memory.
+    This is a convenience wrapper around TranscriptionApiClient for one-off
+    calls; long-lived callers should keep a client to reuse its connection.
 
     Args:
         api_url: The URL of the transcription API endpoint.
         audio_file_path: The path to the audio file to be transcribed.
         api_key: The API key for authentication.
+        language: The spoken language, or None to let the server detect it.
 
     Returns:
-        The transcribed text returned by the API as a string.
+        The timed transcript returned by the API.
 
     Raises:
         TranscriptionError: If the API request fails or returns an error.
 
     """
+    client = TranscriptionApiClient(api_url, api_key)
     try:
-        with audio_file_path.open("rb") as f:
-            files: dict[str, IO[bytes]] = {"audio": f}
-            logger.info("Initializing transcription")
-            response: requests.Response = requests.post(
-                api_url,
-                files=files,
-                timeout=3610,
-                headers={"X-Api-Key": api_key},
-            )
-        response.raise_for_status()
-        transcription_text: str = response.json().get("transcription", "")
-        logger.info("Transcribed audio successfully")
-        return transcription_text
-
-    except requests.exceptions.RequestException as e:
-        logger.exception("Failed to transcribe audio")
-        raise TranscriptionError("Failed to transcribe audio") from e
-    except json.JSONDecodeError as e:
-        logger.exception("Failed to parse JSON response")
-        raise TranscriptionError("Failed to parse JSON response") from e
+        return client.transcribe(audio_file_path, language)
+    finally:
+        client.close()
@@ -23,6 +23,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Self
 
+from content_summarizer.data.data_models import Transcript
+
 
 class BaseVideoService(ABC):
     """Abstract base class for video services.
@@ -92,3 +94,21 @@ class BaseVideoService(ABC):
 
         """
         pass
+
+    @abstractmethod
+    def find_best_captions(
+        self, user_language: str, auto_captions: str = "off"
+    ) -> Transcript | None:
+        """Find the best available captions for the video.
+
+        Args:
+            user_language: The user's preferred language code (e.g., 'pt-BR').
+            auto_captions: When auto-generated captions are used if there are
+                no manual ones: 'off', 'check' (if they pass quality checks)
+                or 'always'.
+
+        Returns:
+            The timed caption, or None if the video must be transcribed.
+
+        """
+        pass
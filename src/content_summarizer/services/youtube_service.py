@@ -2,7 +2,8 @@
 
 This module implements the BaseVideoService interface for YouTube. It uses
 the pytubefix library to handle video data extraction, audio downloading,
-and caption fetching.
+and caption fetching. Playlists and channels can also be expanded into the
+videos they contain.
 """
 # Copyright 2025 Gabriel Carvalho
 #
@@ -19,13 +20,19 @@ and caption fetching.
 # limitations under the License.
 
 import logging
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Self
-
-from pytubefix import Stream, YouTube
-from pytubefix.captions import Caption
+from typing import TYPE_CHECKING, Self
+from urllib.parse import parse_qs, urlsplit
 
+from content_summarizer.data.data_models import Transcript
+from content_summarizer.services.timed_text import read_caption_track
 from content_summarizer.services.video_service_interface import BaseVideoService
+from content_summarizer.utils.caption_quality import check_auto_caption
+
+if TYPE_CHECKING:
+    from pytubefix import Stream, YouTube
+    from pytubefix.captions import Caption
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -34,6 +41,71 @@ class DownloadError(Exception):
     """Custom exception for errors during the YouTube audio download."""
 
 
+def _get_priority_codes(user_language: str) -> list[str]:
+    """List the caption languages to look for, from the most preferred."""
+    priority_codes = [user_language]
+    if "-" in user_language:
+        generic_language = user_language.split("-")[0]
+        if generic_language not in priority_codes:
+            priority_codes.append(generic_language)
+
+    if "en" not in priority_codes:
+        priority_codes.append("en")
+    return priority_codes
+
+
+def _pick_caption(
+    tracks: dict[str, "Caption"], priority_codes: list[str], auto: bool
+) -> "Caption | None":
+    """Pick a manual or an auto-generated caption track, by language priority."""
+    prefix: str = "a." if auto else ""
+    for code in priority_codes:
+        caption: Caption | None = tracks.get(prefix + code)
+        if caption is not None:
+            return caption
+    for code, caption in tracks.items():
+        if code.startswith("a.") == auto:
+            return caption
+    return None
+
+
+def is_playlist_url(source_url: str) -> bool:
+    """Check whether a URL points to a playlist rather than a channel.
+
+    Args:
+        source_url: A YouTube playlist or channel URL.
+
+    Returns:
+        True if the URL has a playlist ID.
+
+    """
+    return "list" in parse_qs(urlsplit(source_url).query)
+
+
+def iter_collection_videos(source_url: str) -> Iterator[tuple[str, str]]:
+    """Lazily list the videos of a playlist or a channel.
+
+    Pages of results are only requested as the iteration reaches them, so a
+    caller that stops early never lists the whole collection. Channels list
+    their newest uploads first.
+
+    Args:
+        source_url: A YouTube playlist or channel URL.
+
+    Yields:
+        Tuples of (video ID, video URL).
+
+    """
+    from pytubefix import Channel, Playlist, extract
+
+    collection: Playlist = (
+        Playlist(source_url) if is_playlist_url(source_url) else Channel(source_url)
+    )
+    logger.info('Listing videos of "%s"', source_url)
+    for video_url in collection.url_generator():
+        yield extract.video_id(video_url), video_url
+
+
 class YoutubeService(BaseVideoService):
     """A service to download audio and fetch captions from YouTube.
 
@@ -60,12 +132,14 @@ class YoutubeService(BaseVideoService):
             The instance of the YouTube service.
 
         """
+        from pytubefix import YouTube
+
         self._yt = YouTube(source_url)
         logger.info('Loaded video: "%s" from URL: "%s"', self.title, source_url)
         return self
 
     @property
-    def yt(self) -> YouTube:
+    def yt(self) -> "YouTube":
         """Get the YouTube object.
 
         Raises:
@@ -123,44 +197,65 @@ class YoutubeService(BaseVideoService):
             )
             raise DownloadError("Failed to download audio") from e
 
-    def find_best_captions(self, user_language: str) -> str | None:
-        """Find the best available manual caption and returns its clean text.
+    def find_best_captions(
+        self, user_language: str, auto_captions: str = "off"
+    ) -> Transcript | None:
+        """Find the best available caption and download it with its timing.
 
         The search follows a specific hierarchy to ensure the best quality:
         1.  The user's specific language (e.g., 'pt-BR').
         2.  The user's generic language (e.g., 'pt').
         3.  English ('en') as a universal fallback.
-        4.  Any other available manual caption as a last resort.
+        4.  Any other available caption as a last resort.
 
-        Auto-generated captions are always ignored.
+        Manual captions are always preferred. Auto-generated captions are
+        searched the same way when there is no manual caption, if the policy
+        allows them. With 'check', they are only used if they cover the video
+        with speech, do not repeat themselves and match their language.
 
         Args:
             user_language: The user's preferred language code (e.g., 'pt-BR').
+            auto_captions: When auto-generated captions are used: 'off',
+                'check' (if they pass quality checks) or 'always'.
 
         Returns:
-            The clean caption text if a manual caption is found, otherwise None.
+            The timed caption if a usable caption is found, otherwise None.
 
         """
-        if not self.yt.captions:
+        tracks: dict[str, Caption] = {
+            caption.code: caption for caption in self.yt.captions
+        }
+        if not tracks:
+            return None
+
+        priority_codes: list[str] = _get_priority_codes(user_language)
+        caption: Caption | None = _pick_caption(tracks, priority_codes, auto=False)
+        if caption is not None:
+            logger.info("Found manual caption")
+            return self._read_caption(caption)
+
+        if auto_captions == "off":
+            return None
+        caption = _pick_caption(tracks, priority_codes, auto=True)
+        if caption is None:
             return None
 
-        priority_codes = [user_language]
-        if "-" in user_language:
-            generic_language = user_language.split("-")[0]
-            if generic_language not in priority_codes:
-                priority_codes.append(generic_language)
-
-        if "en" not in priority_codes:
-            priority_codes.append("en")
-
-        for code in priority_codes:
-            caption: Caption | None = self.yt.captions.get(code)
-            if caption is not None and not caption.code.startswith("a."):
-                logger.info("Found manual caption")
-                return caption.generate_txt_captions()
-
-        for caption in self.yt.captions:
-            if not caption.code.startswith("a."):
-                logger.info("Found manual caption")
-                return caption.generate_txt_captions()
-        return None
+        transcript: Transcript | None = self._read_caption(caption)
+        if transcript is None:
+            return None
+        if auto_captions == "check":
+            problem: str | None = check_auto_caption(transcript, self.yt.length)
+            if problem is not None:
+                logger.info("Ignoring the auto-generated caption, %s", problem)
+                return None
+        logger.info("Found auto-generated caption")
+        return transcript
+
+    @staticmethod
+    def _read_caption(caption: "Caption") -> Transcript | None:
+        """Download a caption track, or None if it has no text."""
+        auto_generated: bool = caption.code.startswith("a.")
+        transcript: Transcript = read_caption_track(
+            caption.url, caption.code.removeprefix("a."), rolling=auto_generated
+        )
+        return transcript if transcript.text else None
@@ -0,0 +1,194 @@
+"""Summarizes the new videos of YouTube playlists and channels.
+
+This module implements the 'sync' command. It lists the videos of each
+playlist or channel lazily and compares them against the search index of the
+cache, which records every summary along with the settings it was made with.
+Only videos without a summary for the current settings are summarized, so a
+recurring sync does work proportional to the new uploads, not to the size of
+the channel.
+
+Channels list their newest uploads first, so their listing stops after a run
+of already summarized videos. Playlists have no such order and are always
+listed in full, which only costs one request per hundred videos. New videos
+are summarized while the listing goes on, so the first summary does not
+wait for the whole listing.
+
+Functions:
+    find_new_videos: Lists the videos of a source that are not summarized yet.
+    handle_sync_command: Summarizes the new videos of the given sources.
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import itertools
+import logging
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from content_summarizer.core import (
+    AppConfig,
+    PipelineError,
+    SetupError,
+    build_app_config,
+    copy_app_config,
+    find_summarized_video_ids,
+    run_pipeline,
+)
+from content_summarizer.managers.path_manager import PathManager
+from content_summarizer.managers.storage_backend import StorageError
+from content_summarizer.services.youtube_service import (
+    YoutubeService,
+    is_playlist_url,
+    iter_collection_videos,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class SyncError(Exception):
+    """Custom exception for videos that failed to sync."""
+
+
+def find_new_videos(
+    source_url: str, summarized_ids: set[str], stop_after_known: int
+) -> Iterator[tuple[str, str]]:
+    """Lazily list the videos of a source that are not summarized yet.
+
+    Args:
+        source_url: A YouTube playlist or channel URL.
+        summarized_ids: The IDs of the videos already summarized with the
+            current settings.
+        stop_after_known: For channels, stop listing after this many already
+            summarized videos in a row, or 0 to list every video.
+
+    Yields:
+        Tuples of (video ID, video URL), in the source's order.
+
+    """
+    early_stop: bool = stop_after_known > 0 and not is_playlist_url(source_url)
+    known_in_a_row: int = 0
+    for video_id, video_url in iter_collection_videos(source_url):
+        if video_id not in summarized_ids:
+            known_in_a_row = 0
+            yield video_id, video_url
+            continue
+        known_in_a_row += 1
+        if early_stop and known_in_a_row >= stop_after_known:
+            logger.info(
+                "Found %d summarized videos in a row, skipping older uploads",
+                known_in_a_row,
+            )
+            return
+
+
+def _queue_new_videos(
+    args: argparse.Namespace, summarized_ids: set[str]
+) -> Iterator[str]:
+    """Lazily list the URLs of the new videos of every source, once each."""
+    queued_ids: set[str] = set()
+
+    def _unique_new_videos() -> Iterator[str]:
+        for source_url in args.sources:
+            for video_id, video_url in find_new_videos(
+                source_url, summarized_ids, args.stop_after_known
+            ):
+                if video_id not in queued_ids:
+                    queued_ids.add(video_id)
+                    yield video_url
+
+    # Listing stops as soon as the limit is reached.
+    return itertools.islice(_unique_new_videos(), args.limit)
+
+
+def _summarize_batch(
+    base_config: AppConfig, video_urls: Iterator[str], jobs: int
+) -> tuple[int, int]:
+    """Summarize videos in parallel as they are listed.
+
+    Each video gets its own copy of the settings. At most one video per
+    worker waits in the queue, so listing only moves ahead as fast as the
+    summaries, and a failed video never stops the others.
+
+    Returns:
+        The number of videos summarized and the number of them that failed.
+
+    """
+
+    def _summarize(video_url: str) -> bool:
+        try:
+            run_pipeline(copy_app_config(base_config, video_url, YoutubeService()))
+        except (PipelineError, SetupError):
+            return False
+        except (OSError, StorageError):
+            logger.exception("Failed to summarize %s", video_url)
+            return False
+        return True
+
+    total: int = 0
+    failed: int = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending: set[Future[bool]] = set()
+        for video_url in video_urls:
+            if len(pending) >= 2 * jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                failed += sum(not future.result() for future in done)
+            logger.info("Summarizing %s", video_url)
+            pending.add(executor.submit(_summarize, video_url))
+            total += 1
+        failed += sum(not future.result() for future in pending)
+    return total, failed
+
+
+def handle_sync_command(
+    args: argparse.Namespace, logger: logging.Logger, path_manager: PathManager
+) -> None:
+    """Summarize the videos of playlists and channels that are not summarized yet.
+
+    Args:
+        args: The parsed command-line arguments from the user.
+        logger: The application's configured logger.
+        path_manager: The application's path manager.
+
+    Raises:
+        SetupError: If the configuration cannot be built.
+        SyncError: If any video failed to be summarized.
+
+    """
+    try:
+        base_config: AppConfig = build_app_config(args, logger, path_manager)
+    except Exception as e:
+        logger.exception("An error occurred during the setup")
+        raise SetupError("An error occurred during the setup") from e
+
+    summarized_ids: set[str] = find_summarized_video_ids(base_config)
+
+    video_urls: Iterator[str] = _queue_new_videos(args, summarized_ids)
+    if args.dry_run:
+        listed: int = 0
+        for video_url in video_urls:
+            logger.info("Would summarize %s", video_url)
+            listed += 1
+        if not listed:
+            logger.info("Everything is already summarized")
+        return
+
+    total, failed = _summarize_batch(base_config, video_urls, args.jobs)
+    if not total:
+        logger.info("Everything is already summarized")
+        return
+    if failed:
+        logger.error("%d of %d videos failed to sync", failed, total)
+        raise SyncError(f"{failed} of {total} videos failed to sync")
+    logger.info("Synced %d new videos", total)
@@ -0,0 +1,328 @@
+"""Sweeps local transcription settings to find the best speed/quality trade-off.
+
+This module implements the 'tune' command. Given a reference audio file and
+its known text, it accelerates the audio for every speed factor, transcribes
+each version with every combination of Whisper model, beam size and compute
+type, and scores each trial by word error rate (WER) and real-time factor
+(RTF, the transcription time divided by the original audio duration).
+
+Trials run in parallel worker processes that split the CPU threads between
+them, so their timings stay comparable. The fastest setting on the Pareto
+front whose WER is within a tolerance of the best one is saved as the default
+configuration.
+
+Functions:
+    pareto_front: Filters trials down to the non-dominated ones.
+    choose_setting: Picks the fastest setting of acceptable quality.
+    handle_tune_command: Runs the sweep and saves the chosen setting.
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from content_summarizer.managers.config_manager import ConfigManager
+from content_summarizer.managers.path_manager import PathManager
+from content_summarizer.processors.audio_processor import AudioProcessor, probe_duration
+from content_summarizer.services.transcription_service import (
+    fetch_transcription_local,
+    preload_whisper_model,
+)
+from content_summarizer.utils.wer import word_error_rate
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TuningError(Exception):
+    """Custom exception for errors while tuning the transcription settings."""
+
+
+@dataclass
+class TuningTrial:
+    """The settings and scores of one transcription trial.
+
+    Attributes:
+        whisper_model: The name of the Whisper model.
+        beam_size: The beam size used for decoding.
+        speed_factor: The audio acceleration factor.
+        compute_type: The CTranslate2 quantization.
+        wer: The word error rate against the reference text.
+        rtf: The transcription time divided by the original audio duration.
+        load_seconds: The time it took to load the model in its worker.
+        error: The failure message, or None if the trial succeeded.
+
+    """
+
+    whisper_model: str
+    beam_size: int
+    speed_factor: float
+    compute_type: str
+    wer: float = float("nan")
+    rtf: float = float("nan")
+    load_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the trial produced a score."""
+        return self.error is None
+
+
+def _init_worker() -> None:
+    """Drop the inherited log handlers, whose listener thread was not forked."""
+    root_logger: logging.Logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(logging.NullHandler())
+
+
+def _run_trial(
+    trial: TuningTrial,
+    audio_path: Path,
+    reference: str,
+    audio_seconds: float,
+    device: str,
+    cpu_threads: int,
+) -> TuningTrial:
+    """Transcribe the prepared audio with one setting and score it.
+
+    This runs in a worker process. The model is loaded before the clock
+    starts, so the real-time factor only measures decoding.
+    """
+    try:
+        load_started: float = time.perf_counter()
+        preload_whisper_model(
+            trial.whisper_model, device, trial.compute_type, cpu_threads
+        )
+        trial.load_seconds = round(time.perf_counter() - load_started, 3)
+
+        started: float = time.perf_counter()
+        transcript = fetch_transcription_local(
+            audio_path,
+            trial.whisper_model,
+            trial.beam_size,
+            device,
+            trial.compute_type,
+            cpu_threads,
+        )
+        trial.rtf = round((time.perf_counter() - started) / audio_seconds, 4)
+        trial.wer = round(word_error_rate(reference, transcript.to_text()), 4)
+    except Exception as e:
+        trial.error = str(e) or type(e).__name__
+    return trial
+
+
+def pareto_front(trials: list[TuningTrial]) -> list[TuningTrial]:
+    """Filter trials down to those no other trial beats on both WER and RTF.
+
+    Args:
+        trials: The successful trials.
+
+    Returns:
+        The non-dominated trials, from fastest to most accurate.
+
+    """
+    front: list[TuningTrial] = []
+    best_wer: float = float("inf")
+    for trial in sorted(trials, key=lambda t: (t.rtf, t.wer)):
+        if trial.wer < best_wer:
+            front.append(trial)
+            best_wer = trial.wer
+    return front
+
+
+def choose_setting(front: list[TuningTrial], wer_tolerance: float) -> TuningTrial:
+    """Pick the fastest setting whose WER is close enough to the best one.
+
+    Args:
+        front: The Pareto front, as returned by pareto_front().
+        wer_tolerance: How much WER, in absolute terms, may be traded for speed.
+
+    Returns:
+        The chosen trial.
+
+    """
+    best_wer: float = min(trial.wer for trial in front)
+    return next(trial for trial in front if trial.wer <= best_wer + wer_tolerance)
+
+
+def _prepare_audio(
+    audio_path: Path, work_dir: Path, speed_factors: list[float], jobs: int
+) -> dict[float, Path]:
+    """Accelerate the reference audio once per speed factor, in parallel."""
+    prepared: dict[float, Path] = {
+        speed_factor: work_dir / f"audio-{speed_factor}x{audio_path.suffix}"
+        for speed_factor in speed_factors
+    }
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures: list[Future[None]] = [
+            executor.submit(
+                AudioProcessor(audio_path, output_path).accelerate_audio, speed_factor
+            )
+            for speed_factor, output_path in prepared.items()
+        ]
+        for future in futures:
+            future.result()
+    return prepared
+
+
+def _run_sweep(
+    args: argparse.Namespace, reference: str, audio_seconds: float, jobs: int
+) -> list[TuningTrial]:
+    """Run every trial of the sweep in a pool of worker processes."""
+    cpu_threads: int = max(1, (os.cpu_count() or 1) // jobs)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        prepared: dict[float, Path] = _prepare_audio(
+            args.audio, Path(temp_dir), args.speed_factors, jobs
+        )
+        # Trials sharing a model are submitted together, so each worker mostly
+        # reuses the model it already has in memory.
+        trials: list[TuningTrial] = [
+            TuningTrial(model, beam_size, speed_factor, compute_type)
+            for model, compute_type, beam_size, speed_factor in itertools.product(
+                args.whisper_models,
+                args.compute_types,
+                args.beam_sizes,
+                args.speed_factors,
+            )
+        ]
+        logger.info(
+            "Running %d trials in %d workers with %d threads each",
+            len(trials),
+            jobs,
+            cpu_threads,
+        )
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker
+        ) as executor:
+            futures: list[Future[TuningTrial]] = [
+                executor.submit(
+                    _run_trial,
+                    trial,
+                    prepared[trial.speed_factor],
+                    reference,
+                    audio_seconds,
+                    args.device,
+                    cpu_threads,
+                )
+                for trial in trials
+            ]
+            return [future.result() for future in futures]
+
+
+def _print_trials(
+    trials: list[TuningTrial], front: list[TuningTrial], chosen: TuningTrial
+) -> None:
+    """Render the sweep results as a table, fastest first."""
+    from rich.console import Console
+    from rich.table import Table
+
+    table: Table = Table(title="Transcription settings")
+    for column in ("Model", "Compute", "Beam", "Speed", "WER", "RTF", ""):
+        table.add_column(column, justify="left" if column == "Model" else "right")
+    for trial in sorted(trials, key=lambda t: (not t.ok, t.rtf)):
+        marker: str = ""
+        if trial is chosen:
+            marker = "chosen"
+        elif any(trial is point for point in front):
+            marker = "pareto"
+        table.add_row(
+            trial.whisper_model,
+            trial.compute_type,
+            str(trial.beam_size),
+            f"{trial.speed_factor}x",
+            f"{trial.wer:.2%}" if trial.ok else "-",
+            f"{trial.rtf:.3f}" if trial.ok else "-",
+            marker if trial.ok else f"failed: {trial.error}",
+            style="bold green" if trial is chosen else None,
+        )
+    Console().print(table)
+
+
+def _save_setting(chosen: TuningTrial, device: str, path_manager: PathManager) -> None:
+    """Store the chosen setting as the default configuration."""
+    config_manager: ConfigManager = ConfigManager(path_manager.config_file_path)
+    current_configs: dict[str, Any] = config_manager.load_config(is_config=True)
+    current_configs.update(
+        {
+            "whisper_model": chosen.whisper_model,
+            "beam_size": chosen.beam_size,
+            "speed_factor": chosen.speed_factor,
+            "compute_type": chosen.compute_type,
+            "device": device,
+        }
+    )
+    config_manager.save_config(current_configs)
+
+
+def handle_tune_command(
+    args: argparse.Namespace, logger: logging.Logger, path_manager: PathManager
+) -> None:
+    """Sweep the transcription settings and save the best trade-off.
+
+    Args:
+        args: The parsed command-line arguments from the user.
+        logger: The application's configured logger.
+        path_manager: The application's path manager.
+
+    Raises:
+        TuningError: If the inputs are invalid or every trial failed.
+        OSError: If the reference or the configuration file cannot be accessed.
+
+    """
+    reference: str = args.reference.read_text(encoding="utf-8")
+    if not reference.split():
+        logger.error("The reference text is empty")
+        raise TuningError("The reference text is empty")
+
+    audio_seconds: float = probe_duration(args.audio)
+    jobs: int = args.jobs or min(2, os.cpu_count() or 1)
+    trials: list[TuningTrial] = _run_sweep(args, reference, audio_seconds, jobs)
+
+    for trial in trials:
+        if not trial.ok:
+            logger.warning("Trial %s failed: %s", asdict(trial), trial.error)
+    if args.json:
+        with args.json.open("w", encoding="utf-8") as f:
+            json.dump([asdict(trial) for trial in trials], f, indent=4)
+
+    successful: list[TuningTrial] = [trial for trial in trials if trial.ok]
+    if not successful:
+        logger.error("Every tuning trial failed")
+        raise TuningError("Every tuning trial failed")
+
+    front: list[TuningTrial] = pareto_front(successful)
+    chosen: TuningTrial = choose_setting(front, args.wer_tolerance)
+    _print_trials(trials, front, chosen)
+
+    if args.dry_run:
+        logger.info("Dry run, configuration left unchanged")
+        return
+    _save_setting(chosen, args.device, path_manager)
+    logger.info(
+        "Saved whisper_model=%s, compute_type=%s, beam_size=%d, speed_factor=%s",
+        chosen.whisper_model,
+        chosen.compute_type,
+        chosen.beam_size,
+        chosen.speed_factor,
+    )
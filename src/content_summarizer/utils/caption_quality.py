@@ -0,0 +1,157 @@
+"""Estimates whether auto-generated captions are good enough to summarize.
+
+YouTube's automatic captions are usually as good as a local Whisper run, but
+some are not: captions of music or silence, speech recognition stuck in a
+loop, or a track recognized in the wrong language. The checks below catch
+those cases from the caption alone, in linear time over its text, so a bad
+track costs a caption download instead of a summary of garbage.
+
+Functions:
+    check_auto_caption: Finds the first quality check a caption fails.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import re
+import unicodedata
+
+from content_summarizer.data.data_models import Transcript
+from content_summarizer.utils.wer import normalize_words
+
+# The share of the video that speech cues must cover. Intros, music and
+# pauses without captions are common, so this is well below 1.
+_MIN_COVERAGE: float = 0.5
+
+# The share of distinct word trigrams. Natural speech rarely repeats three
+# words in a row, while recognition loops repeat the same phrase for minutes.
+_MIN_DISTINCT_TRIGRAMS: float = 0.5
+
+# The share of letters that must be written in the script of the caption's
+# language, and how many letters are sampled for it.
+_MIN_SCRIPT_SHARE: float = 0.8
+_SCRIPT_SAMPLE_LETTERS: int = 20000
+
+# Unicode script names of languages not written in the Latin script.
+_LANGUAGE_SCRIPTS: dict[str, tuple[str, ...]] = {
+    "ar": ("ARABIC",),
+    "be": ("CYRILLIC",),
+    "bg": ("CYRILLIC",),
+    "bn": ("BENGALI",),
+    "el": ("GREEK",),
+    "fa": ("ARABIC",),
+    "he": ("HEBREW",),
+    "hi": ("DEVANAGARI",),
+    "iw": ("HEBREW",),
+    "ja": ("CJK", "HIRAGANA", "KATAKANA"),
+    "kk": ("CYRILLIC",),
+    "ko": ("HANGUL",),
+    "mr": ("DEVANAGARI",),
+    "ne": ("DEVANAGARI",),
+    "ru": ("CYRILLIC",),
+    "ta": ("TAMIL",),
+    "th": ("THAI",),
+    "uk": ("CYRILLIC",),
+    "ur": ("ARABIC",),
+    "zh": ("CJK",),
+}
+
+# Cues such as '[Music]' or '[Applause]' describe sound, not speech.
+_SOUND_ANNOTATION_PATTERN = re.compile(r"^\s*(?:\[[^\]]*\]\s*)+$")
+
+
+def _speech_coverage(transcript: Transcript, duration: float) -> float:
+    """Compute the share of the video covered by cues with speech."""
+    covered: float = 0.0
+    covered_until: float = 0.0
+    cues = sorted(
+        (start, end)
+        for start, end, text in zip(
+            transcript.start, transcript.end, transcript.text, strict=True
+        )
+        if text.strip() and not _SOUND_ANNOTATION_PATTERN.match(text)
+    )
+    # Cues may overlap, so only the time past the previous cues is counted.
+    for start, end in cues:
+        if end > covered_until:
+            covered += end - max(start, covered_until)
+            covered_until = end
+    return min(covered / duration, 1.0)
+
+
+def _distinct_trigram_share(words: list[str]) -> float:
+    """Compute the share of distinct trigrams among the word trigrams."""
+    trigrams = list(zip(words, words[1:], words[2:], strict=False))
+    if not trigrams:
+        return 1.0
+    return len(set(trigrams)) / len(trigrams)
+
+
+def _script_share(text: str, language: str) -> float:
+    """Compute the share of sampled letters in the script of a language."""
+    scripts: tuple[str, ...] = _LANGUAGE_SCRIPTS.get(
+        language.split("-")[0].lower(), ("LATIN",)
+    )
+    letters: list[str] = list(
+        itertools.islice(
+            (char for char in text if char.isalpha()), _SCRIPT_SAMPLE_LETTERS
+        )
+    )
+    if not letters:
+        return 1.0
+    matching: int = sum(
+        unicodedata.name(char, "").startswith(scripts) for char in letters
+    )
+    return matching / len(letters)
+
+
+def check_auto_caption(transcript: Transcript, duration: float) -> str | None:
+    """Find the first quality check an auto-generated caption fails.
+
+    The caption must cover enough of the video with speech, must not repeat
+    itself like a recognition loop, and its text must be written in the
+    script of its language.
+
+    Args:
+        transcript: The timed caption, with its language code.
+        duration: The length of the video in seconds, or 0 if unknown, which
+            skips the coverage check.
+
+    Returns:
+        A description of the failed check, or None if the caption passes.
+
+    """
+    text: str = transcript.to_text()
+    words: list[str] = normalize_words(text)
+    if not words:
+        return "the caption has no words"
+
+    if duration > 0:
+        coverage: float = _speech_coverage(transcript, duration)
+        if coverage < _MIN_COVERAGE:
+            return f"speech covers only {coverage:.0%} of the video"
+
+    distinct_share: float = _distinct_trigram_share(words)
+    if distinct_share < _MIN_DISTINCT_TRIGRAMS:
+        return f"only {distinct_share:.0%} of its phrases are distinct"
+
+    if transcript.language:
+        script_share: float = _script_share(text, transcript.language)
+        if script_share < _MIN_SCRIPT_SHARE:
+            return (
+                f"only {script_share:.0%} of its letters match the caption "
+                f"language '{transcript.language}'"
+            )
+    return None
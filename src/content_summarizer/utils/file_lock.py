@@ -0,0 +1,159 @@
+"""Provides advisory file locks shared between processes.
+
+This module wraps the platform's file locking primitive: flock() on POSIX
+systems, which supports shared and exclusive locks, and msvcrt.locking() on
+Windows, where every lock is exclusive. Locks are tied to an open file, so
+they are released by the operating system if the holder crashes.
+
+Classes:
+    FileLockTimeoutError: Raised when a lock is not acquired in time.
+    FileLock: A shared or exclusive lock on a lock file.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Self
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+_POLL_INTERVAL_SECONDS: float = 0.1
+
+
+class FileLockTimeoutError(TimeoutError):
+    """Raised when a lock is not acquired within the given timeout."""
+
+
+class FileLock:
+    """A shared or exclusive advisory lock on a lock file.
+
+    The lock file is created if needed and never deleted, so every process
+    always locks the same file.
+
+    Attributes:
+        _lock_path: The path to the lock file.
+        _shared: Whether the lock is shared (exclusive on Windows).
+        _file: The open lock file while the lock is held.
+
+    """
+
+    def __init__(self, lock_path: Path, shared: bool = False) -> None:
+        """Initialize the FileLock.
+
+        Args:
+            lock_path: The path to the lock file.
+            shared: Whether several holders may hold the lock at once. Windows
+                only has exclusive locks, so shared locks are exclusive there.
+
+        """
+        self._lock_path = lock_path
+        self._shared = shared
+        self._file: IO[bytes] | None = None
+
+    def _try_lock(self, file: IO[bytes]) -> bool:
+        if fcntl is not None:
+            operation: int = fcntl.LOCK_SH if self._shared else fcntl.LOCK_EX
+            try:
+                fcntl.flock(file.fileno(), operation | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            return True
+        try:
+            # Windows locks a byte range starting at the current position.
+            file.seek(0, os.SEEK_SET)
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def acquire(self, blocking: bool = True, timeout: float | None = None) -> bool:
+        """Acquire the lock.
+
+        Args:
+            blocking: Whether to wait for the lock to become available.
+            timeout: The maximum number of seconds to wait, or None to wait
+                indefinitely. Ignored when not blocking.
+
+        Returns:
+            True if the lock was acquired, False if it was not available and
+            blocking was False.
+
+        Raises:
+            FileLockTimeoutError: If the timeout expired.
+            RuntimeError: If this lock is already held.
+            OSError: If the lock file cannot be opened.
+
+        """
+        if self._file is not None:
+            raise RuntimeError("The lock is already held")
+        self._lock_path.parent.mkdir(parents=True, exist_ok=True)
+        file: IO[bytes]
+        try:
+            file = self._lock_path.open("a+b")
+        except PermissionError:
+            # Lock files in a shared cache may belong to another user, and a
+            # read-only handle is enough to lock them.
+            file = self._lock_path.open("rb")
+        deadline: float | None = (
+            time.monotonic() + timeout if timeout is not None else None
+        )
+        try:
+            while not self._try_lock(file):
+                if not blocking:
+                    file.close()
+                    return False
+                if deadline is not None and time.monotonic() >= deadline:
+                    file.close()
+                    msg = f"Timed out waiting for {self._lock_path}"
+                    raise FileLockTimeoutError(msg)
+                time.sleep(_POLL_INTERVAL_SECONDS)
+        except BaseException:
+            file.close()
+            raise
+        self._file = file
+        return True
+
+    def release(self) -> None:
+        """Release the lock, if held."""
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0, os.SEEK_SET)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> Self:
+        """Acquire the lock, waiting as long as necessary."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the lock."""
+        self.release()
@@ -0,0 +1,36 @@
+"""Provides content hashing shared by the caches and the services.
+
+Functions:
+    hash_file: Compute the SHA-256 hex digest of a file.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+from pathlib import Path
+
+
+def hash_file(file_path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file without loading it whole.
+
+    Args:
+        file_path: The file to hash.
+
+    Returns:
+        The hex digest of the file's content.
+
+    """
+    with file_path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -2,14 +2,21 @@
 
 This module is responsible for setting up the root logger to send logs
 to two distinct destinations: a user-friendly, colorized terminal output
-that suppresses stack traces, and a detailed file output that includes
+that suppresses stack traces, and a rotating JSON-lines file that includes
 full tracebacks for debugging purposes.
 
+Records are only put on an in-memory queue by the thread that logs them. A
+background listener thread formats and writes them, so terminal and disk I/O
+never block the pipeline. Each record carries the correlation fields bound
+with log_context() in the thread or task that emitted it (e.g., the video ID).
+
 Classes:
     CustomTerminalFormatter: A custom formatter for clean, user-friendly
                              terminal output that suppresses tracebacks.
+    JsonLinesFormatter: Formats records as one JSON object per line.
 
 Functions:
+    log_context: Binds correlation fields to the records logged in a block.
     setup_logging: Configures the root logger with the dual-handler setup.
 
 """
@@ -27,12 +34,49 @@ Functions:
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import colorlog
 
+LOG_FILE_MAX_BYTES: int = 5 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT: int = 3
+
+_log_context: ContextVar[Mapping[str, str]] = ContextVar(
+    "log_context", default=MappingProxyType({})
+)
+_listener: QueueListener | None = None
+
+
+@contextmanager
+def log_context(**fields: str) -> Iterator[None]:
+    """Bind correlation fields to every record logged inside the block.
+
+    Fields are scoped to the current thread (or asyncio task) and nest, so
+    concurrent daemon requests or worker threads never mix their IDs.
+
+    Args:
+        **fields: The fields to attach, e.g., video_id='dQw4w9WgXcQ'.
+
+    """
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
 
 class CustomTerminalFormatter(colorlog.ColoredFormatter):
     """Custom log formatter for clean terminal output.
@@ -65,10 +109,9 @@ class CustomTerminalFormatter(colorlog.ColoredFormatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record, suppressing console stack traces.
 
-        This method temporarily removes exception info from the record before
-        formatting, ensuring no traceback is printed to the console handler.
-        The exception info is restored afterward, allowing other handlers (like
-        a file handler) to still log the full traceback.
+        The record is formatted through a copy without exception info, so no
+        traceback is printed to the console while the record itself stays
+        untouched for other handlers (like the file handler).
 
         Args:
             record: The log record to be formatted.
@@ -77,29 +120,91 @@ class CustomTerminalFormatter(colorlog.ColoredFormatter):
             The formatted string for the console.
 
         """
-        original_exc_info = record.exc_info
-        original_exc_text = record.exc_text
+        clean_record: logging.LogRecord = copy.copy(record)
+        clean_record.exc_info = None
+        clean_record.exc_text = None
+        clean_record.stack_info = None
+
+        if clean_record.levelno == logging.INFO:
+            return self.info_formatter.format(clean_record)
+        return super().format(clean_record)
 
-        record.exc_info = None
-        record.exc_text = None
 
-        try:
-            if record.levelno == logging.INFO:
-                return self.info_formatter.format(record)
-            return super().format(record)
-        finally:
-            record.exc_info = original_exc_info
-            record.exc_text = original_exc_text
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    Every object holds the timestamp, level, logger name, source line and
+    message, the correlation fields bound with log_context(), and the
+    traceback when there is one. The record is never modified.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the log record as a single line of JSON.
+
+        Args:
+            record: The log record to be formatted.
+
+        Returns:
+            The JSON object, without a trailing newline.
+
+        """
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "line": f"{record.module}:{record.lineno}",
+            "message": record.getMessage(),
+            **getattr(record, "context", {}),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _ContextQueueHandler(QueueHandler):
+    """Queues records with their correlation fields for the listener thread.
+
+    The stock QueueHandler formats the record in the logging thread and then
+    drops its exception info. This one only resolves the message arguments
+    and renders the traceback, so the listener's handlers still format the
+    record their own way.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared: logging.LogRecord = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info and not record.exc_text:
+            prepared.exc_text = logging.Formatter().formatException(record.exc_info)
+        prepared.exc_info = None
+        prepared.context = _log_context.get()
+        return prepared
+
+
+def _stop_listener() -> None:
+    """Flush the queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logging(log_file_path: Path, quiet_level: int) -> None:
     """Configure the root logger for dual-handler output.
 
-    This function clears any existing handlers and sets up two new ones:
+    This function clears any existing handlers and sets up two new ones,
+    both fed by a queue listener running in a background thread:
     - A console handler with a custom formatter for clean, user-facing logs.
-    - A file handler that logs detailed information for debugging.
+    - A rotating file handler that logs JSON lines for debugging.
 
     The verbosity of the console handler is controlled by the quiet_level.
+    Queued records are flushed when the interpreter exits.
 
     Args:
         log_file_path: The destination path for the detailed log file.
@@ -112,6 +217,7 @@ def setup_logging(log_file_path: Path, quiet_level: int) -> None:
 
     if logger.hasHandlers():
         logger.handlers.clear()
+    _stop_listener()
 
     console_handler = colorlog.StreamHandler(sys.stderr)
     console_handler.setLevel(logging.INFO)
@@ -122,14 +228,23 @@ def setup_logging(log_file_path: Path, quiet_level: int) -> None:
     console_handler.setFormatter(CustomTerminalFormatter())
 
     log_file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_handler = logging.FileHandler(log_file_path, mode="a", encoding="utf-8")
+    file_handler = RotatingFileHandler(
+        log_file_path,
+        maxBytes=LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUP_COUNT,
+        encoding="utf-8",
+    )
 
     file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(JsonLinesFormatter())
 
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - [%(name)s:%(lineno)d] - %(message)s"
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    global _listener
+    _listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
     )
-    file_handler.setFormatter(file_formatter)
+    _listener.start()
+    atexit.unregister(_stop_listener)
+    atexit.register(_stop_listener)
 
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(_ContextQueueHandler(log_queue))
@@ -0,0 +1,163 @@
+"""Records per-stage timing and resource usage of a pipeline run.
+
+This module provides a lightweight recorder whose spans measure wall time,
+CPU time of the process and of its child processes (e.g., FFmpeg), and the
+peak resident memory reached so far. Stages can attach counters such as
+downloaded bytes or tokens sent, and the whole run can be written as JSON.
+
+Classes:
+    StageMetrics: The measurements of a single pipeline stage.
+    MetricsRecorder: Collects stage spans and serializes them.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+def _children_cpu_seconds() -> float:
+    """Get the CPU time used by terminated child processes, if measurable."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _peak_rss_bytes() -> int | None:
+    """Get the peak resident set size of the process, if measurable."""
+    if resource is None:
+        return None
+    max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+@dataclass
+class StageMetrics:
+    """The measurements of a single pipeline stage.
+
+    Attributes:
+        name: The stage name (e.g., 'download', 'transcription').
+        wall_seconds: The elapsed wall-clock time.
+        cpu_seconds: The CPU time used by this process.
+        child_cpu_seconds: The CPU time used by child processes that finished.
+        peak_rss_bytes: The process peak resident memory at the end of the
+            stage, or None if the platform does not report it.
+        counters: Stage-specific counters (e.g., 'bytes_downloaded').
+        ok: Whether the stage completed without raising.
+
+    """
+
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    child_cpu_seconds: float = 0.0
+    peak_rss_bytes: int | None = None
+    counters: dict[str, float] = field(default_factory=dict)
+    ok: bool = True
+
+    def add(self, counter: str, value: float) -> None:
+        """Increment a stage counter.
+
+        Args:
+            counter: The counter name.
+            value: The amount to add.
+
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+
+class MetricsRecorder:
+    """Collects stage spans for one pipeline run.
+
+    Recording is cheap enough to stay enabled even when no report is written.
+
+    Attributes:
+        stages: The recorded stages, in completion order.
+        attributes: Run-level attributes included in the report.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize the MetricsRecorder."""
+        self.stages: list[StageMetrics] = []
+        self.attributes: dict[str, Any] = {}
+        self._started_wall: float = time.perf_counter()
+        self._started_cpu: float = time.process_time()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[StageMetrics]:
+        """Measure a pipeline stage.
+
+        Args:
+            name: The stage name.
+
+        Yields:
+            The stage being measured, so counters can be attached to it.
+
+        """
+        stage = StageMetrics(name)
+        wall_start: float = time.perf_counter()
+        cpu_start: float = time.process_time()
+        child_cpu_start: float = _children_cpu_seconds()
+        try:
+            yield stage
+        except BaseException:
+            stage.ok = False
+            raise
+        finally:
+            stage.wall_seconds = round(time.perf_counter() - wall_start, 6)
+            stage.cpu_seconds = round(time.process_time() - cpu_start, 6)
+            stage.child_cpu_seconds = round(
+                _children_cpu_seconds() - child_cpu_start, 6
+            )
+            stage.peak_rss_bytes = _peak_rss_bytes()
+            self.stages.append(stage)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the run into a JSON-compatible dictionary."""
+        return {
+            **self.attributes,
+            "wall_seconds": round(time.perf_counter() - self._started_wall, 6),
+            "cpu_seconds": round(time.process_time() - self._started_cpu, 6),
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "stages": [asdict(stage) for stage in self.stages],
+        }
+
+    def write_json(self, output_path: Path) -> None:
+        """Write the run report as JSON.
+
+        Args:
+            output_path: The destination file path.
+
+        Raises:
+            OSError: If the file cannot be written.
+
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=4)
@@ -0,0 +1,86 @@
+"""Estimates the cost of Gemini requests from the tokens they consumed.
+
+Prices are the public list prices of the Gemini API, in US dollars per
+million tokens, for prompts up to 200,000 tokens. They change over time and
+do not include free tiers, discounts or the hourly storage of context
+caches, so costs are estimates meant for budgeting and for comparing videos,
+not invoices. Each cost is estimated when it is recorded, so later price
+changes do not rewrite the past.
+
+Functions:
+    estimate_gemini_cost: Estimates the cost of a Gemini request.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from dataclasses import dataclass
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_TOKENS_PER_PRICE_UNIT: int = 1_000_000
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """The price of a Gemini model, in US dollars per million tokens.
+
+    Attributes:
+        input: The price of prompt tokens sent with the request.
+        cached_input: The price of prompt tokens read from a context cache.
+        output: The price of generated tokens, thinking included.
+
+    """
+
+    input: float
+    cached_input: float
+    output: float
+
+
+# Keyed by the model names of the command line.
+GEMINI_PRICES: dict[str, ModelPrice] = {
+    "1.0-pro": ModelPrice(input=0.50, cached_input=0.50, output=1.50),
+    "1.5-flash": ModelPrice(input=0.075, cached_input=0.01875, output=0.30),
+    "1.5-pro": ModelPrice(input=1.25, cached_input=0.3125, output=5.00),
+    "2.5-flash": ModelPrice(input=0.30, cached_input=0.075, output=2.50),
+    "2.5-pro": ModelPrice(input=1.25, cached_input=0.31, output=10.00),
+}
+
+
+def estimate_gemini_cost(
+    model_name: str, input_tokens: int, cached_tokens: int, output_tokens: int
+) -> float:
+    """Estimate the cost of a Gemini request in US dollars.
+
+    Args:
+        model_name: The model name, as given on the command line.
+        input_tokens: The prompt tokens, including the cached ones.
+        cached_tokens: The prompt tokens read from a context cache.
+        output_tokens: The generated tokens, thinking included.
+
+    Returns:
+        The estimated cost, or 0 for a model without a known price.
+
+    """
+    price: ModelPrice | None = GEMINI_PRICES.get(model_name)
+    if price is None:
+        logger.warning("No known price for the model %s", model_name)
+        return 0.0
+    uncached_tokens: int = max(input_tokens - cached_tokens, 0)
+    return (
+        uncached_tokens * price.input
+        + cached_tokens * price.cached_input
+        + output_tokens * price.output
+    ) / _TOKENS_PER_PRICE_UNIT
@@ -0,0 +1,80 @@
+"""Computes the word error rate of a transcription against a reference.
+
+Both texts are normalized before comparison: case is folded and punctuation
+is dropped, so only the recognized words are scored.
+
+Functions:
+    normalize_words: Splits a text into normalized words.
+    word_error_rate: Computes the word error rate of a hypothesis.
+
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+
+_WORD_PATTERN = re.compile(r"\w+(?:'\w+)*")
+
+
+def normalize_words(text: str) -> list[str]:
+    """Split a text into case-folded words, dropping punctuation.
+
+    Args:
+        text: The text to split.
+
+    Returns:
+        The normalized words, in order.
+
+    """
+    return _WORD_PATTERN.findall(text.casefold())
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Compute the word error rate of a hypothesis against a reference.
+
+    The rate is the word-level edit distance (substitutions, deletions and
+    insertions) divided by the number of reference words. It uses memory
+    proportional to the hypothesis length and time proportional to the
+    product of both lengths, which suits reference clips of a few minutes.
+
+    Args:
+        reference: The known-correct text.
+        hypothesis: The transcribed text.
+
+    Returns:
+        The word error rate, 0.0 for a perfect match. It can exceed 1.0 when
+        the hypothesis has many insertions.
+
+    Raises:
+        ValueError: If the reference has no words.
+
+    """
+    ref_words: list[str] = normalize_words(reference)
+    hyp_words: list[str] = normalize_words(hypothesis)
+    if not ref_words:
+        raise ValueError("The reference text has no words")
+
+    previous: list[int] = list(range(len(hyp_words) + 1))
+    for i, ref_word in enumerate(ref_words, start=1):
+        current: list[int] = [i]
+        for j, hyp_word in enumerate(hyp_words, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (ref_word != hyp_word),
+                )
+            )
+        previous = current
+    return previous[-1] / len(ref_words)
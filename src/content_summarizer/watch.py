@@ -0,0 +1,251 @@
+"""Summarizes the media files that appear in a watched folder.
+
+This module implements the 'watch' command. It polls a folder for audio and
+video files and summarizes each new file once it has stopped changing, so
+recordings that are still being written or copied are left alone until they
+are complete.
+
+Files are identified by the SHA-256 digest of their content, like the cache
+does, and files already summarized with the current settings are skipped,
+so restarting the watcher, or renaming or copying a recording, does not
+summarize it again. Summaries run in a bounded thread pool, and files found
+while every worker is busy wait for the next poll instead of piling up.
+
+Functions:
+    scan_media_files: Lists the media files of a folder and their state.
+    handle_watch_command: Summarizes new media files as they appear.
+"""
+# Copyright 2025 Gabriel Carvalho
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import contextlib
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from content_summarizer.core import (
+    AppConfig,
+    SetupError,
+    build_app_config,
+    copy_app_config,
+    find_summarized_video_ids,
+    run_pipeline,
+)
+from content_summarizer.managers.path_manager import PathManager
+from content_summarizer.services.local_file_service import (
+    MEDIA_SUFFIXES,
+    LocalFileService,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+FileState = tuple[int, int]
+
+
+class WatchError(Exception):
+    """Custom exception for files that failed to be summarized."""
+
+
+def scan_media_files(directory: Path, recursive: bool) -> dict[Path, FileState]:
+    """List the media files of a folder with their size and modification time.
+
+    Hidden files, such as the temporary files of a copy in progress, are
+    skipped.
+
+    Args:
+        directory: The folder to scan.
+        recursive: Whether to scan subfolders too.
+
+    Returns:
+        The state of each media file, as (size, modification time in ns).
+
+    """
+    pattern: str = "**/*" if recursive else "*"
+    files: dict[Path, FileState] = {}
+    for file_path in directory.glob(pattern):
+        if file_path.name.startswith("."):
+            continue
+        if file_path.suffix.lower() not in MEDIA_SUFFIXES:
+            continue
+        # Files may disappear between listing and stat.
+        with contextlib.suppress(FileNotFoundError):
+            stat = file_path.stat()
+            if file_path.is_file():
+                files[file_path] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def _summarize_file(
+    base_config: AppConfig, file_path: Path, summarized_ids: set[str]
+) -> bool:
+    """Summarize a media file unless its content was already summarized.
+
+    Returns:
+        True if the file was summarized or skipped, False if it failed.
+
+    """
+    try:
+        video_service: LocalFileService = LocalFileService().load_from_url(
+            str(file_path)
+        )
+        if video_service.video_id in summarized_ids:
+            logger.info('"%s" is already summarized', file_path.name)
+            return True
+        run_pipeline(copy_app_config(base_config, str(file_path), video_service))
+    except Exception:
+        # The pipeline logs its own errors, a failed file must not stop the
+        # watch.
+        logger.error('Failed to summarize "%s"', file_path.name)
+        return False
+    summarized_ids.add(video_service.video_id)
+    return True
+
+
+class _MediaWatcher:
+    """Tracks the files of a folder and summarizes the new ones.
+
+    Attributes:
+        _base_config: The configuration every summary is copied from.
+        _args: The parsed command-line arguments from the user.
+        _summarized_ids: The IDs of the files summarized with the current
+            settings.
+        _seen: The state each file had at the previous poll.
+        _handled: The state each file had when it was summarized.
+        _running: The summaries in progress, by file.
+        _failed: The number of files that failed.
+
+    """
+
+    def __init__(
+        self, base_config: AppConfig, args: argparse.Namespace, summarized_ids: set[str]
+    ) -> None:
+        self._base_config = base_config
+        self._args = args
+        self._summarized_ids = summarized_ids
+        self._seen: dict[Path, FileState] = {}
+        self._handled: dict[Path, FileState] = {}
+        self._running: dict[Future[bool], Path] = {}
+        self._failed: int = 0
+
+    @property
+    def failed(self) -> int:
+        """Get the number of files that failed."""
+        return self._failed
+
+    @property
+    def busy(self) -> bool:
+        """Check whether any summary is in progress."""
+        return bool(self._running)
+
+    def collect(self, block: bool) -> None:
+        """Count the results of the summaries that finished.
+
+        Args:
+            block: Whether to wait for at least one summary to finish.
+
+        """
+        if not self._running:
+            return
+        done, _ = wait(
+            self._running, timeout=None if block else 0, return_when=FIRST_COMPLETED
+        )
+        for future in done:
+            del self._running[future]
+            if not future.result():
+                self._failed += 1
+
+    def poll(self, executor: ThreadPoolExecutor, wait_until_stable: bool) -> None:
+        """Submit the files that are new or changed and no longer being written.
+
+        Args:
+            executor: The pool summarizing the files.
+            wait_until_stable: Whether a file must keep the same size and
+                modification time for one poll before it is submitted.
+
+        """
+        self.collect(block=False)
+        files: dict[Path, FileState] = scan_media_files(
+            self._args.directory, self._args.recursive
+        )
+        busy: set[Path] = set(self._running.values())
+        for file_path, state in sorted(files.items()):
+            if self._handled.get(file_path) == state or file_path in busy:
+                continue
+            if wait_until_stable and self._seen.get(file_path) != state:
+                continue
+            if len(self._running) >= self._args.jobs:
+                break
+            self._handled[file_path] = state
+            future: Future[bool] = executor.submit(
+                _summarize_file, self._base_config, file_path, self._summarized_ids
+            )
+            self._running[future] = file_path
+        self._seen = files
+
+    def drain(self) -> None:
+        """Wait for every summary in progress to finish."""
+        while self._running:
+            self.collect(block=True)
+
+
+def handle_watch_command(
+    args: argparse.Namespace, logger: logging.Logger, path_manager: PathManager
+) -> None:
+    """Summarize the media files of a folder as they appear.
+
+    Args:
+        args: The parsed command-line arguments from the user.
+        logger: The application's configured logger.
+        path_manager: The application's path manager.
+
+    Raises:
+        SetupError: If the configuration cannot be built or the folder does
+            not exist.
+        WatchError: If any file failed to be summarized with '--once'.
+
+    """
+    if not args.directory.is_dir():
+        logger.error("Folder not found: %s", args.directory)
+        raise SetupError(f"Folder not found: {args.directory}")
+    try:
+        base_config: AppConfig = build_app_config(args, logger, path_manager)
+    except Exception as e:
+        logger.exception("An error occurred during the setup")
+        raise SetupError("An error occurred during the setup") from e
+
+    summarized_ids: set[str] = find_summarized_video_ids(base_config)
+    watcher = _MediaWatcher(base_config, args, summarized_ids)
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        if args.once:
+            # Every file present is submitted as soon as a worker is free.
+            watcher.poll(executor, wait_until_stable=False)
+            while watcher.busy:
+                watcher.collect(block=True)
+                watcher.poll(executor, wait_until_stable=False)
+            if watcher.failed:
+                logger.error("%d files failed to be summarized", watcher.failed)
+                raise WatchError(f"{watcher.failed} files failed to be summarized")
+            return
+
+        logger.info("Watching %s for new media files", args.directory)
+        try:
+            while True:
+                watcher.poll(executor, wait_until_stable=True)
+                time.sleep(args.interval)
+        except KeyboardInterrupt:
+            logger.info("Stopping, waiting for the summaries in progress")
+            watcher.drain()
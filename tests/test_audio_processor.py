@@ -0,0 +1,35 @@
+"""Tests for the FFmpeg commands built by the audio processor."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from content_summarizer.processors.audio_processor import AudioProcessor
+
+
+def _pair_after(command: list[str], flag: str) -> list[str]:
+    """Get a flag of a command with the value that follows it."""
+    index: int = command.index(flag)
+    return command[index : index + 2]
+
+
+def test_compress_audio_is_bitexact(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The Opus encode must be reproducible, so its SHA-256 can be deduplicated."""
+    input_path: Path = tmp_path / "audio.mp3"
+    input_path.write_bytes(b"audio")
+    output_path: Path = tmp_path / "audio.ogg"
+    commands: list[list[str]] = []
+
+    def fake_run(command: list[str], **_kwargs: object) -> None:
+        commands.append(command)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    AudioProcessor(input_path, output_path).compress_audio(1.5)
+
+    (command,) = commands
+    assert _pair_after(command, "-fflags") == ["-fflags", "+bitexact"]
+    assert _pair_after(command, "-flags:a") == ["-flags:a", "+bitexact"]
+    assert command[-1] == str(output_path)